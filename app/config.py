@@ -15,6 +15,10 @@ Environment Variables:
     EMBEDDING_MODEL: Sentence-transformers model name (default: jina-embeddings-v2-base-de)
     USE_TEI: Use TEI server for embeddings instead of local model (default: false)
     TEI_URL: TEI server URL (default: http://localhost:8011)
+    EMBEDDING_BATCH_SIZE: Texts per model forward pass / TEI request (default: backend default)
+    EMBEDDING_CACHE_PATH: SQLite file caching embeddings by content hash (default: disabled)
+    EMBEDDING_INT8_CPU: Dynamically quantize the local model to INT8 when running on CPU (default: false)
+    EMBEDDING_COMPILE: Compile the local model's transformer with torch.compile (default: false)
     RERANKER_URL: TEI reranker server URL (default: http://localhost:8020)
     LLM_PROVIDER: LLM provider - ollama, vllm, openai (default: ollama)
     LLM_MODEL: Model name for the provider (default: llama3.2)
@@ -97,6 +101,23 @@ class Settings(BaseSettings):
         default="http://localhost:8011",
         description="TEI server URL for HTTP-based embeddings.",
     )
+    embedding_batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Texts per model forward pass (local) or per TEI request. None uses the backend default (device-dependent locally, 64 for TEI).",
+    )
+    embedding_cache_path: str | None = Field(
+        default=None,
+        description="SQLite file caching embeddings by sha256(model, text). Identical texts are only embedded once across runs. Disabled when unset.",
+    )
+    embedding_int8_cpu: bool = Field(
+        default=False,
+        description="Dynamically quantize the local embedding model's linear layers to INT8 when it runs on CPU. Faster CPU inference at a small accuracy cost; ignored on GPU.",
+    )
+    embedding_compile: bool = Field(
+        default=False,
+        description="Compile the local embedding model's transformer with torch.compile (dynamic shapes). Fuses kernels and removes per-op Python dispatch for long ingestion runs, at the cost of a one-off compile on first use.",
+    )
     reranker_url: str = Field(
         default="http://localhost:8020",
         description="TEI reranker server URL for two-stage retrieval.",
@@ -164,7 +185,9 @@ class Settings(BaseSettings):
         description="Langfuse host URL.",
     )
 
-    @field_validator("sqlite_path", "chroma_persist_path", "ingest_root_path")
+    @field_validator(
+        "sqlite_path", "chroma_persist_path", "ingest_root_path", "embedding_cache_path"
+    )
     @classmethod
     def expand_path(cls, value: str | None) -> str | None:
         """Expand ~ in file paths."""
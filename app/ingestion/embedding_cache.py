@@ -0,0 +1,112 @@
+"""SQLite-backed embedding cache keyed by content hash.
+
+Re-ingesting the same norms (or re-running smoke tests on the same sample
+texts) re-embeds identical strings. This cache stores each embedding under
+``sha256(model_name, text)`` so repeated texts skip the transformer entirely.
+
+Design goals:
+- Exact-match only: a cache hit returns the vector the model produced before
+- Model-scoped keys, so switching ``EMBEDDING_MODEL`` never mixes vector spaces
+- Stdlib only (``sqlite3``), safe to share between threads of one process
+- Vectors stored as raw float32 bytes (no pickling)
+
+Usage:
+    >>> cache = EmbeddingCache("~/.local/share/legal-mcp/embeddings.db")
+    >>> keys = [cache.key("jinaai/jina-embeddings-v2-base-de", text) for text in texts]
+    >>> hits = cache.get_many(keys)
+    >>> cache.put_many({key: vector for key, vector in zip(keys, vectors)})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class EmbeddingCache:
+    """Persistent map from content hash to float32 embedding vector."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file; parent directories are created.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+            )
+
+    @staticmethod
+    def key(model_name: str, text: str) -> bytes:
+        """Cache key for ``text`` embedded by ``model_name``."""
+        digest = hashlib.sha256(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def get_many(self, keys: Sequence[bytes]) -> dict[bytes, np.ndarray]:
+        """Look up cached vectors.
+
+        Args:
+            keys: Keys from :meth:`key`.
+
+        Returns:
+            Mapping of the keys that were found to their float32 vectors.
+        """
+        found: dict[bytes, np.ndarray] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique_keys), _LOOKUP_CHUNK_SIZE):
+                chunk = unique_keys[start : start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # nosec B608 - placeholders only
+                    chunk,
+                )
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def put_many(self, vectors: Mapping[bytes, np.ndarray]) -> None:
+        """Store vectors, replacing existing entries with the same key."""
+        if not vectors:
+            return
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in vectors.items()
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+
+    def __len__(self) -> int:
+        """Number of cached vectors."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,168 @@
+"""Memory-mapped float16 (or int8) snapshot of stored embeddings for exact search.
+
+ChromaDB is the system of record for vectors, but scanning or re-scoring a
+whole collection through it means pulling every vector back as Python lists.
+An :class:`EmbeddingMatrix` is a read-only snapshot on disk instead:
+
+- ``embeddings.npy``: L2-normalized ``float16`` matrix of shape ``(N, dim)``
+- ``ids.json``: the document id of every row, in row order
+- ``scales.npy``: only for int8 snapshots (``save(..., quantize=True)``), the
+  ``float32`` scale of every row; row ``i`` is ``embeddings[i] * scales[i]``
+
+Loading memory-maps the matrix (``np.load(mmap_mode="r")``), so opening is
+instant, only touched pages are read, and several processes share the OS page
+cache. Cosine similarity is a single matrix product against the snapshot.
+Int8 rows halve the float16 footprint again and convert to float32 for the
+product faster than float16 does.
+
+Usage:
+    >>> store.export_embedding_matrix(Path("snapshots/german_laws"))
+    >>> matrix = EmbeddingMatrix.load(Path("snapshots/german_laws"))
+    >>> ids, scores = matrix.search(query_embeddings, n_results=10)[0]
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+EMBEDDINGS_FILENAME = "embeddings.npy"
+IDS_FILENAME = "ids.json"
+SCALES_FILENAME = "scales.npy"
+
+# Largest int8 magnitude; a row's max-abs component maps to it
+_INT8_MAX = 127
+
+# Rows scored per matrix product; bounds the float32 working copy
+_SEARCH_CHUNK_ROWS = 65536
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize each row as float32 (zero rows stay zero)."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0.0, 1.0, norms)
+
+
+def quantize_rows(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization.
+
+    Args:
+        matrix: ``(N, dim)`` float rows.
+
+    Returns:
+        ``(int8 rows, float32 scales)`` with ``rows * scales[:, None]``
+        approximating ``matrix`` (zero rows get scale 0).
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1, initial=0.0) / np.float32(_INT8_MAX)
+    rows = np.round(matrix / np.where(scales == 0.0, 1.0, scales)[:, None])
+    return rows.astype(np.int8), scales
+
+
+@dataclass(frozen=True)
+class EmbeddingMatrix:
+    """Row-aligned document ids and normalized float16 (or int8) embeddings.
+
+    Attributes:
+        ids: Document id of each row.
+        embeddings: ``(N, dim)`` float16 or int8 matrix, usually a read-only
+            memmap.
+        scales: Per-row float32 scales of an int8 snapshot, None for float16.
+    """
+
+    ids: list[str]
+    embeddings: np.ndarray
+    scales: np.ndarray | None = None
+
+    @classmethod
+    def save(
+        cls,
+        directory: Path,
+        ids: list[str],
+        embeddings: np.ndarray,
+        quantize: bool = False,
+    ) -> EmbeddingMatrix:
+        """Normalize and write a snapshot, then return it memory-mapped.
+
+        Args:
+            directory: Target directory (created if needed).
+            ids: Document ids, one per embedding row.
+            embeddings: ``(N, dim)`` embeddings in any float dtype.
+            quantize: Store int8 rows plus per-row scales instead of float16
+                (half the size; similarities shift by well under 0.01).
+
+        Returns:
+            The saved snapshot, loaded via :meth:`load`.
+
+        Raises:
+            ValueError: If ids and embedding rows differ in count.
+        """
+        if len(ids) != len(embeddings):
+            raise ValueError(f"Got {len(ids)} ids for {len(embeddings)} embedding rows")
+        directory.mkdir(parents=True, exist_ok=True)
+        normalized = normalize_rows(embeddings)
+        scales_path = directory / SCALES_FILENAME
+        if quantize:
+            rows, scales = quantize_rows(normalized)
+            np.save(directory / EMBEDDINGS_FILENAME, rows)
+            np.save(scales_path, scales)
+        else:
+            np.save(directory / EMBEDDINGS_FILENAME, normalized.astype(np.float16))
+            # A stale int8 scale file would be applied to the float16 rows
+            scales_path.unlink(missing_ok=True)
+        (directory / IDS_FILENAME).write_text(json.dumps(ids), encoding="utf-8")
+        return cls.load(directory)
+
+    @classmethod
+    def load(cls, directory: Path) -> EmbeddingMatrix:
+        """Memory-map a snapshot written by :meth:`save`."""
+        ids = json.loads((directory / IDS_FILENAME).read_text(encoding="utf-8"))
+        embeddings = np.load(directory / EMBEDDINGS_FILENAME, mmap_mode="r")
+        scales_path = directory / SCALES_FILENAME
+        scales = np.load(scales_path) if scales_path.exists() else None
+        return cls(ids=ids, embeddings=embeddings, scales=scales)
+
+    def __len__(self) -> int:
+        """Number of rows in the snapshot."""
+        return len(self.ids)
+
+    def search(
+        self, query_embeddings: np.ndarray, n_results: int = 10
+    ) -> list[tuple[list[str], np.ndarray]]:
+        """Exact cosine top-k for each query.
+
+        Args:
+            query_embeddings: ``(Q, dim)`` query vectors (or one ``(dim,)`` vector).
+            n_results: Results per query.
+
+        Returns:
+            One ``(ids, similarities)`` pair per query, best first.
+        """
+        queries = normalize_rows(np.atleast_2d(query_embeddings))
+        scores = np.empty((len(queries), len(self)), dtype=np.float32)
+        for start in range(0, len(self), _SEARCH_CHUNK_ROWS):
+            chunk = self.embeddings[start : start + _SEARCH_CHUNK_ROWS]
+            chunk_scores = queries @ chunk.astype(np.float32).T
+            if self.scales is not None:
+                # q . (row * scale) == (q . row) * scale, one column per row
+                chunk_scores *= self.scales[start : start + len(chunk)]
+            scores[:, start : start + len(chunk)] = chunk_scores
+
+        count = min(n_results, len(self))
+        if count == 0:
+            return [([], np.empty(0, dtype=np.float32)) for _ in queries]
+        top = np.argpartition(-scores, count - 1, axis=1)[:, :count]
+        results: list[tuple[list[str], np.ndarray]] = []
+        for row_scores, candidates in zip(scores, top, strict=True):
+            ordered = candidates[np.argsort(-row_scores[candidates], kind="stable")]
+            results.append(
+                ([self.ids[position] for position in ordered], row_scores[ordered])
+            )
+        return results
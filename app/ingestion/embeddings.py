@@ -7,6 +7,7 @@ Key features:
 - Automatic embedding generation using multilingual model
 - Metadata filtering for jurisdiction, law, and document level
 - Batch ingestion for large document sets
+- Optional content-hash embedding cache (EMBEDDING_CACHE_PATH)
 - Similarity search with configurable result count
 
 Usage:
@@ -18,18 +19,24 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from langchain_core.documents import Document
 
 from app.config import get_settings
+from app.ingestion.embedding_cache import EmbeddingCache
+from app.ingestion.embedding_matrix import EmbeddingMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +54,18 @@ DEFAULT_PERSIST_PATH = Path.home() / ".local" / "share" / "legal-mcp" / "chroma"
 # Collection name for German federal laws
 COLLECTION_NAME = "german_laws"
 
+# Default number of embedded documents per ChromaDB upsert
+DEFAULT_UPSERT_BATCH_SIZE = 5000
+
+
+def content_doc_id(content: str) -> str:
+    """Deterministic fallback doc_id for a document without one.
+
+    Unlike the builtin ``hash``, the digest does not change between
+    processes, so re-ingesting the same text upserts the same record.
+    """
+    return f"doc_{hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()}"
+
 
 @dataclass
 class SearchResult:
@@ -76,6 +95,8 @@ class GermanLawEmbeddingStore:
         model_name: Name of the sentence-transformers model to use
         persist_path: Path to ChromaDB persistence directory
         collection_name: Name of the ChromaDB collection
+        embedding_cache: Optional content-hash cache consulted before encoding
+            (defaults to one at ``EMBEDDING_CACHE_PATH`` when configured)
 
     Example:
         >>> store = GermanLawEmbeddingStore()
@@ -92,13 +113,18 @@ class GermanLawEmbeddingStore:
     model_name: str = DEFAULT_MODEL_NAME
     persist_path: Path = field(default_factory=lambda: DEFAULT_PERSIST_PATH)
     collection_name: str = COLLECTION_NAME
+    embedding_cache: EmbeddingCache | None = field(default=None, repr=False)
     _client: chromadb.PersistentClient | None = field(default=None, repr=False)
     _collection: chromadb.Collection | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        """Ensure persist path exists."""
+        """Ensure persist path exists and open the configured embedding cache."""
         self.persist_path = Path(self.persist_path)
         self.persist_path.mkdir(parents=True, exist_ok=True)
+        if self.embedding_cache is None:
+            cache_path = get_settings().embedding_cache_path
+            if cache_path:
+                self.embedding_cache = EmbeddingCache(cache_path)
 
     @property
     def model(self) -> Any:
@@ -168,18 +194,30 @@ class GermanLawEmbeddingStore:
     def add_documents(
         self,
         documents: list[Document],
-        batch_size: int = 256,
+        batch_size: int | None = None,
         show_progress: bool = True,
+        upsert_batch_size: int | None = None,
     ) -> int:
         """Add LangChain Documents to the vector store.
 
         Documents are embedded using the sentence-transformers model and
         stored in ChromaDB with their metadata.
 
+        Embedding and ChromaDB insertion are batched independently: by default
+        all documents go through a single ``model.encode`` call (the backend
+        splits it into ``EMBEDDING_BATCH_SIZE`` micro-batches and can sort by
+        length across the whole input), and the results are upserted
+        ``upsert_batch_size`` at a time, so large ingestions make few
+        (idempotent) upsert calls into the HNSW index.
+
         Args:
             documents: List of LangChain Document objects
-            batch_size: Number of documents to embed at once
+            batch_size: Number of documents per ``model.encode`` call
+                (default: all documents in one call)
             show_progress: Whether to log progress
+            upsert_batch_size: Number of embedded documents per ChromaDB
+                upsert (default: ``batch_size``, or
+                ``DEFAULT_UPSERT_BATCH_SIZE`` when encoding in one call)
 
         Returns:
             Number of documents added
@@ -190,9 +228,38 @@ class GermanLawEmbeddingStore:
         if not documents:
             return 0
 
+        if upsert_batch_size is None:
+            upsert_batch_size = batch_size or DEFAULT_UPSERT_BATCH_SIZE
+        if batch_size is None:
+            batch_size = len(documents)
+        model_batch_size = get_settings().embedding_batch_size
+
         total_added = 0
         total_batches = (len(documents) + batch_size - 1) // batch_size
 
+        # Embedded documents waiting for the next upsert, deduplicated by doc_id
+        seen_ids: set[str] = set()
+        ids: list[str] = []
+        contents: list[str] = []
+        metadatas: list[dict[str, Any]] = []
+        embedding_batches: list[np.ndarray] = []
+
+        def flush_upsert() -> None:
+            nonlocal total_added
+            # Upsert to ChromaDB (handles duplicates by doc_id)
+            self.collection.upsert(
+                ids=ids,
+                embeddings=np.concatenate(embedding_batches),
+                documents=contents,
+                metadatas=metadatas,
+            )
+            total_added += len(ids)
+            seen_ids.clear()
+            ids.clear()
+            contents.clear()
+            metadatas.clear()
+            embedding_batches.clear()
+
         for batch_idx in range(0, len(documents), batch_size):
             batch = documents[batch_idx : batch_idx + batch_size]
             batch_num = batch_idx // batch_size + 1
@@ -206,58 +273,101 @@ class GermanLawEmbeddingStore:
                 )
 
             # Extract content and metadata, deduplicating by doc_id
-            seen_ids: set[str] = set()
-            ids: list[str] = []
-            contents: list[str] = []
-            metadatas: list[dict[str, Any]] = []
+            batch_contents: list[str] = []
 
             for doc in batch:
                 if not doc.page_content:
                     continue
 
-                # Use doc_id from metadata or generate one
-                doc_id = doc.metadata.get("doc_id", f"doc_{hash(doc.page_content)}")
+                # Use doc_id from metadata or derive a stable one from content
+                doc_id = doc.metadata.get("doc_id") or content_doc_id(doc.page_content)
 
-                # Skip duplicates within batch
+                # Skip duplicates within the pending upsert
                 if doc_id in seen_ids:
                     continue
                 seen_ids.add(doc_id)
 
                 ids.append(doc_id)
-                contents.append(doc.page_content)
+                batch_contents.append(doc.page_content)
                 metadatas.append(self._prepare_metadata(doc.metadata))
 
-            if not contents:
+            if not batch_contents:
                 continue
 
-            # Generate embeddings using the singleton model manager
-            embeddings = self.model.encode(
-                contents,
-                show_progress_bar=False,
-                convert_to_numpy=True,
-            )
+            batch_embeddings = self._encode_documents(batch_contents, model_batch_size)
+            contents.extend(batch_contents)
+            # Keep float32 arrays; ChromaDB takes them without a Python list copy
+            embedding_batches.append(batch_embeddings)
 
-            # Upsert to ChromaDB (handles duplicates by doc_id)
-            self.collection.upsert(
-                ids=ids,
-                embeddings=embeddings.tolist(),
-                documents=contents,
-                metadatas=metadatas,
-            )
+            if len(ids) >= upsert_batch_size:
+                flush_upsert()
 
-            total_added += len(ids)
+        if ids:
+            flush_upsert()
 
         if show_progress:
             logger.info("Added %d documents to collection", total_added)
 
         return total_added
 
+    def _encode_documents(
+        self, texts: list[str], model_batch_size: int | None
+    ) -> np.ndarray:
+        """Embed texts, serving repeated content from the embedding cache.
+
+        Only cache misses are sent to the model (in one ``encode`` call);
+        their vectors are written back to the cache.
+
+        Args:
+            texts: Document texts to embed
+            model_batch_size: Micro-batch size passed to ``model.encode``
+
+        Returns:
+            float32 matrix with one row per text, in input order
+        """
+        cache = self.embedding_cache
+        if cache is None:
+            embeddings = self.model.encode(
+                texts,
+                batch_size=model_batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+            return np.asarray(embeddings, dtype=np.float32)
+
+        keys = [EmbeddingCache.key(self.model_name, text) for text in texts]
+        vectors = cache.get_many(keys)
+        # Encode each distinct missing text once
+        missing_keys = list(dict.fromkeys(key for key in keys if key not in vectors))
+        if missing_keys:
+            text_by_key = dict(zip(keys, texts, strict=True))
+            encoded = np.asarray(
+                self.model.encode(
+                    [text_by_key[key] for key in missing_keys],
+                    batch_size=model_batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                ),
+                dtype=np.float32,
+            )
+            new_vectors = dict(zip(missing_keys, encoded, strict=True))
+            cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        logger.debug(
+            "Embedding cache: %d of %d texts served from cache",
+            len(texts) - len(missing_keys),
+            len(texts),
+        )
+        return np.stack([vectors[key] for key in keys])
+
     def search(
         self,
         query: str,
         n_results: int = 10,
         where: dict[str, Any] | None = None,
         where_document: dict[str, Any] | None = None,
+        min_similarity: float | None = None,
     ) -> list[SearchResult]:
         """Search for similar documents using semantic similarity.
 
@@ -266,6 +376,7 @@ class GermanLawEmbeddingStore:
             n_results: Maximum number of results to return
             where: Metadata filter (e.g., {"law_abbrev": "BGB"})
             where_document: Document content filter
+            min_similarity: Drop results below this similarity (0-1)
 
         Returns:
             List of SearchResult objects ordered by similarity
@@ -278,42 +389,139 @@ class GermanLawEmbeddingStore:
             ...     n_results=5
             ... )
         """
-        # Generate query embedding
-        query_embedding = self.model.encode([query], convert_to_numpy=True)[0]
+        return self.search_many(
+            [query],
+            n_results=n_results,
+            where=where,
+            where_document=where_document,
+            min_similarity=min_similarity,
+        )[0]
+
+    def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+        min_similarity: float | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with one encode and one ChromaDB query.
+
+        All queries are embedded in a single ``model.encode`` call and sent to
+        ChromaDB's HNSW index as one float32 matrix, so per-query overhead
+        (model dispatch, request building, list conversion) is paid once.
+
+        Args:
+            queries: Search query texts
+            n_results: Maximum number of results per query
+            where: Metadata filter applied to every query
+            where_document: Document content filter applied to every query
+            min_similarity: Drop results below this similarity (0-1)
+
+        Returns:
+            One list of SearchResult objects per query, in query order
+        """
+        if not queries:
+            return []
+
+        return self.search_embeddings(
+            self.embed_queries(queries),
+            n_results=n_results,
+            where=where,
+            where_document=where_document,
+            min_similarity=min_similarity,
+        )
+
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Embed query texts in one ``model.encode`` call.
+
+        Args:
+            queries: Search query texts
+
+        Returns:
+            ``(len(queries), dim)`` float32 matrix, one row per query
+        """
+        return np.asarray(
+            self.model.encode(queries, convert_to_numpy=True), dtype=np.float32
+        )
+
+    def search_embeddings(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+        min_similarity: float | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search with precomputed query embeddings in one ChromaDB query.
+
+        Lets callers embed queries with different filters together (see
+        :meth:`embed_queries`) and then query each filter group separately.
+
+        Args:
+            query_embeddings: ``(Q, dim)`` float32 query matrix
+            n_results: Maximum number of results per query
+            where: Metadata filter applied to every query
+            where_document: Document content filter applied to every query
+            min_similarity: Drop results below this similarity (0-1)
+
+        Returns:
+            One list of SearchResult objects per query row, in row order
+        """
+        if len(query_embeddings) == 0:
+            return []
 
         # Query ChromaDB
         results = self.collection.query(
-            query_embeddings=[query_embedding.tolist()],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=where,
             where_document=where_document,
             include=["documents", "metadatas", "distances"],
         )
 
-        # Convert to SearchResult objects
-        search_results: list[SearchResult] = []
-
-        if not results["ids"] or not results["ids"][0]:
-            return search_results
+        result_ids = results["ids"] or []
+        return [
+            self._to_search_results(results, query_index, min_similarity)
+            if query_index < len(result_ids)
+            else []
+            for query_index in range(len(query_embeddings))
+        ]
 
-        ids = results["ids"][0]
-        documents = results["documents"][0] if results["documents"] else [""] * len(ids)
-        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
-        distances = (
-            results["distances"][0] if results["distances"] else [0.0] * len(ids)
-        )
+    @staticmethod
+    def _to_search_results(
+        results: Mapping[str, Any],
+        query_index: int,
+        min_similarity: float | None = None,
+    ) -> list[SearchResult]:
+        """Convert one query's rows of a ChromaDB query response.
 
-        for i, doc_id in enumerate(ids):
-            search_results.append(
-                SearchResult(
-                    doc_id=doc_id,
-                    content=documents[i] if documents else "",
-                    metadata=metadatas[i] if metadatas else {},
-                    distance=distances[i] if distances else 0.0,
-                )
+        Distances are converted and thresholded as one array operation, so
+        only the rows that survive ``min_similarity`` become SearchResults.
+        """
+        ids = results["ids"][query_index]
+        documents = results["documents"][query_index] if results["documents"] else None
+        metadatas = results["metadatas"][query_index] if results["metadatas"] else None
+        distances = np.zeros(len(ids))
+        if results["distances"]:
+            distances = np.asarray(results["distances"][query_index], dtype=np.float64)
+
+        kept = np.arange(len(ids))
+        if min_similarity is not None:
+            similarities = np.maximum(1.0 - distances, 0.0)
+            kept = np.flatnonzero(similarities >= min_similarity)
+
+        return [
+            SearchResult(
+                doc_id=ids[position],
+                content=documents[position] if documents else "",
+                metadata=metadatas[position] if metadatas else {},
+                distance=distance,
             )
-
-        return search_results
+            for position, distance in zip(
+                kept.tolist(), distances[kept].tolist(), strict=True
+            )
+        ]
 
     def get_by_id(self, doc_id: str) -> SearchResult | None:
         """Retrieve a document by its ID.
@@ -386,6 +594,42 @@ class GermanLawEmbeddingStore:
 
         return search_results
 
+    def export_embedding_matrix(
+        self, directory: Path, page_size: int = 5000, quantize: bool = False
+    ) -> EmbeddingMatrix:
+        """Snapshot all stored vectors as a memory-mapped float16 matrix.
+
+        Vectors are read from ChromaDB page by page and written as one
+        L2-normalized float16 ``.npy`` plus a row-aligned id list; see
+        :mod:`app.ingestion.embedding_matrix`.
+
+        Args:
+            directory: Directory for ``embeddings.npy`` and ``ids.json``
+            page_size: Records fetched per ChromaDB ``get`` call
+            quantize: Write int8 rows with per-row scales instead of float16
+
+        Returns:
+            The written snapshot, memory-mapped read-only
+        """
+        ids: list[str] = []
+        pages: list[np.ndarray] = []
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["embeddings"], limit=page_size, offset=offset
+            )
+            if not page["ids"]:
+                break
+            ids.extend(page["ids"])
+            pages.append(np.asarray(page["embeddings"], dtype=np.float32))
+            offset += len(page["ids"])
+
+        embeddings = (
+            np.concatenate(pages) if pages else np.empty((0, 0), dtype=np.float32)
+        )
+        logger.info("Exporting %d embeddings to %s", len(ids), directory)
+        return EmbeddingMatrix.save(Path(directory), ids, embeddings, quantize=quantize)
+
     def count(self) -> int:
         """Get the total number of documents in the collection."""
         return self.collection.count()
@@ -5,6 +5,9 @@ Provides centralized model management with:
 - Automatic GPU memory cleanup when idle
 - Optimal batching and token length configuration
 - Fallback to CPU if GPU memory is insufficient
+- Half-precision weights on CUDA (BF16 on Ampere+, FP16 otherwise)
+- Optional dynamic INT8 quantization on CPU (EMBEDDING_INT8_CPU)
+- Optional torch.compile of the transformer forward pass (EMBEDDING_COMPILE)
 - Thread-safe model access
 
 Usage:
@@ -61,21 +64,26 @@ class EmbeddingModelManager:
         """
         settings = get_settings()
         self.model_name = model_name or settings.embedding_model
+        self.int8_cpu = settings.embedding_int8_cpu
+        self.compile_model = settings.embedding_compile
         self.device = self._select_device()
         self.max_seq_length = self._get_optimal_seq_length()
         self.batch_size = self._get_optimal_batch_size()
+        self.dtype = self._select_dtype()
 
         self._model: SentenceTransformer | None = None
+        self._compiled = False
         self._last_used = 0.0
         self._lock = threading.Lock()
 
         logger.info(
             "EmbeddingModelManager initialized: model=%s, device=%s, "
-            "max_seq_length=%d, batch_size=%d",
+            "max_seq_length=%d, batch_size=%d, dtype=%s",
             self.model_name,
             self.device,
             self.max_seq_length,
             self.batch_size,
+            self.dtype,
         )
 
     def _select_device(self) -> str:
@@ -134,6 +142,19 @@ class EmbeddingModelManager:
         # Model ~4.7GB + activations ~5.5GB for long sequences
         return 1
 
+    def _select_dtype(self) -> torch.dtype:
+        """Select the weight precision for the selected device.
+
+        CUDA devices run in half precision, which halves weight and activation
+        memory and uses tensor cores: BF16 where supported (compute capability
+        8.0+), FP16 on older GPUs. CPU inference stays in FP32.
+        """
+        if self.device != "cuda":
+            return torch.float32
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+
     def _load_model(self) -> SentenceTransformer:
         """Load the embedding model with optimal configuration."""
         logger.info("Loading embedding model: %s on %s", self.model_name, self.device)
@@ -154,21 +175,34 @@ class EmbeddingModelManager:
             # Configure model
             model.max_seq_length = self.max_seq_length
 
-            # Move to device
-            model = model.to(self.device)
+            # Move to device (half precision on CUDA)
+            model = model.to(device=self.device, dtype=self.dtype)
 
             # Set to eval mode and optimize for inference
             model.eval()
-            if self.device == "cuda":
+            if self.device == "cpu" and self.int8_cpu:
+                # Swap nn.Linear for dynamically quantized INT8 kernels
+                # (weights stored as int8, activations quantized per batch)
+                torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+                )
+                logger.info("Applied dynamic INT8 quantization for CPU inference")
+            elif self.device == "cuda":
                 # Enable memory-efficient attention if available
                 with contextlib.suppress(Exception):
                     torch.backends.cuda.enable_flash_sdp(True)
 
+            if self.compile_model:
+                self._compile(model)
+
+            parameter = next(model.parameters())
             logger.info(
-                "Model loaded successfully: dim=%d, max_seq_length=%d, device=%s",
+                "Model loaded successfully: dim=%d, max_seq_length=%d, device=%s, "
+                "dtype=%s",
                 model.get_sentence_embedding_dimension(),
                 model.max_seq_length,
-                next(model.parameters()).device,
+                parameter.device,
+                parameter.dtype,
             )
 
             return model
@@ -180,16 +214,41 @@ class EmbeddingModelManager:
             if self.device == "cuda":
                 logger.info("Retrying on CPU...")
                 self.device = "cpu"
+                self.dtype = self._select_dtype()
                 return self._load_model()
 
             raise
 
+    def _compile(self, model: SentenceTransformer) -> None:
+        """Compile the transformer module in place and warm it up.
+
+        Only the Hugging Face module inside the first SentenceTransformer
+        stage is compiled; tokenization and pooling stay eager. Shapes are
+        compiled dynamically so varying batch and sequence lengths do not
+        trigger recompiles. Failures leave the eager model in place.
+        """
+        transformer = model[0]
+        eager_module = transformer.auto_model
+        try:
+            transformer.auto_model = torch.compile(eager_module, dynamic=True)
+            start = time.perf_counter()
+            with torch.inference_mode():
+                model.encode(["warmup"], show_progress_bar=False)
+            self._compiled = True
+            logger.info(
+                "Compiled embedding model in %.1fs", time.perf_counter() - start
+            )
+        except Exception as e:
+            transformer.auto_model = eager_module
+            logger.warning("torch.compile failed, using eager model: %s", e)
+
     def _cleanup_model(self) -> None:
         """Unload model and free GPU memory."""
         if self._model is not None:
             logger.info("Unloading embedding model to free memory")
             del self._model
             self._model = None
+            self._compiled = False
 
             # Force cleanup
             if torch.cuda.is_available():
@@ -238,12 +297,13 @@ class EmbeddingModelManager:
         if batch_size is None:
             batch_size = self.batch_size
 
-        return model.encode(
-            sentences,
-            batch_size=batch_size,
-            show_progress_bar=show_progress_bar,
-            convert_to_numpy=convert_to_numpy,
-        )
+        with torch.inference_mode():
+            return model.encode(
+                sentences,
+                batch_size=batch_size,
+                show_progress_bar=show_progress_bar,
+                convert_to_numpy=convert_to_numpy,
+            )
 
     def get_sentence_embedding_dimension(self) -> int:
         """Get embedding dimension."""
@@ -262,6 +322,9 @@ class EmbeddingModelManager:
             "device": self.device,
             "max_seq_length": self.max_seq_length,
             "batch_size": self.batch_size,
+            "dtype": str(self.dtype),
+            "int8_quantized": self.device == "cpu" and self.int8_cpu,
+            "compiled": self._compiled,
             "model_loaded": self._model is not None,
             "last_used": self._last_used,
             "idle_timeout": self.IDLE_TIMEOUT_SECONDS,
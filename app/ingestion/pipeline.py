@@ -16,24 +16,38 @@ Usage:
 from __future__ import annotations
 
 import logging
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
 from app.config import get_settings
 from app.ingestion.embeddings import GermanLawEmbeddingStore
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import numpy as np
     from langchain_core.documents import Document
 
+    from app.ingestion.embeddings import SearchResult
+
 # Lazy import heavy modules
 # from legal_mcp.loaders import GermanLawDiscovery, GermanLawHTMLLoader
 
 logger = logging.getLogger(__name__)
 
+# Query embeddings kept across search_laws calls (LRU by model and query text)
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+_query_embeddings: dict[tuple[str, str], np.ndarray] = {}
+_query_embeddings_lock = Lock()
+
 
 @dataclass
 class IngestionProgress:
@@ -105,10 +119,37 @@ class IngestionResult:
         }
 
 
+@contextmanager
+def _norm_fetch_client(max_workers: int) -> Iterator[httpx.Client | None]:
+    """Open one pooled HTTP/2 client shared by every norm fetch of a run.
+
+    Norm pages all live on one host, so reusing keep-alive connections
+    saves a TCP+TLS handshake per norm. Yields ``None`` when USE_TOR is set,
+    leaving each loader to route through its Tor opener.
+
+    Args:
+        max_workers: Concurrent fetch workers (sizes the connection pool)
+    """
+    if os.getenv("USE_TOR", "").lower() in ("true", "1", "yes"):
+        yield None
+        return
+
+    with httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=max_workers, max_keepalive_connections=max_workers
+        ),
+    ) as client:
+        yield client
+
+
 def _load_norm_documents(
     law_abbrev: str,
     norm_url: str,
     delay: float = 0.1,
+    client: httpx.Client | None = None,
 ) -> list[Document]:
     """Load documents for a single norm URL.
 
@@ -116,6 +157,7 @@ def _load_norm_documents(
         law_abbrev: Law abbreviation (e.g., "BGB")
         norm_url: URL to the norm HTML page
         delay: Delay in seconds before request (rate limiting)
+        client: Optional shared HTTP client (see ``_norm_fetch_client``)
 
     Returns:
         List of LangChain Documents (norm + paragraphs)
@@ -127,7 +169,7 @@ def _load_norm_documents(
     if delay > 0:
         time.sleep(delay)
 
-    loader = GermanLawHTMLLoader(url=norm_url, law_abbrev=law_abbrev)
+    loader = GermanLawHTMLLoader(url=norm_url, law_abbrev=law_abbrev, client=client)
     return loader.load()
 
 
@@ -222,12 +264,15 @@ def ingest_german_laws(
         """Process a single norm, return (law_abbrev, documents, error)."""
         law_abbrev, norm_url = task
         try:
-            documents = _load_norm_documents(law_abbrev, norm_url)
+            documents = _load_norm_documents(law_abbrev, norm_url, client=client)
             return (law_abbrev, documents, None)
         except Exception as e:
             return (law_abbrev, None, f"Error loading {norm_url}: {e}")
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with (
+        _norm_fetch_client(max_workers) as client,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
         futures = {executor.submit(process_norm, task): task for task in all_tasks}
 
         for future in as_completed(futures):
@@ -360,7 +405,7 @@ def ingest_single_law(
             """Process a single norm, return (documents, error)."""
             abbrev, norm_url = task
             try:
-                documents = _load_norm_documents(abbrev, norm_url)
+                documents = _load_norm_documents(abbrev, norm_url, client=client)
                 return (documents, None)
             except Exception as e:
                 return (None, f"Error loading {norm_url}: {e}")
@@ -369,7 +414,10 @@ def ingest_single_law(
         logger.info(
             "Processing %d norms with %d workers...", len(norm_urls), max_workers
         )
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with (
+            _norm_fetch_client(max_workers) as client,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
             futures = {executor.submit(process_norm, task): task for task in norm_urls}
 
             for future in as_completed(futures):
@@ -447,6 +495,76 @@ def ingest_single_law(
     )
 
 
+def _law_filter(law_abbrev: str | None, level: str | None) -> dict[str, Any] | None:
+    """Build the ChromaDB metadata filter for a law search.
+
+    ChromaDB requires the ``$and`` operator for multiple conditions.
+    """
+    if law_abbrev and level:
+        # Both filters - use $and
+        return {
+            "$and": [
+                {"law_abbrev": {"$eq": law_abbrev}},
+                {"level": {"$eq": level}},
+            ]
+        }
+    if law_abbrev:
+        return {"law_abbrev": {"$eq": law_abbrev}}
+    if level:
+        return {"level": {"$eq": level}}
+    return None
+
+
+def _search_result_to_dict(result: SearchResult) -> dict[str, Any]:
+    """Shape one search hit for tool responses (content capped at 500 chars)."""
+    content = result.content
+    return {
+        "doc_id": result.doc_id,
+        "content": content[:500] + "..." if len(content) > 500 else content,
+        "similarity": round(result.similarity, 3),
+        **result.metadata,
+    }
+
+
+def _open_store(persist_path: Path | str | None) -> GermanLawEmbeddingStore:
+    """Open the German law embedding store (default path from settings)."""
+    settings = get_settings()
+    store_path = (
+        Path(persist_path) if persist_path else Path(settings.chroma_persist_path)
+    )
+    return GermanLawEmbeddingStore(
+        model_name=settings.embedding_model,
+        persist_path=store_path,
+    )
+
+
+def _embed_query(store: GermanLawEmbeddingStore, query: str) -> np.ndarray:
+    """Embed one query, reusing the embedding of a recently seen query.
+
+    Filters (``law_abbrev``, ``level``) only narrow the ChromaDB search, so
+    the cache is keyed on model and query text alone: repeating a query with
+    different filters skips the encoder forward pass.
+
+    Returns:
+        ``(1, dim)`` read-only query matrix
+    """
+    key = (store.model_name, query)
+    with _query_embeddings_lock:
+        embedding = _query_embeddings.pop(key, None)
+        if embedding is not None:
+            # Re-insert to mark as most recently used (dicts keep order)
+            _query_embeddings[key] = embedding
+            return embedding
+
+    embedding = store.embed_queries([query])
+    embedding.flags.writeable = False
+    with _query_embeddings_lock:
+        _query_embeddings[key] = embedding
+        while len(_query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            del _query_embeddings[next(iter(_query_embeddings))]
+    return embedding
+
+
 def search_laws(
     query: str,
     n_results: int = 10,
@@ -473,40 +591,62 @@ def search_laws(
         >>> for r in results:
         ...     print(f"{r['law_abbrev']} {r['norm_id']}: {r['similarity']:.2f}")
     """
-    settings = get_settings()
-    store_path = (
-        Path(persist_path) if persist_path else Path(settings.chroma_persist_path)
-    )
+    store = _open_store(persist_path)
+    results = store.search_embeddings(
+        _embed_query(store, query),
+        n_results=n_results,
+        where=_law_filter(law_abbrev, level),
+    )[0]
+    return [_search_result_to_dict(result) for result in results]
 
-    store = GermanLawEmbeddingStore(
-        model_name=settings.embedding_model,
-        persist_path=store_path,
-    )
 
-    # Build metadata filter
-    # ChromaDB requires $and operator for multiple conditions
-    where: dict[str, Any] | None = None
-    if law_abbrev and level:
-        # Both filters - use $and
-        where = {
-            "$and": [
-                {"law_abbrev": {"$eq": law_abbrev}},
-                {"level": {"$eq": level}},
-            ]
-        }
-    elif law_abbrev:
-        where = {"law_abbrev": {"$eq": law_abbrev}}
-    elif level:
-        where = {"level": {"$eq": level}}
-
-    results = store.search(query, n_results=n_results, where=where)
-
-    return [
-        {
-            "doc_id": r.doc_id,
-            "content": r.content[:500] + "..." if len(r.content) > 500 else r.content,
-            "similarity": round(r.similarity, 3),
-            **r.metadata,
-        }
-        for r in results
-    ]
+def search_laws_batch(
+    searches: list[Mapping[str, Any]],
+    persist_path: Path | str | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Run several law searches with one embedding call.
+
+    All queries are embedded together in a single ``model.encode`` call.
+    Searches sharing the same ``n_results``/``law_abbrev``/``level`` then go
+    to ChromaDB as one multi-query call per group (a query's metadata filter
+    applies to every row of that call).
+
+    Args:
+        searches: One mapping per search with ``query`` and optional
+            ``n_results`` (default 10), ``law_abbrev`` and ``level``
+        persist_path: Override ChromaDB persistence path
+
+    Returns:
+        One list of result dictionaries per search, in input order
+
+    Example:
+        >>> batches = search_laws_batch([
+        ...     {"query": "Kaufvertrag Pflichten"},
+        ...     {"query": "Kündigung Mietvertrag", "law_abbrev": "BGB"},
+        ... ])
+    """
+    if not searches:
+        return []
+
+    store = _open_store(persist_path)
+    query_embeddings = store.embed_queries([search["query"] for search in searches])
+
+    groups: dict[tuple[int, str | None, str | None], list[int]] = {}
+    for position, search in enumerate(searches):
+        key = (
+            search.get("n_results", 10),
+            search.get("law_abbrev"),
+            search.get("level"),
+        )
+        groups.setdefault(key, []).append(position)
+
+    batches: list[list[dict[str, Any]]] = [[] for _ in searches]
+    for (n_results, law_abbrev, level), positions in groups.items():
+        group_results = store.search_embeddings(
+            query_embeddings[positions],
+            n_results=n_results,
+            where=_law_filter(law_abbrev, level),
+        )
+        for position, results in zip(positions, group_results, strict=True):
+            batches[position] = [_search_result_to_dict(result) for result in results]
+    return batches
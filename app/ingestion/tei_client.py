@@ -173,11 +173,10 @@ class TEIEmbeddingClient:
             sentences[i : i + batch_size] for i in range(0, len(sentences), batch_size)
         ]
 
-        # Use 4 concurrent requests to keep GPU saturated
+        # Use 4 concurrent requests to keep GPU saturated; map() yields results
+        # in submission order so embeddings stay aligned with `sentences`
         with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [executor.submit(self._embed_batch, batch) for batch in batches]
-            for future in concurrent.futures.as_completed(futures):
-                embeddings = future.result()
+            for embeddings in executor.map(self._embed_batch, batches):
                 all_embeddings.extend(embeddings)
 
         return np.array(all_embeddings, dtype=np.float32)
@@ -47,6 +47,7 @@ from app.tools import (
     create_list_available_documents,
     create_search_documents,
     create_search_laws,
+    create_search_laws_batch,
     create_store_secret,
 )
 
@@ -64,6 +65,7 @@ mcp = FastMCP(
 ## German Law Tools
 
 - search_laws: Semantic search across German federal laws (BGB, StGB, GG, etc.)
+- search_laws_batch: Run several search_laws queries in one call (one embedding pass)
 - get_law_by_id: Lookup specific law sections by abbreviation and norm ID
 - get_law_stats: Get collection statistics and model status
 
@@ -121,6 +123,7 @@ health_check = create_health_check(_cache)
 
 # German law tools
 search_laws = create_search_laws(cache)
+search_laws_batch = create_search_laws_batch(cache)
 get_law_by_id = create_get_law_by_id(cache)
 get_law_stats = create_get_law_stats(cache)
 
@@ -150,6 +153,7 @@ mcp.tool(health_check)
 
 # German law tools
 mcp.tool(search_laws)
+mcp.tool(search_laws_batch)
 mcp.tool(get_law_by_id)
 mcp.tool(get_law_stats)
 
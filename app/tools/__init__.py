@@ -35,10 +35,12 @@ from app.tools.custom_documents import (
 from app.tools.de_state.berlin.catalog import create_berlin_list_available_documents
 from app.tools.german_laws import (
     IngestGermanLawsInput,
+    SearchLawsBatchInput,
     SearchLawsInput,
     create_get_law_by_id,
     create_get_law_stats,
     create_search_laws,
+    create_search_laws_batch,
 )
 from app.tools.health import create_health_check
 from app.tools.secrets import (
@@ -59,6 +61,7 @@ __all__ = [
     "IngestPdfFilesInput",
     "ListAvailableDocumentsInput",
     "SearchDocumentsInput",
+    "SearchLawsBatchInput",
     "SearchLawsInput",
     "SecretComputeInput",
     "SecretInput",
@@ -75,5 +78,6 @@ __all__ = [
     "create_list_available_documents",
     "create_search_documents",
     "create_search_laws",
+    "create_search_laws_batch",
     "create_store_secret",
 ]
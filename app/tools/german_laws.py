@@ -2,6 +2,7 @@
 
 This module provides MCP tools for:
 - Semantic search across German federal laws using embeddings
+- Batched semantic search (several queries, one embedding pass)
 - Exact lookups by law/norm identifier
 - Collection statistics and model status
 
@@ -63,6 +64,16 @@ class SearchLawsInput(BaseModel):
     )
 
 
+class SearchLawsBatchInput(BaseModel):
+    """Input model for batched semantic law search."""
+
+    searches: list[SearchLawsInput] = Field(
+        min_length=1,
+        max_length=20,
+        description="Searches to run together; each takes the search_laws arguments",
+    )
+
+
 class IngestGermanLawsInput(BaseModel):
     """Input model for German law ingestion."""
 
@@ -156,6 +167,73 @@ def create_search_laws(cache: RefCache) -> Any:
     return search_laws
 
 
+def create_search_laws_batch(cache: RefCache) -> Any:
+    """Create a search_laws_batch tool function bound to the given cache.
+
+    Args:
+        cache: The RefCache instance for caching results.
+
+    Returns:
+        The search_laws_batch tool function decorated with caching.
+    """
+
+    @cache.cached(namespace="german_laws")
+    async def search_laws_batch(
+        searches: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Run several German law searches in one round trip.
+
+        All queries are embedded in a single model pass; searches that share
+        the same filters are answered by one vector store query. Prefer this
+        over repeated search_laws calls when you have several questions.
+
+        Args:
+            searches: Up to 20 searches, each a dict with `query` and optional
+                `n_results` (1-50), `law_abbrev` and `level`
+                (same meaning as in search_laws).
+
+        Returns:
+            One search_laws-shaped entry per search, in input order.
+
+        **Caching:** Results are cached for repeated batches.
+        """
+        # Validate input
+        validated = SearchLawsBatchInput.model_validate({"searches": searches})
+
+        # Import here to avoid loading heavy modules at startup
+        from app.ingestion.pipeline import search_laws_batch as search_laws_batch_impl
+
+        try:
+            batches = search_laws_batch_impl(
+                [search.model_dump() for search in validated.searches]
+            )
+
+            return {
+                "searches": [
+                    {
+                        "query": search.query,
+                        "results": results,
+                        "count": len(results),
+                        "filters": {
+                            "law_abbrev": search.law_abbrev,
+                            "level": search.level,
+                        },
+                    }
+                    for search, results in zip(validated.searches, batches, strict=True)
+                ],
+                "count": len(batches),
+            }
+
+        except Exception as e:
+            return {
+                "error": "Search failed",
+                "message": str(e),
+                "queries": [search.query for search in validated.searches],
+            }
+
+    return search_laws_batch
+
+
 def create_ingest_german_laws(cache: RefCache) -> Any:
     """Create an ingestion tool for the German federal law corpus (dev-only).
 
@@ -368,8 +446,10 @@ def create_get_law_by_id(cache: RefCache) -> Any:
 
 __all__ = [
     "IngestGermanLawsInput",
+    "SearchLawsBatchInput",
     "SearchLawsInput",
     "create_get_law_by_id",
     "create_get_law_stats",
     "create_search_laws",
+    "create_search_laws_batch",
 ]
@@ -40,6 +40,7 @@ from urllib.error import HTTPError, URLError
 from urllib.request import Request, build_opener, urlopen
 
 import socks
+from legal_mcp.net.http_cache import ACCEPT_ENCODING, decode_content
 from sockshandler import SocksiPyHandler
 
 # Add project root to path
@@ -172,7 +173,7 @@ def download_norm(
             "User-Agent": USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "de,en-US;q=0.7,en;q=0.3",
-            "Accept-Encoding": "identity",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Connection": "keep-alive",
         },
     )
@@ -185,10 +186,14 @@ def download_norm(
         try:
             if opener:
                 with opener.open(request, timeout=30) as response:
-                    content = response.read()
+                    content = decode_content(
+                        response.read(), response.headers.get("Content-Encoding")
+                    )
             else:
                 with urlopen(request, timeout=30) as response:
-                    content = response.read()
+                    content = decode_content(
+                        response.read(), response.headers.get("Content-Encoding")
+                    )
 
             # Ensure parent directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
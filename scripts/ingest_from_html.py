@@ -6,7 +6,8 @@ into ChromaDB vector embeddings using TEI backend.
 
 Features:
 - Processes local files (no network latency)
-- Parallel processing with ThreadPoolExecutor
+- Parallel parsing with ThreadPoolExecutor, or worker processes (--processes)
+  to scale the CPU-bound parse stage past one core
 - TEI backend for fast GPU embeddings
 - Progress tracking with ETA
 - Resume capability (skips already ingested laws)
@@ -20,22 +21,33 @@ Usage:
 
     # Customize batch size and workers
     USE_TEI=true python scripts/ingest_from_html.py --batch-size 256 --workers 16
+
+    # Parse in 8 worker processes instead of threads
+    USE_TEI=true python scripts/ingest_from_html.py --processes 8
 """
 
 from __future__ import annotations
 
 import argparse
+import html
 import logging
+import multiprocessing
+import re
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from langchain_core.documents import Document
+from langchain_core.documents import Document
+from selectolax.lexbor import LexborHTMLParser
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -51,6 +63,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Translation table for norm identifiers -> doc_id fragments ("§ 433" -> "para_433")
+_NORM_ID_TABLE = str.maketrans({"§": "para", " ": "_"})
+
+# Precompiled scanners for the fixed gesetze-im-internet.de page template. A
+# full DOM parse is only needed for pages that do not fit the template.
+_H1_PATTERN = re.compile(r"<h1[^>]*>(.*?)</h1>", re.DOTALL)
+_NORM_ID_PATTERN = re.compile(r'<span class="jnenbez">(.*?)</span>', re.DOTALL)
+_NORM_TITLE_PATTERN = re.compile(r'<span class="jnentitel">(.*?)</span>', re.DOTALL)
+_PARAGRAPH_OPEN_PATTERN = re.compile(r'<div class="jurAbsatz"[^>]*>')
+_DIV_TAG_PATTERN = re.compile(r"<(/?)div\b[^>]*>")
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+# Same character-reference grammar as html.unescape()
+_CHARREF_PATTERN = re.compile(
+    r"&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)"
+)
+_CHARREF_CACHE: dict[str, str] = {}
+
+# Files per task when parsing in worker processes: amortizes the pickling and
+# IPC round trip over many small pages
+PROCESS_FILES_PER_TASK = 32
+
 
 @dataclass
 class IngestStats:
@@ -97,22 +130,103 @@ class IngestStats:
         )
 
 
-def parse_html_file(html_path: Path, law_abbrev: str) -> list[Document]:
-    """Parse a single HTML file into LangChain Documents.
+def _replace_charref(match: re.Match[str]) -> str:
+    """Resolve one character reference, memoized (pages repeat &#228; etc.)."""
+    reference = match[0]
+    replacement = _CHARREF_CACHE.get(reference)
+    if replacement is None:
+        replacement = _CHARREF_CACHE[reference] = html.unescape(reference)
+    return replacement
+
+
+def _fragment_text(fragment: str) -> str:
+    """Return the text of an HTML fragment like selectolax ``text(strip=True)``.
+
+    Every text node is entity-decoded and stripped, then concatenated.
+    """
+    text_nodes = _TAG_PATTERN.split(fragment) if "<" in fragment else [fragment]
+    if "&" in fragment:
+        return "".join(
+            [
+                _CHARREF_PATTERN.sub(_replace_charref, node).strip()
+                for node in text_nodes
+            ]
+        )
+    return "".join([node.strip() for node in text_nodes])
 
-    Args:
-        html_path: Path to the HTML file
-        law_abbrev: Law abbreviation (e.g., "BGB")
+
+def _scan_paragraph_fragments(html_content: str) -> list[str] | None:
+    """Cut out the inner HTML of every ``div.jurAbsatz`` block.
+
+    Nested ``<div>`` elements (lists inside an Absatz) are balanced by depth.
 
     Returns:
-        List of Document objects
+        Inner HTML per paragraph, or None if the page does not fit the
+        template and needs a real DOM parse
     """
-    from langchain_core.documents import Document
-    from selectolax.parser import HTMLParser
+    fragments: list[str] = []
+    position = 0
+    while True:
+        opening = _PARAGRAPH_OPEN_PATTERN.search(html_content, position)
+        if opening is None:
+            break
+        depth = 1
+        for div_tag in _DIV_TAG_PATTERN.finditer(html_content, opening.end()):
+            depth += -1 if div_tag[1] else 1
+            if depth == 0:
+                fragment = html_content[opening.end() : div_tag.start()]
+                position = div_tag.end()
+                break
+        else:
+            return None  # Unclosed block
+        if "jurAbsatz" in fragment or "<!--" in fragment or "<script" in fragment:
+            return None
+        fragments.append(fragment)
+
+    # Any jurAbsatz marker the scanner did not consume (other attribute order,
+    # extra classes, ...) means the template assumption does not hold.
+    if len(fragments) != html_content.count("jurAbsatz"):
+        return None
+    return fragments
+
+
+def _extract_with_patterns(
+    html_content: str,
+) -> tuple[str, str, str, list[str]] | None:
+    """Extract (law title, norm id, norm title, paragraphs) by regex scan.
 
-    # Read HTML content
-    html_content = html_path.read_text(encoding="iso-8859-1")
-    tree = HTMLParser(html_content)
+    Returns:
+        Extracted fields, or None to fall back to selectolax
+    """
+    fragments = _scan_paragraph_fragments(html_content)
+    if fragments is None:
+        return None
+    if not fragments:
+        return "", "", "", []
+
+    fields = []
+    for pattern in (_H1_PATTERN, _NORM_ID_PATTERN, _NORM_TITLE_PATTERN):
+        match = pattern.search(html_content)
+        fields.append(_fragment_text(match[1]) if match else "")
+    law_title, norm_id, norm_title = fields
+    return (
+        law_title,
+        norm_id,
+        norm_title,
+        [_fragment_text(fragment) for fragment in fragments],
+    )
+
+
+def _extract_with_selectolax(html_content: str) -> tuple[str, str, str, list[str]]:
+    """Extract (law title, norm id, norm title, paragraphs) via a DOM parse."""
+    tree = LexborHTMLParser(html_content)
+
+    # Extract all paragraphs (Absätze) first so empty pages (index/TOC files)
+    # are skipped before any other lookups
+    paragraph_elements = tree.css("div.jurAbsatz")
+    paragraphs = [elem.text(strip=True) for elem in paragraph_elements]
+    if not paragraphs:
+        return "", "", "", []
 
     # Extract law title (h1)
     h1 = tree.css_first("h1")
@@ -126,17 +240,41 @@ def parse_html_file(html_path: Path, law_abbrev: str) -> list[Document]:
     norm_title_elem = tree.css_first("span.jnentitel")
     norm_title = norm_title_elem.text(strip=True) if norm_title_elem else ""
 
-    # Extract all paragraphs (Absätze)
-    paragraph_elements = tree.css("div.jurAbsatz")
-    paragraphs = [elem.text(strip=True) for elem in paragraph_elements]
+    return law_title, norm_id, norm_title, paragraphs
+
 
-    # Skip empty norms
+def parse_html_file(html_path: Path, law_abbrev: str) -> list[Document]:
+    """Parse a single HTML file into LangChain Documents.
+
+    Pages matching the fixed site template are scanned with precompiled
+    regexes; anything unusual falls back to a full selectolax parse. Both
+    paths yield identical text.
+
+    Args:
+        html_path: Path to the HTML file
+        law_abbrev: Law abbreviation (e.g., "BGB")
+
+    Returns:
+        List of Document objects
+    """
+    # Read HTML content: one bulk latin-1 decode of the raw bytes skips
+    # read_text's TextIOWrapper and newline translation (pages use \n only)
+    html_content = html_path.read_bytes().decode("iso-8859-1")
+
+    extracted = _extract_with_patterns(html_content)
+    if extracted is None:
+        extracted = _extract_with_selectolax(html_content)
+    law_title, norm_id, norm_title, paragraphs = extracted
+
+    # Skip empty norms (index/TOC pages) before any metadata construction
     if not paragraphs:
         return []
 
     # Combine all paragraphs into full text
     full_text = "\n\n".join(paragraphs)
 
+    law_abbrev_lower = law_abbrev.lower()
+
     # Base metadata
     base_metadata = {
         "jurisdiction": "de-federal",
@@ -144,7 +282,7 @@ def parse_html_file(html_path: Path, law_abbrev: str) -> list[Document]:
         "law_title": law_title,
         "norm_id": norm_id,
         "norm_title": norm_title,
-        "source_url": f"https://www.gesetze-im-internet.de/{law_abbrev.lower()}/{html_path.name}",
+        "source_url": f"https://www.gesetze-im-internet.de/{law_abbrev_lower}/{html_path.name}",
         "source_type": "html",
         "source_file": str(html_path),
     }
@@ -152,18 +290,13 @@ def parse_html_file(html_path: Path, law_abbrev: str) -> list[Document]:
     documents: list[Document] = []
 
     # Document 1: Full norm
-    norm_doc_id = (
-        f"{law_abbrev.lower()}_{norm_id.replace('§', 'para').replace(' ', '_').lower()}"
-    )
-    norm_doc = Document(
-        page_content=full_text,
-        metadata={
-            **base_metadata,
-            "level": "norm",
-            "doc_id": norm_doc_id,
-            "paragraph_count": len(paragraphs),
-        },
-    )
+    norm_doc_id = f"{law_abbrev_lower}_{norm_id.translate(_NORM_ID_TABLE).lower()}"
+    # dict.copy() is a single bulk copy; cheaper than a {**base, ...} merge
+    norm_metadata = base_metadata.copy()
+    norm_metadata["level"] = "norm"
+    norm_metadata["doc_id"] = norm_doc_id
+    norm_metadata["paragraph_count"] = len(paragraphs)
+    norm_doc = Document(page_content=full_text, metadata=norm_metadata)
     documents.append(norm_doc)
 
     # Documents 2+: Individual paragraphs (for fine-grained retrieval)
@@ -171,124 +304,185 @@ def parse_html_file(html_path: Path, law_abbrev: str) -> list[Document]:
         for i, paragraph_text in enumerate(paragraphs, 1):
             if not paragraph_text.strip():
                 continue
+            paragraph_metadata = base_metadata.copy()
+            paragraph_metadata["level"] = "paragraph"
+            paragraph_metadata["doc_id"] = f"{norm_doc_id}_abs_{i}"
+            paragraph_metadata["paragraph_index"] = i
+            paragraph_metadata["parent_norm_id"] = norm_doc_id
             para_doc = Document(
-                page_content=paragraph_text,
-                metadata={
-                    **base_metadata,
-                    "level": "paragraph",
-                    "doc_id": f"{norm_doc_id}_abs_{i}",
-                    "paragraph_index": i,
-                    "parent_norm_id": norm_doc_id,
-                },
+                page_content=paragraph_text, metadata=paragraph_metadata
             )
             documents.append(para_doc)
 
     return documents
 
 
-def process_law_directory(
-    law_dir: Path,
+@dataclass
+class LawProgress:
+    """Per-law bookkeeping while files from many laws share one executor."""
+
+    law: str
+    files: int
+    pending_files: int
+    documents: int = 0
+    errors: list[str] = field(default_factory=list)
+    # Single buffer reused across flushes (cleared once the store is done)
+    documents_batch: list[Document] = field(default_factory=list)
+
+    def to_result(self) -> dict:
+        """Summarize the law for the final report."""
+        return {
+            "law": self.law,
+            "documents": self.documents,
+            "files": self.files,
+            "errors": self.errors,
+        }
+
+
+def process_file(html_path: Path, law_abbrev: str) -> tuple[list[Document], str | None]:
+    """Process a single HTML file."""
+    try:
+        docs = parse_html_file(html_path, law_abbrev)
+        return (docs, None)
+    except Exception as e:
+        return ([], f"Error parsing {html_path}: {e}")
+
+
+def process_file_batch(
+    html_paths: list[Path], law_abbrev: str
+) -> list[tuple[list[Document], str | None]]:
+    """Process several HTML files of one law in a single task."""
+    return [process_file(html_path, law_abbrev) for html_path in html_paths]
+
+
+def flush_law_batch(
+    progress: LawProgress,
+    store: GermanLawEmbeddingStore,
+    stats: IngestStats,
+    embed_batch_size: int = 128,
+) -> int:
+    """Embed and store a law's pending documents, then reset its buffer.
+
+    The whole buffer is upserted into ChromaDB in one call while embeddings
+    are still computed ``embed_batch_size`` documents at a time.
+    """
+    added = store.add_documents(
+        progress.documents_batch,
+        batch_size=embed_batch_size,
+        show_progress=False,
+        upsert_batch_size=len(progress.documents_batch),
+    )
+    progress.documents += added
+    with stats.lock:
+        stats.total_documents += added
+    progress.documents_batch.clear()
+    return added
+
+
+def process_law_directories(
+    law_dirs: list[Path],
     store: GermanLawEmbeddingStore,
     stats: IngestStats,
-    max_workers: int = 8,
+    executor: Executor,
     batch_size: int = 128,
-) -> dict:
-    """Process all HTML files in a law directory.
+    chroma_batch_size: int = 5000,
+    files_per_task: int = 1,
+) -> list[dict]:
+    """Process all HTML files of all law directories on one shared executor.
+
+    Every ``(law_abbrev, html_path)`` pair is submitted up front, so the tail
+    of one law overlaps with the head of the next instead of leaving workers
+    idle between laws. Documents are still batched and reported per law.
 
     Args:
-        law_dir: Directory containing HTML files for a law
+        law_dirs: Directories containing HTML files, one per law
         store: Embedding store
         stats: Statistics tracker
-        max_workers: Number of concurrent workers for parsing
-        batch_size: Documents per embedding batch
+        executor: Shared thread or process pool used for parsing
+        batch_size: Documents per embedding batch (TEI/GPU feed)
+        chroma_batch_size: Documents buffered per ChromaDB upsert
+        files_per_task: HTML files parsed per submitted task
 
     Returns:
-        Dictionary with processing results
+        List of per-law result dictionaries
     """
-    law_abbrev = law_dir.name.upper()
-    html_files = list(law_dir.glob("*.html"))
+    results: list[dict] = []
+    progress_by_law: dict[str, LawProgress] = {}
+    futures: dict[Future[list[tuple[list[Document], str | None]]], str] = {}
 
-    if not html_files:
-        return {"law": law_abbrev, "documents": 0, "files": 0, "errors": []}
-
-    logger.info("[%s] Processing %d HTML files...", law_abbrev, len(html_files))
-
-    with stats.lock:
-        stats.total_files += len(html_files)
-
-    documents_batch: list[Document] = []
-    law_documents = 0
-    law_errors: list[str] = []
-    batch_lock = Lock()
-
-    def process_file(html_path: Path) -> tuple[list[Document], str | None]:
-        """Process a single HTML file."""
-        try:
-            docs = parse_html_file(html_path, law_abbrev)
-            return (docs, None)
-        except Exception as e:
-            return ([], f"Error parsing {html_path}: {e}")
+    for law_dir in law_dirs:
+        law_abbrev = law_dir.name.upper()
+        html_files = list(law_dir.glob("*.html"))
 
-    # Process files in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_file, f): f for f in html_files}
+        if not html_files:
+            results.append(
+                {"law": law_abbrev, "documents": 0, "files": 0, "errors": []}
+            )
+            continue
 
-        for future in as_completed(futures):
-            docs, error = future.result()
+        logger.info("[%s] Queued %d HTML files", law_abbrev, len(html_files))
+        progress_by_law[law_abbrev] = LawProgress(
+            law=law_abbrev, files=len(html_files), pending_files=len(html_files)
+        )
+        with stats.lock:
+            stats.total_files += len(html_files)
 
+        for start in range(0, len(html_files), files_per_task):
+            future = executor.submit(
+                process_file_batch,
+                html_files[start : start + files_per_task],
+                law_abbrev,
+            )
+            futures[future] = law_abbrev
+
+    for future in as_completed(futures):
+        # Drop our reference to the finished future (and its parsed documents)
+        # so flushed batches can be freed instead of living until the end
+        law_abbrev = futures.pop(future)
+        progress = progress_by_law[law_abbrev]
+        for docs, error in future.result():
             if error:
                 with stats.lock:
                     stats.failed_files += 1
                     stats.errors.append(error)
-                law_errors.append(error)
+                progress.errors.append(error)
             elif docs:
-                with batch_lock:
-                    documents_batch.extend(docs)
-
-                    with stats.lock:
-                        stats.processed_files += 1
-
-                    # Batch insert when we have enough documents
-                    if len(documents_batch) >= batch_size:
-                        added = store.add_documents(
-                            documents_batch, show_progress=False
-                        )
-                        law_documents += added
-                        with stats.lock:
-                            stats.total_documents += added
-                        logger.info(
-                            "[%s] Batch: +%d docs (total: %d)",
-                            law_abbrev,
-                            added,
-                            law_documents,
-                        )
-                        documents_batch = []
+                progress.documents_batch.extend(docs)
+
+                with stats.lock:
+                    stats.processed_files += 1
+
+                # Upsert into ChromaDB once enough documents are buffered
+                if len(progress.documents_batch) >= chroma_batch_size:
+                    added = flush_law_batch(progress, store, stats, batch_size)
+                    logger.info(
+                        "[%s] Batch: +%d docs (total: %d)",
+                        law_abbrev,
+                        added,
+                        progress.documents,
+                    )
             else:
                 # Empty document (no paragraphs)
                 with stats.lock:
                     stats.skipped_files += 1
 
-    # Insert remaining documents
-    if documents_batch:
-        added = store.add_documents(documents_batch, show_progress=False)
-        law_documents += added
-        with stats.lock:
-            stats.total_documents += added
-
-    logger.info(
-        "[%s] Complete: %d documents from %d files (%d errors)",
-        law_abbrev,
-        law_documents,
-        len(html_files),
-        len(law_errors),
-    )
+            progress.pending_files -= 1
+            if progress.pending_files == 0:
+                # Insert remaining documents
+                if progress.documents_batch:
+                    flush_law_batch(progress, store, stats, batch_size)
 
-    return {
-        "law": law_abbrev,
-        "documents": law_documents,
-        "files": len(html_files),
-        "errors": law_errors,
-    }
+                logger.info(
+                    "[%s] Complete: %d documents from %d files (%d errors)",
+                    law_abbrev,
+                    progress.documents,
+                    progress.files,
+                    len(progress.errors),
+                )
+                results.append(progress.to_result())
+                stats.log_progress()
+
+    return results
 
 
 def main() -> None:
@@ -314,12 +508,25 @@ def main() -> None:
         default=16,
         help="Concurrent workers for parsing (default: 16)",
     )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Parse in this many worker processes instead of threads "
+        "(default: 0 = use --workers threads)",
+    )
     parser.add_argument(
         "--batch-size",
         type=int,
         default=128,
         help="Documents per embedding batch (default: 128)",
     )
+    parser.add_argument(
+        "--chroma-batch",
+        type=int,
+        default=5000,
+        help="Documents per ChromaDB upsert (default: 5000)",
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
@@ -370,25 +577,54 @@ def main() -> None:
     logger.info("=" * 60)
     logger.info("Input directory: %s", input_dir.absolute())
     logger.info("Laws to process: %d", len(law_dirs))
-    logger.info("Workers: %d", args.workers)
+    if args.processes > 0:
+        logger.info("Parse processes: %d", args.processes)
+    else:
+        logger.info("Workers: %d", args.workers)
     logger.info("Batch size: %d", args.batch_size)
+    logger.info("ChromaDB batch size: %d", args.chroma_batch)
     logger.info("ChromaDB path: %s", settings.chroma_persist_path)
     logger.info("Using TEI: %s", settings.use_tei)
     logger.info("=" * 60)
 
+    # Warm up the embedding backend (TEI connection + kernels, or local model
+    # load) so the cost is reported here instead of stalling the first batch
+    warmup_start = time.perf_counter()
+    try:
+        store.model.encode(["warmup"], show_progress_bar=False, convert_to_numpy=True)
+        logger.info(
+            "Embedding backend warmed up in %.2fs", time.perf_counter() - warmup_start
+        )
+    except Exception as e:
+        logger.warning("Embedding warmup failed: %s", e)
+
     stats = IngestStats()
-    results = []
 
-    for law_dir in law_dirs:
-        result = process_law_directory(
-            law_dir=law_dir,
+    # One pool for the whole run: no per-law startup cost or tail idle.
+    # Parsing is CPU-bound, so threads share one core under the GIL; worker
+    # processes scale it out. forkserver avoids forking this process after
+    # the embedding backend has started its own threads.
+    executor: Executor
+    if args.processes > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=args.processes,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        files_per_task = PROCESS_FILES_PER_TASK
+    else:
+        executor = ThreadPoolExecutor(max_workers=args.workers)
+        files_per_task = 1
+
+    with executor:
+        results = process_law_directories(
+            law_dirs=law_dirs,
             store=store,
             stats=stats,
-            max_workers=args.workers,
+            executor=executor,
             batch_size=args.batch_size,
+            chroma_batch_size=args.chroma_batch,
+            files_per_task=files_per_task,
         )
-        results.append(result)
-        stats.log_progress()
 
     # Final summary
     logger.info("=" * 60)
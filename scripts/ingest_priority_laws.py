@@ -5,8 +5,11 @@ This script ingests the most important German laws (BGB, GG, StGB, etc.)
 with proper rate limiting to avoid overwhelming gesetze-im-internet.de.
 
 Features:
-- Sequential processing within each law (avoids rate limiting)
-- Configurable delay between requests
+- Async HTTP/2 fetching with bounded concurrency per law
+- Per-host token-bucket rate limiting (configurable delay between requests)
+- Honors USE_TOR (norms go through the loader's SOCKS opener) and the
+  LEGAL_MCP_CACHE on-disk page cache
+- Embedding overlaps with downloads (queue-fed embedder coroutine)
 - Progress logging with ETA
 - Graceful error handling and recovery
 - Resume capability (skips already-ingested laws)
@@ -22,14 +25,18 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import httpx
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -38,6 +45,12 @@ sys.path.insert(0, str(project_root))
 from app.config import get_settings  # noqa: E402
 from app.ingestion.embeddings import GermanLawEmbeddingStore  # noqa: E402
 
+if TYPE_CHECKING:
+    from urllib.request import OpenerDirector
+
+    from legal_mcp.net.http_cache import DiskHttpCache
+    from legal_mcp.net.rate_limit import TokenBucket
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)-8s %(message)s",
@@ -45,6 +58,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; rv:128.0) Gecko/20100101 Firefox/128.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "de,en-US;q=0.7,en;q=0.3",
+}
+
 # Priority laws - most important German federal laws
 PRIORITY_LAWS = [
     "GG",  # Grundgesetz (Constitution) - ~200 norms
@@ -103,17 +122,42 @@ class IngestionStats:
         )
 
 
-def load_norm_with_retry(
+async def _fetch_norm_page(
+    client: httpx.AsyncClient, norm_url: str, cache: DiskHttpCache | None
+) -> bytes:
+    """GET one norm page, through the page cache when one is configured."""
+    from legal_mcp.net.http_cache import fetch_cached_async
+
+    if cache is not None:
+        return await fetch_cached_async(norm_url, cache, client)
+    response = await client.get(norm_url)
+    response.raise_for_status()
+    return response.content
+
+
+async def load_norm_with_retry(
+    client: httpx.AsyncClient | None,
     law_abbrev: str,
     norm_url: str,
+    bucket: TokenBucket | None = None,
+    opener: OpenerDirector | None = None,
     max_retries: int = 5,
     base_delay: float = 1.0,
 ) -> tuple[list, str | None]:
-    """Load a single norm with aggressive retry logic.
+    """Fetch and parse a single norm with aggressive retry logic.
+
+    Only transport and HTTP errors are retried; a page that fails to parse
+    is reported once without refetching it. Pages are served from and
+    stored in the loader's page cache (LEGAL_MCP_CACHE) when it is enabled.
 
     Args:
+        client: Shared async HTTP/2 client, or None to fetch through
+            ``GermanLawHTMLLoader.load`` in a worker thread (USE_TOR)
         law_abbrev: Law abbreviation
         norm_url: URL to fetch
+        bucket: Host token bucket; every attempt reserves a token and feeds
+            the response status back (429/503 slow the host down)
+        opener: Shared Tor SOCKS opener used when ``client`` is None
         max_retries: Maximum retry attempts
         base_delay: Base delay between retries (doubles each time)
 
@@ -122,23 +166,55 @@ def load_norm_with_retry(
     """
     from legal_mcp.loaders import GermanLawHTMLLoader
 
-    last_error = None
-
-    for attempt in range(max_retries):
+    loader = GermanLawHTMLLoader(
+        url=norm_url, law_abbrev=law_abbrev, rate_limiter=bucket, opener=opener
+    )
+    if client is None:
+        # The loader's urllib path routes through Tor and does its own paced
+        # retries and page caching
         try:
-            loader = GermanLawHTMLLoader(url=norm_url, law_abbrev=law_abbrev)
-            docs = loader.load()
-            return (docs, None)
+            docs = await asyncio.to_thread(loader.load)
         except Exception as e:
-            last_error = str(e)
-            if attempt < max_retries - 1:
-                delay = base_delay * (2**attempt)
-                time.sleep(delay)
-
-    return ([], f"Failed {norm_url}: {last_error}")
+            return ([], f"Failed {norm_url}: {e}")
+        return (docs, None)
+
+    cache = loader.cache
+    cached = cache.get(norm_url) if cache is not None else None
+    if cached is not None and cache is not None and cache.is_fresh(cached):
+        # Fresh cached page: no request, so no rate-limit token either
+        body = cached.body
+    else:
+        last_error = None
+        for attempt in range(max_retries):
+            if bucket is not None:
+                await asyncio.sleep(bucket.reserve())
+            try:
+                body = await _fetch_norm_page(client, norm_url, cache)
+            except (httpx.HTTPError, OSError) as e:
+                if bucket is not None and isinstance(e, httpx.HTTPStatusError):
+                    bucket.record_status(e.response.status_code)
+                last_error = str(e)
+                if attempt < max_retries - 1:
+                    delay = base_delay * (2**attempt)
+                    await asyncio.sleep(delay)
+                continue
+            if bucket is not None:
+                bucket.record_success()
+            break
+        else:
+            return ([], f"Failed {norm_url}: {last_error}")
+
+    # German law pages use ISO-8859-1 encoding
+    html_content = body.decode("iso-8859-1")
+    try:
+        # Parse off the event loop so other downloads keep flowing
+        docs = await asyncio.to_thread(loader.load_from_html, html_content)
+    except Exception as e:
+        return ([], f"Failed to parse {norm_url}: {e}")
+    return (docs, None)
 
 
-def ingest_law(
+async def ingest_law_async(
     law_abbrev: str,
     store: GermanLawEmbeddingStore,
     stats: IngestionStats,
@@ -146,32 +222,45 @@ def ingest_law(
     max_workers: int = 4,
     batch_size: int = 128,
 ) -> dict:
-    """Ingest a single law with controlled concurrency.
+    """Ingest a single law with bounded async concurrency.
+
+    Norm downloads run as coroutines over one HTTP/2 client (capped by a
+    semaphore and a per-host token bucket) and push their documents onto a
+    queue. With USE_TOR set they run ``GermanLawHTMLLoader.load`` in worker
+    threads over one Tor SOCKS opener instead. A single embedder coroutine drains the queue and flushes batches
+    to the store in a worker thread, so embedding overlaps with fetching.
 
     Args:
         law_abbrev: Law abbreviation (e.g., "BGB")
         store: Embedding store instance
         stats: Shared statistics tracker
-        request_delay: Delay between requests in seconds
-        max_workers: Number of concurrent workers
+        request_delay: Minimum average delay between requests to the host
+            in seconds (enforced by a token bucket; 0 disables limiting)
+        max_workers: Maximum number of in-flight requests
         batch_size: Documents per embedding batch
 
     Returns:
         Dictionary with ingestion results
     """
     from legal_mcp.loaders.discovery import GermanLawDiscovery, LawInfo
+    from legal_mcp.loaders.german_law_html import build_tor_opener
+    from legal_mcp.net.rate_limit import HostRateLimiter
 
     logger.info("=" * 60)
     logger.info("Starting %s ingestion", law_abbrev)
     logger.info("=" * 60)
 
-    discovery = GermanLawDiscovery()
     law_url = f"https://www.gesetze-im-internet.de/{law_abbrev.lower()}/"
     law = LawInfo(abbreviation=law_abbrev, title="", url=law_url)
 
+    def discover_norms() -> list:
+        # Closes the discovery's owned HTTP client once the law is listed
+        with GermanLawDiscovery() as discovery:
+            return list(discovery.discover_norms(law))
+
     # Discover norms
     try:
-        norms = list(discovery.discover_norms(law))
+        norms = await asyncio.to_thread(discover_norms)
         logger.info("[%s] Found %d norms", law_abbrev, len(norms))
     except Exception as e:
         error_msg = f"Failed to discover norms for {law_abbrev}: {e}"
@@ -181,75 +270,104 @@ def ingest_law(
     with stats.lock:
         stats.total_norms += len(norms)
 
-    # Prepare tasks
-    tasks = [(law_abbrev, norm.url) for norm in norms]
-
-    documents_batch: list = []
     law_docs = 0
     law_norms = 0
     law_errors: list[str] = []
-    batch_lock = Lock()
-    request_lock = Lock()
-    last_request_time = [0.0]  # Mutable container for closure
-
-    def process_norm(task: tuple[str, str]) -> tuple[list, str | None]:
-        """Process a single norm with rate limiting."""
-        abbrev, url = task
-
-        # Rate limiting - ensure minimum delay between requests
-        with request_lock:
-            elapsed = time.time() - last_request_time[0]
-            if elapsed < request_delay:
-                time.sleep(request_delay - elapsed)
-            last_request_time[0] = time.time()
 
-        return load_norm_with_retry(abbrev, url)
+    semaphore = asyncio.Semaphore(max_workers)
+    rate_limiter = (
+        HostRateLimiter(rate_per_second=1.0 / request_delay)
+        if request_delay > 0
+        else None
+    )
+    # One SOCKS opener serves every norm of the law when USE_TOR is set
+    tor_opener = (
+        build_tor_opener()
+        if os.getenv("USE_TOR", "").lower() in ("true", "1", "yes")
+        else None
+    )
+    # None marks the end of the stream for the embedder
+    results_queue: asyncio.Queue[tuple[list, str | None] | None] = asyncio.Queue()
+
+    async def fetch_norm(client: httpx.AsyncClient | None, url: str) -> None:
+        """Fetch one norm under the concurrency cap and enqueue its result."""
+        bucket = rate_limiter.bucket_for(url) if rate_limiter is not None else None
+        async with semaphore:
+            result = await load_norm_with_retry(
+                client, law_abbrev, url, bucket, tor_opener
+            )
+        await results_queue.put(result)
+
+    async def flush(documents_batch: list) -> int:
+        """Embed and store a batch without blocking the event loop."""
+        added = await asyncio.to_thread(
+            store.add_documents, documents_batch, show_progress=False
+        )
+        with stats.lock:
+            stats.total_documents += added
+        return added
 
-    # Process with controlled concurrency
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_norm, task): task for task in tasks}
+    async def embed_results() -> None:
+        """Consume fetched norms and insert them in batches."""
+        nonlocal law_docs, law_norms
+        # Single buffer reused across flushes (cleared once the store is done)
+        documents_batch: list = []
 
-        for future in as_completed(futures):
-            docs, error = future.result()
+        while (item := await results_queue.get()) is not None:
+            docs, error = item
 
             if error:
                 law_errors.append(error)
                 with stats.lock:
                     stats.errors.append(error)
-            else:
-                with batch_lock:
-                    documents_batch.extend(docs)
-                    law_norms += 1
-
-                    with stats.lock:
-                        stats.processed_norms += 1
-
-                        # Log progress every 50 norms
-                        if stats.processed_norms % 50 == 0:
-                            stats.log_progress(law_abbrev)
-
-                    # Batch insert
-                    if len(documents_batch) >= batch_size:
-                        added = store.add_documents(
-                            documents_batch, show_progress=False
-                        )
-                        law_docs += added
-                        with stats.lock:
-                            stats.total_documents += added
-                        logger.info(
-                            "[%s] Batch: +%d docs (total: %d)",
-                            law_abbrev,
-                            added,
-                            law_docs,
-                        )
-                        documents_batch = []
-
-    # Final batch
-    if documents_batch:
-        added = store.add_documents(documents_batch, show_progress=False)
-        law_docs += added
-        with stats.lock:
-            stats.total_documents += added
+                continue
+
+            documents_batch.extend(docs)
+            law_norms += 1
+
+            with stats.lock:
+                stats.processed_norms += 1
+
+                # Log progress every 50 norms
+                if stats.processed_norms % 50 == 0:
+                    stats.log_progress(law_abbrev)
+
+            # Batch insert
+            if len(documents_batch) >= batch_size:
+                added = await flush(documents_batch)
+                law_docs += added
+                logger.info(
+                    "[%s] Batch: +%d docs (total: %d)",
+                    law_abbrev,
+                    added,
+                    law_docs,
+                )
+                documents_batch.clear()
+
+        # Final batch
+        if documents_batch:
+            law_docs += await flush(documents_batch)
+
+    client_context: AbstractAsyncContextManager[httpx.AsyncClient | None]
+    if tor_opener is not None:
+        # httpx would bypass Tor; loaders fetch through the SOCKS opener instead
+        client_context = nullcontext(None)
+    else:
+        limits = httpx.Limits(
+            max_connections=max_workers, max_keepalive_connections=max_workers
+        )
+        client_context = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=30.0,
+            limits=limits,
+            http2=True,
+            follow_redirects=True,
+        )
+    async with client_context as client:
+        embedder = asyncio.create_task(embed_results())
+        await asyncio.gather(*(fetch_norm(client, norm.url) for norm in norms))
+        await results_queue.put(None)
+        await embedder
 
     with stats.lock:
         stats.completed_laws += 1
@@ -272,23 +390,102 @@ def ingest_law(
     }
 
 
-def check_existing_laws(store: GermanLawEmbeddingStore) -> set[str]:
-    """Check which laws are already ingested.
+def ingest_law(
+    law_abbrev: str,
+    store: GermanLawEmbeddingStore,
+    stats: IngestionStats,
+    request_delay: float = 0.15,
+    max_workers: int = 4,
+    batch_size: int = 128,
+) -> dict:
+    """Synchronous entry point for :func:`ingest_law_async`.
+
+    Args:
+        law_abbrev: Law abbreviation (e.g., "BGB")
+        store: Embedding store instance
+        stats: Shared statistics tracker
+        request_delay: Minimum average delay between requests in seconds
+        max_workers: Maximum number of in-flight requests
+        batch_size: Documents per embedding batch
+
+    Returns:
+        Dictionary with ingestion results
+    """
+    return asyncio.run(
+        ingest_law_async(
+            law_abbrev=law_abbrev,
+            store=store,
+            stats=stats,
+            request_delay=request_delay,
+            max_workers=max_workers,
+            batch_size=batch_size,
+        )
+    )
+
+
+def _scan_existing_laws(
+    collection: Any, laws: list[str], page_size: int = 2000
+) -> set[str]:
+    """Page through law metadata until every requested law has been seen.
+
+    Fallback for when metadata-filtered lookups fail. Only ``page_size``
+    metadata dicts are held at a time, and the scan stops early once all
+    laws are found.
+    """
+    wanted = {law.upper(): law for law in laws}
+    existing: set[str] = set()
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+        metadatas = page["metadatas"] or []
+        for metadata in metadatas:
+            law = wanted.get(str((metadata or {}).get("law_abbrev", "")).upper())
+            if law is not None:
+                existing.add(law)
+        if len(existing) == len(wanted) or len(metadatas) < page_size:
+            return existing
+        offset += page_size
+
+
+def check_existing_laws(store: GermanLawEmbeddingStore, laws: list[str]) -> set[str]:
+    """Check which of the requested laws are already ingested.
+
+    Issues one ``limit=1`` metadata-filtered lookup per law instead of pulling
+    every metadata dict into Python, so cost scales with ``len(laws)`` rather
+    than with the collection size. If the filtered lookup fails, falls back to
+    a paged metadata scan that stops as soon as every law has been seen.
+
+    Args:
+        store: Embedding store to check
+        laws: Law abbreviations to look for
 
     Returns:
-        Set of law abbreviations already in the store
+        Subset of ``laws`` that already have documents in the store
     """
     try:
         collection = store.collection
         if collection.count() == 0:
             return set()
+    except Exception:
+        return set()
 
-        # Sample to find existing laws
-        result = collection.get(include=["metadatas"], limit=50000)
-        existing = {
-            m.get("law_abbrev") for m in result["metadatas"] if m.get("law_abbrev")
-        }
+    try:
+        existing: set[str] = set()
+        for law in laws:
+            # Scripts store either the given or the upper-cased abbreviation
+            result = collection.get(
+                where={"law_abbrev": {"$in": sorted({law, law.upper()})}},
+                limit=1,
+                include=[],
+            )
+            if result["ids"]:
+                existing.add(law)
         return existing
+    except Exception as e:
+        logger.warning("Filtered lookup failed (%s); scanning metadata pages", e)
+
+    try:
+        return _scan_existing_laws(collection, laws)
     except Exception:
         return set()
 
@@ -341,7 +538,7 @@ def main() -> None:
 
     # Check for existing laws
     if args.skip_existing:
-        existing = check_existing_laws(store)
+        existing = check_existing_laws(store, laws)
         if existing:
             logger.info("Found existing laws: %s", existing)
             laws = [law for law in laws if law not in existing]
@@ -1,7 +1,20 @@
 #!/usr/bin/env python3
-"""Test HTML-only discovery pipeline for German laws."""
-
+"""Test HTML-only discovery pipeline for German laws.
+
+Set LEGAL_MCP_CACHE=1 to keep fetched index pages in .discovery_cache/ so
+repeat runs are served from disk (revalidated after an hour).
+"""
+
+import asyncio
+import contextlib
+import functools
+import io
+import sys
+import threading
 import time
+import traceback
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 from legal_mcp.loaders import (
     GermanLawDiscovery,
@@ -9,13 +22,19 @@ from legal_mcp.loaders import (
 )
 
 
+@functools.cache
+def _discovery() -> GermanLawDiscovery:
+    """Shared discovery instance so all tests reuse one pooled HTTP client."""
+    return GermanLawDiscovery()
+
+
 def test_discover_laws_from_one_letter() -> None:
     """Test discovering laws from a single letter page."""
     print("\n" + "=" * 80)
     print("Test 1: Discover Laws from Letter 'B'")
     print("=" * 80 + "\n")
 
-    discovery = GermanLawDiscovery()
+    discovery = _discovery()
 
     # Fetch just the B page
     url = "https://www.gesetze-im-internet.de/Teilliste_B.html"
@@ -42,7 +61,7 @@ def test_discover_norms_from_law() -> None:
     print("Test 2: Discover Norms from BetrKV (small law)")
     print("=" * 80 + "\n")
 
-    discovery = GermanLawDiscovery()
+    discovery = _discovery()
 
     # Create a LawInfo for BetrKV
     law = LawInfo(
@@ -67,7 +86,7 @@ def test_discover_norms_from_gg() -> None:
     print("Test 3: Discover Norms from GG (Grundgesetz)")
     print("=" * 80 + "\n")
 
-    discovery = GermanLawDiscovery()
+    discovery = _discovery()
 
     law = LawInfo(
         abbreviation="GG",
@@ -98,7 +117,7 @@ def test_full_discovery_limited() -> None:
     print("Test 4: Full Discovery (limited to 5 laws)")
     print("=" * 80 + "\n")
 
-    discovery = GermanLawDiscovery()
+    discovery = _discovery()
 
     start = time.perf_counter()
     result = discovery.discover_all(max_laws=5)
@@ -122,6 +141,15 @@ def test_full_discovery_limited() -> None:
         for error in result.errors[:5]:
             print(f"  - {error}")
 
+    # Same discovery with concurrent HTTP/2 fetches
+    start = time.perf_counter()
+    async_result = asyncio.run(discovery.discover_all_async(max_laws=5))
+    async_elapsed = time.perf_counter() - start
+
+    print(f"\nAsync discovery completed in {async_elapsed:.2f}s")
+    print(f"Laws found: {len(async_result.laws)}")
+    print(f"Norms found: {len(async_result.norms)}")
+
 
 def test_estimate_full_corpus() -> None:
     """Estimate time for full corpus discovery."""
@@ -129,7 +157,7 @@ def test_estimate_full_corpus() -> None:
     print("Test 5: Estimate Full Corpus Discovery Time")
     print("=" * 80 + "\n")
 
-    discovery = GermanLawDiscovery()
+    discovery = _discovery()
 
     # Time fetching one letter page
     start = time.perf_counter()
@@ -157,33 +185,97 @@ def test_estimate_full_corpus() -> None:
     sync_time = (estimated_letter_pages * letter_time) + (estimated_laws * law_time)
     print(f"\nEstimated sync discovery time: {sync_time / 60:.1f} minutes")
 
-    # Async estimate (10 concurrent)
-    async_factor = 10
-    async_time = sync_time / async_factor
+    # Async estimate, measured on a sample of laws fetched concurrently
+    concurrency = 20
+    sample_size = 40
+    start = time.perf_counter()
+    sample = asyncio.run(
+        discovery.discover_all_async(
+            max_laws=sample_size, max_concurrent_requests=concurrency
+        )
+    )
+    sample_time = time.perf_counter() - start
+    async_time = sample_time / max(len(sample.laws), 1) * estimated_laws
     print(
-        f"Estimated async discovery time (10 concurrent): {async_time / 60:.1f} minutes"
+        f"Sample of {len(sample.laws)} laws ({concurrency} concurrent): "
+        f"{sample_time:.2f}s"
     )
+    print(
+        f"Estimated async discovery time ({concurrency} concurrent): "
+        f"{async_time / 60:.1f} minutes"
+    )
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Route ``print`` output of worker threads into per-thread buffers."""
+
+    def __init__(self, fallback: io.TextIOBase) -> None:
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            del self._local.buffer
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._fallback).write(text)
+
+
+def _run_test(test: Callable[[], None], stdout: _ThreadLocalStdout) -> str:
+    """Run one test, returning everything it printed (including failures)."""
+    with stdout.capture() as buffer:
+        try:
+            test()
+        except Exception as e:
+            print(f"\n❌ Test failed: {test.__name__}")
+            print(f"Error: {e}")
+            traceback.print_exc(file=buffer)
+    return buffer.getvalue()
 
 
 def main() -> None:
-    """Run all tests."""
-    tests = [
+    """Run all tests.
+
+    The fetch-only tests run concurrently on the shared HTTP client (they are
+    I/O bound and independent); their output is buffered and printed in
+    order. The timing tests run afterwards on their own so concurrent traffic
+    does not skew their measurements.
+    """
+    concurrent_tests = [
         test_discover_laws_from_one_letter,
         test_discover_norms_from_law,
         test_discover_norms_from_gg,
+    ]
+    timing_tests = [
         test_full_discovery_limited,
         test_estimate_full_corpus,
     ]
 
-    for test in tests:
-        try:
-            test()
-        except Exception as e:
-            print(f"\n❌ Test failed: {test.__name__}")
-            print(f"Error: {e}")
-            import traceback
+    stdout = _ThreadLocalStdout(sys.stdout)
+    start = time.perf_counter()
+    with (
+        contextlib.redirect_stdout(stdout),
+        ThreadPoolExecutor(max_workers=len(concurrent_tests)) as executor,
+    ):
+        outputs = list(
+            executor.map(lambda test: _run_test(test, stdout), concurrent_tests)
+        )
+    for output in outputs:
+        print(output, end="")
+    print(
+        f"\n({len(concurrent_tests)} tests ran concurrently in "
+        f"{time.perf_counter() - start:.2f}s)"
+    )
+
+    for test in timing_tests:
+        print(_run_test(test, stdout), end="")
 
-            traceback.print_exc()
+    _discovery().close()
 
     print("\n" + "=" * 80)
     print("✅ All tests completed!")
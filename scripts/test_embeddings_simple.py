@@ -49,6 +49,7 @@ def test_model_singleton() -> bool:
     print(f"✓ Device: {model1.device}")
     print(f"✓ Max seq length: {model1.max_seq_length}")
     print(f"✓ Batch size: {model1.batch_size}")
+    print(f"✓ Dtype: {model1.dtype}")
 
     # Test singleton behavior
     assert model1 is model2, "Model manager should be singleton"
@@ -69,6 +70,10 @@ def test_model_singleton() -> bool:
     embeddings = model1.encode(test_texts)
     print(f"✓ Encoded {len(test_texts)} texts to {embeddings.shape}")
     assert embeddings.shape == (3, 768), f"Wrong embedding shape: {embeddings.shape}"
+    # Half-precision GPU models return float16 (BF16 is upcast to float32)
+    assert str(embeddings.dtype) in ("float16", "float32"), (
+        f"Unexpected embedding dtype: {embeddings.dtype}"
+    )
 
     # Test stats
     stats = model1.stats()
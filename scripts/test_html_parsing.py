@@ -1,105 +1,162 @@
 #!/usr/bin/env python3
-"""Test HTML parsing of German law pages from gesetze-im-internet.de."""
+"""Test HTML parsing of German law pages from gesetze-im-internet.de.
+
+Prints a structure summary per page; pass --verbose to also dump the full
+element tree.
+"""
 
 import sys
-from html.parser import HTMLParser
-from typing import Any
-from urllib.request import urlopen
-
-
-class GermanLawHTMLAnalyzer(HTMLParser):
-    """Analyze structure of German law HTML pages."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.indent = 0
-        self.in_content = False
-        self.structure: list[dict[str, Any]] = []
-        self.current_path: list[str] = []
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        """Track opening tags and their attributes."""
-        attrs_dict = dict(attrs)
-
-        # Build display string
-        attr_display = ""
-        if "class" in attrs_dict:
-            attr_display = f'class="{attrs_dict["class"]}"'
-        elif "id" in attrs_dict:
-            attr_display = f'id="{attrs_dict["id"]}"'
-        elif "href" in attrs_dict:
-            href = attrs_dict["href"]
-            if href:
-                attr_display = (
-                    f'href="{href[:30]}..."' if len(href) > 30 else f'href="{href}"'
-                )
-
-        print("  " * self.indent + f"<{tag} {attr_display}>")
-
-        # Track structure for analysis
-        self.current_path.append(tag)
-        self.structure.append(
-            {
-                "tag": tag,
-                "attrs": attrs_dict,
-                "depth": self.indent,
-                "path": list(self.current_path),
-            }
-        )
-
-        self.indent += 1
-
-    def handle_endtag(self, tag: str) -> None:
-        """Track closing tags."""
-        self.indent = max(0, self.indent - 1)
-        if self.current_path and self.current_path[-1] == tag:
-            self.current_path.pop()
-
-    def handle_data(self, data: str) -> None:
-        """Track text content."""
-        data = data.strip()
-        if data and len(data) > 3:  # Skip whitespace and tiny fragments
-            preview = data[:80] + "..." if len(data) > 80 else data
-            print("  " * self.indent + f'TEXT: "{preview}"')
-
-
-def fetch_and_analyze(url: str) -> None:
-    """Fetch HTML page and analyze structure."""
+from dataclasses import dataclass, field
+
+import httpx
+from legal_mcp.loaders.german_law_html import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_TTL_SECONDS,
+)
+from legal_mcp.net.http_cache import DiskHttpCache, fetch_cached
+from lxml import etree
+from lxml import html as lxml_html
+
+# Law pages are effectively static; repeat runs read them from disk
+PAGE_CACHE = DiskHttpCache(DEFAULT_CACHE_DIR, ttl_seconds=DEFAULT_CACHE_TTL_SECONDS)
+# Cache misses reuse one keep-alive HTTP/2 connection instead of a new
+# TCP+TLS handshake per page
+HTTP_CLIENT = httpx.Client(http2=True, follow_redirects=True)
+
+# German law pages use ISO-8859-1; libxml2 decodes the raw bytes itself
+LATIN1_PARSER = lxml_html.HTMLParser(encoding="iso-8859-1")
+
+HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4"))
+# Longest text node shown verbatim in the verbose tree dump
+MAX_PREVIEW = 80
+
+
+@dataclass
+class PageStructure:
+    """Elements of the analyzed page as parallel columns (one row per element).
+
+    Column lists instead of one record object per element: a page with
+    thousands of tags appends to three lists rather than allocating a
+    record and an attribute dict for each tag.
+    """
+
+    tags: list[str] = field(default_factory=list)
+    classes: list[str] = field(default_factory=list)
+    depths: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of elements."""
+        return len(self.tags)
+
+
+def _print_text(text: str | None, depth: int) -> None:
+    """Print a text node preview, skipping whitespace and tiny fragments."""
+    data = (text or "").strip()
+    if len(data) > 3:
+        # Only truncated previews build a new string
+        preview = data if len(data) <= MAX_PREVIEW else f"{data[:MAX_PREVIEW]}..."
+        print(f'{"  " * depth}TEXT: "{preview}"')
+
+
+def _print_element(
+    element: lxml_html.HtmlElement, css_class: str | None, depth: int
+) -> None:
+    """Print an opening tag with its most telling attribute."""
+    element_id = element.get("id")
+    href = element.get("href")
+
+    # Build display string
+    attr_display = ""
+    if css_class is not None:
+        attr_display = f'class="{css_class}"'
+    elif element_id is not None:
+        attr_display = f'id="{element_id}"'
+    elif href:
+        attr_display = f'href="{href[:30]}..."' if len(href) > 30 else f'href="{href}"'
+
+    print("  " * depth + f"<{element.tag} {attr_display}>")
+
+
+def analyze_structure(html_content: bytes, verbose: bool = False) -> PageStructure:
+    """Collect the elements of a German law page, optionally printing the tree.
+
+    Walks the lxml tree (C parser) with ``iterwalk`` start/end events instead
+    of tokenizing with the pure-Python ``html.parser``. The raw page bytes go
+    straight to libxml2, so no intermediate Python ``str`` copy is made.
+
+    Args:
+        html_content: Raw page bytes (ISO-8859-1).
+        verbose: Print every element and text node. Off by default: per-node
+            formatting and stdout writes cost far more than the walk itself.
+    """
+    structure = PageStructure()
+    depth = 0
+    root = lxml_html.fromstring(html_content, parser=LATIN1_PARSER)
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        if not isinstance(element.tag, str):
+            # Comments and processing instructions only contribute their tail
+            if verbose and event == "end":
+                _print_text(element.tail, depth)
+            continue
+
+        if event == "end":
+            depth = max(0, depth - 1)
+            if verbose:
+                _print_text(element.tail, depth)
+            continue
+
+        css_class = element.get("class")
+        if verbose:
+            _print_element(element, css_class, depth)
+        structure.tags.append(element.tag)
+        structure.classes.append(css_class or "")
+        structure.depths.append(depth)
+        depth += 1
+        if verbose:
+            _print_text(element.text, depth)
+
+    return structure
+
+
+def fetch_and_analyze(url: str, verbose: bool = False) -> None:
+    """Fetch HTML page and analyze structure (tree dump only when verbose)."""
     print(f"\n{'=' * 80}")
     print(f"Analyzing: {url}")
     print(f"{'=' * 80}\n")
 
-    # Fetch with proper encoding
-    with urlopen(url) as response:
-        # German law pages use ISO-8859-1 encoding
-        html_content = response.read().decode("iso-8859-1")
+    # Fetch raw bytes (served from disk after first run)
+    html_content = fetch_cached(url, PAGE_CACHE, client=HTTP_CLIENT)
 
     # Parse and analyze
-    parser = GermanLawHTMLAnalyzer()
-    parser.feed(html_content)
+    structure = analyze_structure(html_content, verbose=verbose)
 
     # Print summary
     print(f"\n{'=' * 80}")
     print("Summary:")
-    print(f"  Total elements: {len(parser.structure)}")
-
-    # Find key structural elements
-    headings = [s for s in parser.structure if s["tag"] in ["h1", "h2", "h3", "h4"]]
-    divs_with_class = [
-        s for s in parser.structure if s["tag"] == "div" and s["attrs"].get("class")
-    ]
-    paragraphs = [s for s in parser.structure if s["tag"] == "p"]
-
-    print(f"  Headings (h1-h4): {len(headings)}")
-    print(f"  Divs with class: {len(divs_with_class)}")
-    print(f"  Paragraphs: {len(paragraphs)}")
-
-    if divs_with_class:
+    print(f"  Total elements: {len(structure)}")
+
+    # Find key structural elements in one pass over the columns
+    heading_count = 0
+    div_with_class_count = 0
+    div_classes: set[str] = set()
+    paragraph_count = 0
+    for tag, css_class in zip(structure.tags, structure.classes, strict=True):
+        if tag in HEADING_TAGS:
+            heading_count += 1
+        elif tag == "div" and css_class:
+            div_with_class_count += 1
+            div_classes.add(css_class)
+        elif tag == "p":
+            paragraph_count += 1
+
+    print(f"  Headings (h1-h4): {heading_count}")
+    print(f"  Divs with class: {div_with_class_count}")
+    print(f"  Paragraphs: {paragraph_count}")
+
+    if div_classes:
         print("\n  Key div classes:")
-        classes = {s["attrs"].get("class", "") for s in divs_with_class}
-        for cls in sorted(classes):
-            if cls:
-                print(f"    - {cls}")
+        for css_class in sorted(div_classes):
+            print(f"    - {css_class}")
 
     print(f"{'=' * 80}\n")
 
@@ -112,13 +169,16 @@ def main() -> None:
         "https://www.gesetze-im-internet.de/stgb/__211.html",  # StGB § 211 (if exists)
     ]
 
-    if len(sys.argv) > 1:
+    arguments = sys.argv[1:]
+    verbose = "--verbose" in arguments
+    custom_urls = [argument for argument in arguments if argument != "--verbose"]
+    if custom_urls:
         # Allow custom URL from command line
-        test_urls = [sys.argv[1]]
+        test_urls = custom_urls[:1]
 
     for url in test_urls:
         try:
-            fetch_and_analyze(url)
+            fetch_and_analyze(url, verbose=verbose)
         except Exception as e:
             print(f"Error analyzing {url}: {e}")
             print()
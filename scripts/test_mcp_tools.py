@@ -20,13 +20,30 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
+# Imported once for the whole run (tool modules, models and validators)
+from mcp_refcache import RefCache  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+
+from app.tools.german_laws import (  # noqa: E402
+    IngestGermanLawsInput,
+    SearchLawsInput,
+    create_get_law_by_id,
+    create_get_law_stats,
+    create_ingest_german_laws,
+    create_search_laws,
+    create_search_laws_batch,
+)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -34,6 +51,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ToolSet:
+    """Tool functions bound to one shared RefCache."""
+
+    search_laws: Any
+    search_laws_batch: Any
+    get_law_by_id: Any
+    ingest_german_laws: Any
+    get_law_stats: Any
+
+
+def create_tool_set(name: str) -> ToolSet:
+    """Create a RefCache and bind every German law tool to it once."""
+    cache = RefCache(name=name, default_ttl=60)
+    return ToolSet(
+        search_laws=create_search_laws(cache),
+        search_laws_batch=create_search_laws_batch(cache),
+        get_law_by_id=create_get_law_by_id(cache),
+        ingest_german_laws=create_ingest_german_laws(cache),
+        get_law_stats=create_get_law_stats(cache),
+    )
+
+
 def unwrap_cache_response(result: dict) -> dict:
     """Unwrap a mcp-refcache response to get the actual value.
 
@@ -60,32 +100,21 @@ def unwrap_cache_response(result: dict) -> dict:
     return result
 
 
-def test_tool_creation() -> bool:
+def test_tool_creation(tools: ToolSet) -> bool:
     """Test that tool factory functions create callable tools."""
     logger.info("=" * 60)
     logger.info("TEST 1: Tool Creation")
     logger.info("=" * 60)
 
-    from mcp_refcache import RefCache
-
-    from app.tools.german_laws import (
-        create_get_law_by_id,
-        create_get_law_stats,
-        create_ingest_german_laws,
-        create_search_laws,
-    )
-
-    # Create a test cache
-    cache = RefCache(name="test-cache", default_ttl=60)
-
-    # Create all tools
-    search_laws = create_search_laws(cache)
-    get_law_by_id = create_get_law_by_id(cache)
-    ingest_german_laws = create_ingest_german_laws(cache)
-    get_law_stats = create_get_law_stats(cache)
+    search_laws = tools.search_laws
+    search_laws_batch = tools.search_laws_batch
+    get_law_by_id = tools.get_law_by_id
+    ingest_german_laws = tools.ingest_german_laws
+    get_law_stats = tools.get_law_stats
 
     # Verify they are callable
     assert callable(search_laws), "search_laws should be callable"
+    assert callable(search_laws_batch), "search_laws_batch should be callable"
     assert callable(get_law_by_id), "get_law_by_id should be callable"
     assert callable(ingest_german_laws), "ingest_german_laws should be callable"
     assert callable(get_law_stats), "get_law_stats should be callable"
@@ -104,10 +133,6 @@ def test_input_validation() -> bool:
     logger.info("TEST 2: Input Validation")
     logger.info("=" * 60)
 
-    from pydantic import ValidationError
-
-    from app.tools.german_laws import IngestGermanLawsInput, SearchLawsInput
-
     # Valid search input
     search_input = SearchLawsInput(
         query="Kaufvertrag Pflichten",
@@ -152,27 +177,22 @@ def test_input_validation() -> bool:
     return True
 
 
-async def test_get_law_stats() -> bool:
+async def test_get_law_stats(tools: ToolSet) -> bool:
     """Test get_law_stats tool retrieves collection info."""
     logger.info("=" * 60)
     logger.info("TEST 3: get_law_stats")
     logger.info("=" * 60)
 
-    from mcp_refcache import RefCache
-
-    from app.tools.german_laws import create_get_law_stats
-
-    cache = RefCache(name="test-cache", default_ttl=60)
-    get_law_stats = create_get_law_stats(cache)
-
     # Call the tool
-    raw_result = await get_law_stats()
+    raw_result = await tools.get_law_stats()
 
-    logger.info("Raw stats result: %s", raw_result)
+    # Whole result payloads only at DEBUG: repr() of a large dict is skipped
+    # entirely when the level is off
+    logger.debug("Raw stats result: %s", raw_result)
 
     # Unwrap cache response
     result = unwrap_cache_response(raw_result)
-    logger.info("Unwrapped stats: %s", result)
+    logger.debug("Unwrapped stats: %s", result)
 
     # Verify structure (should work even with empty collection)
     assert isinstance(result, dict), f"Expected dict, got {type(result)}"
@@ -192,30 +212,32 @@ async def test_get_law_stats() -> bool:
     return True
 
 
-async def test_search_laws() -> bool:
-    """Test search_laws tool with semantic query."""
+async def test_search_laws_batch(tools: ToolSet) -> bool:
+    """Test search_laws_batch with a plain and a filtered query in one call."""
     logger.info("=" * 60)
-    logger.info("TEST 4: search_laws")
+    logger.info("TEST 4: search_laws_batch (plain + filtered)")
     logger.info("=" * 60)
 
-    from mcp_refcache import RefCache
-
-    from app.tools.german_laws import create_search_laws
-
-    cache = RefCache(name="test-cache", default_ttl=60)
-    search_laws = create_search_laws(cache)
-
-    # Search for purchase contract duties
-    raw_result = await search_laws(
-        query="Kaufvertrag Pflichten",
-        n_results=5,
+    # One embedding pass for both queries instead of two search_laws calls
+    raw_result = await tools.search_laws_batch(
+        searches=[
+            # Search for purchase contract duties
+            {"query": "Kaufvertrag Pflichten", "n_results": 5},
+            # Search in BGB only
+            {
+                "query": "Kündigung Mietvertrag Wohnung",
+                "n_results": 5,
+                "law_abbrev": "BGB",
+                "level": "norm",
+            },
+        ]
     )
 
-    logger.info("Raw search result keys: %s", list(raw_result.keys()))
+    logger.info("Raw batch result keys: %s", list(raw_result.keys()))
 
     # Unwrap cache response
     result = unwrap_cache_response(raw_result)
-    logger.info("Unwrapped search result keys: %s", list(result.keys()))
+    logger.info("Unwrapped batch result keys: %s", list(result.keys()))
 
     assert isinstance(result, dict), f"Expected dict, got {type(result)}"
 
@@ -224,83 +246,50 @@ async def test_search_laws() -> bool:
             "✅ Search returned error (expected if no data ingested): %s",
             result.get("message"),
         )
-    elif result.get("_is_preview"):
+        return True
+    if result.get("_is_preview"):
         # Preview response - verify structure
         assert "count" in result, "Preview missing count"
         logger.info(
-            "✅ Search returned preview with %d results",
-            result.get("count", 0),
+            "✅ Batch search returned preview with %d searches", result["count"]
         )
-    else:
-        # Complete response
-        assert "query" in result, "Missing 'query' key"
-        assert "results" in result, "Missing 'results' key"
-        assert "count" in result, "Missing 'count' key"
-        logger.info("✅ Search returned %d results", result["count"])
-
-        # If we have results, check structure
-        if result["count"] > 0:
-            first_result = result["results"][0]
-            logger.info("First result: %s", first_result.get("doc_id", "N/A"))
-            assert "content" in first_result, "Missing 'content' in result"
-            assert "similarity" in first_result, "Missing 'similarity' in result"
-
-    return True
-
-
-async def test_search_with_filters() -> bool:
-    """Test search_laws with law_abbrev filter."""
-    logger.info("=" * 60)
-    logger.info("TEST 5: search_laws with filters")
-    logger.info("=" * 60)
-
-    from mcp_refcache import RefCache
-
-    from app.tools.german_laws import create_search_laws
-
-    cache = RefCache(name="test-cache", default_ttl=60)
-    search_laws = create_search_laws(cache)
-
-    # Search in BGB only - use unique query to avoid cache hit from previous test
-    raw_result = await search_laws(
-        query="Kündigung Mietvertrag Wohnung",
-        n_results=5,
-        law_abbrev="BGB",
-        level="norm",
+        return True
+
+    assert result.get("count") == 2, f"Expected 2 searches, got {result.get('count')}"
+    plain, filtered = result["searches"]
+
+    # Plain search: complete response
+    assert "query" in plain, "Missing 'query' key"
+    assert "results" in plain, "Missing 'results' key"
+    assert "count" in plain, "Missing 'count' key"
+    logger.info("✅ Search returned %d results", plain["count"])
+
+    # If we have results, check structure
+    if plain["count"] > 0:
+        first_result = plain["results"][0]
+        logger.info("First result: %s", first_result.get("doc_id", "N/A"))
+        assert "content" in first_result, "Missing 'content' in result"
+        assert "similarity" in first_result, "Missing 'similarity' in result"
+
+    # Filtered search
+    assert "filters" in filtered, (
+        f"Missing 'filters' key. Got keys: {list(filtered.keys())}"
     )
+    assert filtered["filters"]["law_abbrev"] == "BGB"
+    assert filtered["filters"]["level"] == "norm"
 
-    logger.info("Raw result with filters: %s", raw_result)
-
-    # Unwrap cache response
-    result = unwrap_cache_response(raw_result)
-    logger.info("Unwrapped result with filters: %s", result)
-
-    assert isinstance(result, dict)
-    assert "filters" in result, (
-        f"Missing 'filters' key. Got keys: {list(result.keys())}"
-    )
-    assert result["filters"]["law_abbrev"] == "BGB"
-    assert result["filters"]["level"] == "norm"
-
-    logger.info("✅ Filters applied correctly: %s", result["filters"])
+    logger.info("✅ Filters applied correctly: %s", filtered["filters"])
     return True
 
 
-async def test_get_law_by_id() -> bool:
+async def test_get_law_by_id(tools: ToolSet) -> bool:
     """Test get_law_by_id tool for exact lookups."""
     logger.info("=" * 60)
-    logger.info("TEST 6: get_law_by_id")
+    logger.info("TEST 5: get_law_by_id")
     logger.info("=" * 60)
 
-    from mcp_refcache import RefCache
-
-    from app.tools.german_laws import create_get_law_by_id
-
-    cache = RefCache(name="test-cache", default_ttl=60)
-    get_law_by_id = create_get_law_by_id(cache)
-
     # Try to get BGB section
-    raw_result = await get_law_by_id(law_abbrev="BGB", norm_id="§ 433")
+    raw_result = await tools.get_law_by_id(law_abbrev="BGB", norm_id="§ 433")
 
     logger.info("Raw get_law_by_id result keys: %s", list(raw_result.keys()))
 
@@ -324,7 +313,7 @@ async def test_get_law_by_id() -> bool:
     return True
 
 
-async def test_live_ingestion_and_search() -> bool:
+async def test_live_ingestion_and_search(tools: ToolSet) -> bool:
     """Integration test: ingest real laws and test semantic search.
 
     This test:
@@ -338,28 +327,19 @@ async def test_live_ingestion_and_search() -> bool:
     generic query that should match any legal text.
     """
     logger.info("=" * 60)
-    logger.info("TEST 7: Live Ingestion & Semantic Search")
+    logger.info("TEST 6: Live Ingestion & Semantic Search")
     logger.info("=" * 60)
 
-    from mcp_refcache import RefCache
-
-    from app.tools.german_laws import (
-        create_get_law_stats,
-        create_ingest_german_laws,
-        create_search_laws,
-    )
-
-    cache = RefCache(name="test-cache-live", default_ttl=60)
-    ingest_german_laws = create_ingest_german_laws(cache)
-    search_laws = create_search_laws(cache)
-    get_law_stats = create_get_law_stats(cache)
+    ingest_german_laws = tools.ingest_german_laws
+    search_laws = tools.search_laws
+    get_law_stats = tools.get_law_stats
 
     # Step 1: Ingest 2 laws (BGB and GG - the most important ones)
     logger.info("Step 1: Ingesting 2 laws (this may take 30-60 seconds)...")
     raw_result = await ingest_german_laws(max_laws=2, max_norms_per_law=10)
     result = unwrap_cache_response(raw_result)
 
-    logger.info("Ingestion result: %s", result)
+    logger.debug("Ingestion result: %s", result)
 
     if "error" in result:
         logger.error("❌ Ingestion failed: %s", result.get("message"))
@@ -389,7 +369,7 @@ async def test_live_ingestion_and_search() -> bool:
     raw_search = await search_laws(query="Gesetz Verordnung Regelung", n_results=5)
     search_result = unwrap_cache_response(raw_search)
 
-    logger.info("Search result: %s", search_result)
+    logger.debug("Search result: %s", search_result)
 
     # Handle both complete results and preview responses
     if search_result.get("_is_preview"):
@@ -430,37 +410,57 @@ async def run_all_tests(include_live: bool = False) -> bool:
     logger.info("GERMAN LAW MCP TOOLS TEST SUITE")
     logger.info("=" * 60 + "\n")
 
-    tests = [
-        ("Tool Creation", test_tool_creation),
+    # Cache and tools are built once and shared by every read-only test
+    tools = create_tool_set("test-cache")
+
+    sync_tests = [
+        ("Tool Creation", partial(test_tool_creation, tools)),
         ("Input Validation", test_input_validation),
-        ("get_law_stats", test_get_law_stats),
-        ("search_laws", test_search_laws),
-        ("search_laws with filters", test_search_with_filters),
-        ("get_law_by_id", test_get_law_by_id),
     ]
+    # Read-only tool calls with no ordering dependency between them
+    async_tests = [
+        ("get_law_stats", partial(test_get_law_stats, tools)),
+        ("search_laws_batch", partial(test_search_laws_batch, tools)),
+        ("get_law_by_id", partial(test_get_law_by_id, tools)),
+    ]
+    tests = [*sync_tests, *async_tests]
 
-    # Add live test if requested
+    outcomes: list[bool | BaseException] = []
+    for _, test_func in sync_tests:
+        try:
+            outcomes.append(test_func())
+        except Exception as e:
+            outcomes.append(e)
+
+    outcomes.extend(
+        await asyncio.gather(
+            *(test_func() for _, test_func in async_tests), return_exceptions=True
+        )
+    )
+
+    # Add live test if requested. It writes to the collection, so it only
+    # starts once the read-only tests are done, and it gets its own cache:
+    # the shared one already holds the pre-ingestion get_law_stats result.
     if include_live:
+        live_tools = create_tool_set("test-cache-live")
         tests.append(("Live Ingestion & Search", test_live_ingestion_and_search))
+        try:
+            outcomes.append(await test_live_ingestion_and_search(live_tools))
+        except Exception as e:
+            outcomes.append(e)
 
     passed = 0
     failed = 0
 
-    for name, test_func in tests:
-        try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-
-            if result:
-                passed += 1
-            else:
-                failed += 1
-                logger.error("❌ FAILED: %s", name)
-        except Exception as e:
+    for (name, _), outcome in zip(tests, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
             failed += 1
-            logger.exception("❌ FAILED: %s - %s", name, e)
+            logger.error("❌ FAILED: %s - %s", name, outcome, exc_info=outcome)
+        elif outcome:
+            passed += 1
+        else:
+            failed += 1
+            logger.error("❌ FAILED: %s", name)
 
     # Summary
     logger.info("\n" + "=" * 60)
@@ -486,7 +486,25 @@ if __name__ == "__main__":
         action="store_true",
         help="Include live ingestion test (slow, requires network)",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Also log full tool results (DEBUG)",
+    )
     args = parser.parse_args()
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
 
-    success = asyncio.run(run_all_tests(include_live=args.live))
+    # uvloop (optional, not on Windows) cuts per-await overhead; fall back to
+    # the default asyncio loop when it is not installed
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    success = asyncio.run(
+        run_all_tests(include_live=args.live), loop_factory=loop_factory
+    )
     sys.exit(0 if success else 1)
@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
-"""Test selectolax HTML parsing of German law pages from gesetze-im-internet.de."""
+"""Test selectolax HTML parsing of German law pages from gesetze-im-internet.de.
 
+All pages are fetched concurrently up front (asyncio + one pooled HTTP/2
+client), so total fetch time is roughly the slowest page rather than the sum.
+The CPU-bound parses then run on a thread pool before results are displayed.
+Pass --verbose to also print every paragraph and the combined text.
+"""
+
+import asyncio
+import os
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from urllib.request import urlopen
+from functools import lru_cache
+
+import httpx
+from legal_mcp.loaders.german_law_html import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_TTL_SECONDS,
+)
+from legal_mcp.net.http_cache import DiskHttpCache, fetch_cached_async
+from selectolax.lexbor import LexborHTMLParser
+
+# Law pages are effectively static; repeat runs read them from disk
+PAGE_CACHE = DiskHttpCache(DEFAULT_CACHE_DIR, ttl_seconds=DEFAULT_CACHE_TTL_SECONDS)
+MAX_CONCURRENT_FETCHES = 8
 
-from selectolax.parser import HTMLParser
+# Every element parse_german_law_page reads, matched in one pass
+NORM_FIELDS_SELECTOR = "h1, span.jnenbez, span.jnentitel, div.jurAbsatz"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GermanLawNorm:
     """Represents a parsed German law norm (§/Art)."""
 
@@ -19,11 +42,25 @@ class GermanLawNorm:
     full_text: str  # Combined text of all paragraphs
 
 
-def fetch_html(url: str) -> str:
-    """Fetch HTML content with proper encoding."""
-    with urlopen(url) as response:
-        # German law pages use ISO-8859-1 encoding
-        return response.read().decode("iso-8859-1")
+async def fetch_html(client: httpx.AsyncClient, url: str) -> str:
+    """Fetch HTML content with proper encoding (served from disk after first run)."""
+    body = await fetch_cached_async(url, PAGE_CACHE, client)
+    # German law pages use ISO-8859-1 encoding. Decode here (a fast latin-1
+    # copy): LexborHTMLParser reads bytes as UTF-8 and would garble umlauts.
+    return body.decode("iso-8859-1")
+
+
+async def fetch_all(urls: list[str]) -> list[str | BaseException]:
+    """Fetch all pages concurrently; failures are returned in place."""
+    async with httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES),
+    ) as client:
+        return await asyncio.gather(
+            *(fetch_html(client, url) for url in urls), return_exceptions=True
+        )
 
 
 def parse_german_law_page(html_content: str) -> GermanLawNorm:
@@ -35,23 +72,32 @@ def parse_german_law_page(html_content: str) -> GermanLawNorm:
     - Norm title: <span class="jnentitel"> (optional)
     - Paragraphs: <div class="jurAbsatz"> contains each Absatz
     """
-    tree = HTMLParser(html_content)
-
-    # Extract law title (h1)
-    h1 = tree.css_first("h1")
-    law_title = h1.text(strip=True) if h1 else ""
-
-    # Extract norm identifier (§ 433, Art 1, etc.)
-    norm_id_elem = tree.css_first("span.jnenbez")
-    norm_id = norm_id_elem.text(strip=True) if norm_id_elem else ""
-
-    # Extract norm title (optional)
-    norm_title_elem = tree.css_first("span.jnentitel")
-    norm_title = norm_title_elem.text(strip=True) if norm_title_elem else ""
-
-    # Extract all paragraphs (Absätze)
-    paragraph_elements = tree.css("div.jurAbsatz")
-    paragraphs = [elem.text(strip=True) for elem in paragraph_elements]
+    tree = LexborHTMLParser(html_content)
+
+    # One document-order css() pass over all four fields instead of a separate
+    # css()/css_first() full-DOM scan per field (matching stays in Lexbor's C
+    # code; a Python-level traverse() over every node measured slower)
+    law_title = norm_id = norm_title = ""
+    found_law_title = found_norm_id = found_norm_title = False
+    paragraphs = []
+    for node in tree.css(NORM_FIELDS_SELECTOR):
+        tag = node.tag
+        if tag == "div":
+            # Each Absatz (paragraph)
+            paragraphs.append(node.text(strip=True))
+        elif tag == "h1":
+            if not found_law_title:
+                law_title = node.text(strip=True)
+                found_law_title = True
+        elif "jnenbez" in (node.attributes.get("class") or "").split():
+            # Norm identifier (§ 433, Art 1, etc.)
+            if not found_norm_id:
+                norm_id = node.text(strip=True)
+                found_norm_id = True
+        elif not found_norm_title:
+            # Norm title (optional)
+            norm_title = node.text(strip=True)
+            found_norm_title = True
 
     # Combine all paragraphs into full text
     full_text = "\n\n".join(paragraphs)
@@ -65,19 +111,26 @@ def parse_german_law_page(html_content: str) -> GermanLawNorm:
     )
 
 
-def analyze_and_display(url: str) -> None:
-    """Fetch, parse, and display German law page."""
+# Re-parses of an already seen page (display, perf check, retries) are a dict
+# hit: str caches its own hash, so keying on the page text itself is O(1)
+# after the first lookup, unlike hashing the content with a digest each call.
+# Sharing results is safe because GermanLawNorm is frozen.
+parse_german_law_page_cached = lru_cache(maxsize=256)(parse_german_law_page)
+
+
+def analyze_and_display(
+    url: str, html_content: str, norm: GermanLawNorm, verbose: bool = False
+) -> None:
+    """Display a fetched German law page and its parsed structure.
+
+    Paragraph and full-text previews are only built when ``verbose``.
+    """
     print(f"\n{'=' * 80}")
     print(f"Analyzing: {url}")
     print(f"{'=' * 80}\n")
 
-    # Fetch HTML
-    html_content = fetch_html(url)
     print(f"Fetched HTML: {len(html_content):,} bytes")
 
-    # Parse with selectolax
-    norm = parse_german_law_page(html_content)
-
     # Display results
     print("\n--- Parsed Structure ---")
     print(f"Law Title:    {norm.law_title}")
@@ -86,32 +139,30 @@ def analyze_and_display(url: str) -> None:
     print(f"Paragraphs:   {len(norm.paragraphs)}")
     print(f"Full Text:    {len(norm.full_text)} chars")
 
+    if not verbose:
+        print(f"\n{'=' * 80}\n")
+        return
+
     print("\n--- Paragraphs ---")
     for i, para in enumerate(norm.paragraphs, 1):
         print(f"\nParagraph {i} ({len(para)} chars):")
         # Show first 200 chars of each paragraph
-        preview = para[:200] + "..." if len(para) > 200 else para
-        print(f"  {preview}")
+        print(f"  {para if len(para) <= 200 else f'{para[:200]}...'}")
 
     print("\n--- Full Combined Text ---")
-    preview = (
-        norm.full_text[:500] + "..." if len(norm.full_text) > 500 else norm.full_text
-    )
-    print(preview)
+    full_text = norm.full_text
+    print(full_text if len(full_text) <= 500 else f"{full_text[:500]}...")
 
     print(f"\n{'=' * 80}\n")
 
 
-def test_performance(url: str, iterations: int) -> None:
-    """Test parsing performance."""
-    import time
-
+def test_performance(html_content: str, iterations: int) -> None:
+    """Test parsing performance (uncached parses, then cached re-parses)."""
     print(f"\n{'=' * 80}")
     print(f"Performance Test: {iterations} iterations")
     print(f"{'=' * 80}\n")
 
-    html_content = fetch_html(url)
-
+    # Real parse cost: bypass the memo so every iteration builds a tree
     start = time.perf_counter()
     for _ in range(iterations):
         parse_german_law_page(html_content)
@@ -121,6 +172,12 @@ def test_performance(url: str, iterations: int) -> None:
     print(f"Total time:    {elapsed:.4f}s")
     print(f"Average:       {avg_ms:.2f}ms per parse")
     print(f"Throughput:    {iterations / elapsed:.1f} parses/sec")
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse_german_law_page_cached(html_content)
+    cached_elapsed = time.perf_counter() - start
+    print(f"Cached:        {cached_elapsed / iterations * 1e6:.2f}us per re-parse")
     print(f"\n{'=' * 80}\n")
 
 
@@ -132,16 +189,33 @@ def main() -> None:
         ("StGB § 211", "https://www.gesetze-im-internet.de/stgb/__211.html"),
     ]
 
-    if len(sys.argv) > 1:
+    arguments = sys.argv[1:]
+    verbose = "--verbose" in arguments
+    custom_urls = [argument for argument in arguments if argument != "--verbose"]
+    if custom_urls:
         # Allow custom URL from command line
-        test_urls = [("Custom URL", sys.argv[1])]
+        test_urls = [("Custom URL", custom_urls[0])]
+
+    pages = asyncio.run(fetch_all([url for _, url in test_urls]))
+
+    # Parse every fetched page up front; Lexbor does the tree building in C,
+    # so on a multi-core machine the parses overlap instead of queueing
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        parses: list[Future[GermanLawNorm] | None] = [
+            executor.submit(parse_german_law_page_cached, page)
+            if isinstance(page, str)
+            else None
+            for page in pages
+        ]
 
-    for name, url in test_urls:
+    for (name, url), page, parse in zip(test_urls, pages, parses, strict=True):
         try:
             print(f"\n{'#' * 80}")
             print(f"# {name}")
             print(f"{'#' * 80}")
-            analyze_and_display(url)
+            if isinstance(page, BaseException):
+                raise page
+            analyze_and_display(url, page, parse.result(), verbose=verbose)
         except Exception as e:
             print(f"Error analyzing {url}: {e}")
             import traceback
@@ -149,9 +223,9 @@ def main() -> None:
             traceback.print_exc()
 
     # Performance test on first URL
-    if test_urls:
+    if test_urls and isinstance(pages[0], str):
         try:
-            test_performance(test_urls[0][1], 10)
+            test_performance(pages[0], 10)
         except Exception as e:
             print(f"Error in performance test: {e}")
 
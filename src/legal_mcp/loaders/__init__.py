@@ -5,18 +5,23 @@ This module provides specialized loaders for legal documents from various source
 designed to integrate with LangChain's document processing pipeline.
 """
 
-from legal_mcp.loaders.discovery import (
-    DiscoveryResult,
-    GermanLawDiscovery,
-    LawInfo,
-    NormInfo,
-    discover_laws_sync,
-)
-from legal_mcp.loaders.german_law_html import (
-    GermanLawBulkHTMLLoader,
-    GermanLawHTMLLoader,
-    GermanLawNorm,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from legal_mcp.loaders.discovery import (
+        DiscoveryResult,
+        GermanLawDiscovery,
+        LawInfo,
+        NormInfo,
+        discover_laws_sync,
+    )
+    from legal_mcp.loaders.german_law_html import (
+        GermanLawBulkHTMLLoader,
+        GermanLawHTMLLoader,
+        GermanLawNorm,
+    )
 
 __all__ = [
     # Discovery
@@ -30,3 +35,50 @@ __all__ = [
     "NormInfo",
     "discover_laws_sync",
 ]
+
+
+# Lazy imports so `import legal_mcp.loaders` does not pull in selectolax,
+# httpx and LangChain until a loader is actually used
+def __getattr__(name: str) -> object:
+    """Lazy import of loader classes and discovery helpers."""
+    if name == "DiscoveryResult":
+        from legal_mcp.loaders.discovery import DiscoveryResult
+
+        return DiscoveryResult
+
+    if name == "GermanLawDiscovery":
+        from legal_mcp.loaders.discovery import GermanLawDiscovery
+
+        return GermanLawDiscovery
+
+    if name == "LawInfo":
+        from legal_mcp.loaders.discovery import LawInfo
+
+        return LawInfo
+
+    if name == "NormInfo":
+        from legal_mcp.loaders.discovery import NormInfo
+
+        return NormInfo
+
+    if name == "discover_laws_sync":
+        from legal_mcp.loaders.discovery import discover_laws_sync
+
+        return discover_laws_sync
+
+    if name == "GermanLawBulkHTMLLoader":
+        from legal_mcp.loaders.german_law_html import GermanLawBulkHTMLLoader
+
+        return GermanLawBulkHTMLLoader
+
+    if name == "GermanLawHTMLLoader":
+        from legal_mcp.loaders.german_law_html import GermanLawHTMLLoader
+
+        return GermanLawHTMLLoader
+
+    if name == "GermanLawNorm":
+        from legal_mcp.loaders.german_law_html import GermanLawNorm
+
+        return GermanLawNorm
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,20 +12,52 @@ Discovery flow:
 This provides a pure HTML approach that's always up-to-date with the official source.
 """
 
+import asyncio
+import logging
+import os
 import re
-from collections.abc import Iterator
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from types import TracebackType
 from typing import ClassVar
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
 
-from selectolax.parser import HTMLParser
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+from legal_mcp.net.http_cache import DiskHttpCache
+from legal_mcp.net.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
 
 # Base URL for all German federal laws
 BASE_URL = "https://www.gesetze-im-internet.de"
 
+# On-disk page cache location used when LEGAL_MCP_CACHE is enabled
+DEFAULT_CACHE_DIR = Path(".discovery_cache")
+
+# Concurrent page fetches used by discover_laws_sync; stays below the sync
+# client's 20 pooled connections
+DEFAULT_MAX_WORKERS = 16
+
+# Law directory links look like "./bgb/index.html" or "./betrkv/index.html"
+# (matched against the lowercased href)
+_LAW_HREF_PATTERN = re.compile(r"\./([a-z0-9_]+)/index\.html")
 
-@dataclass
+# Norm identifiers start with § or Art or similar; numbered entries like
+# "1", "2" are accepted for simple laws
+_NORM_ID_PATTERN = re.compile(r"(?:§|Art\.?|Artikel|Anlage|\d+)", re.IGNORECASE)
+
+# Navigation and meta links on law index pages (matched against lowercased href)
+_SKIPPED_HREF_MARKERS = ("index", "gesamt", "pdf", "xml", "epub", "bjnr")
+
+
+@dataclass(slots=True)
 class LawInfo:
     """Information about a law discovered from the index."""
 
@@ -34,7 +66,7 @@ class LawInfo:
     url: str  # e.g., "https://www.gesetze-im-internet.de/bgb/"
 
 
-@dataclass
+@dataclass(slots=True)
 class NormInfo:
     """Information about a norm (§/Art) within a law."""
 
@@ -43,7 +75,7 @@ class NormInfo:
     url: str  # Full URL to the norm HTML page
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryResult:
     """Result of the discovery process."""
 
@@ -52,6 +84,19 @@ class DiscoveryResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _unseen_laws(laws: Iterable[LawInfo], seen_urls: set[str]) -> Iterator[LawInfo]:
+    """Yield the laws whose index URL is not in ``seen_urls``, marking them seen.
+
+    A law listed on more than one letter page (or twice on one page) would
+    otherwise have its index page fetched and its norms emitted once per
+    listing.
+    """
+    for law in laws:
+        if law.url not in seen_urls:
+            seen_urls.add(law.url)
+            yield law
+
+
 class GermanLawDiscovery:
     """Discover all German federal laws and norms from HTML pages.
 
@@ -66,6 +111,13 @@ class GermanLawDiscovery:
         >>> print(f"Found {len(norms)} norms in {laws[0].abbreviation}")
     """
 
+    # Link selectors for the letter and law index parsers. Suffix matching
+    # runs in Lexbor's C matcher, so navigation, PDF and external anchors
+    # never reach the Python loops (``i``: case-insensitive, like the
+    # lowercased regex check that follows)
+    LAW_LINK_SELECTOR: ClassVar[str] = 'a[href$="/index.html" i]'
+    NORM_LINK_SELECTOR: ClassVar[str] = 'a[href$=".html"]'
+
     # Letter pages for the alphabetical index
     ALPHABET_PAGES: ClassVar[list[str]] = [
         "Teilliste_A.html",
@@ -109,22 +161,190 @@ class GermanLawDiscovery:
         self,
         user_agent: str = "LegalMCP/0.0.0 (Research/Education)",
         base_url: str = BASE_URL,
+        cache: DiskHttpCache | None = None,
+        client: httpx.Client | None = None,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         """Initialize the discovery service.
 
         Args:
             user_agent: User agent string for HTTP requests
             base_url: Base URL for gesetze-im-internet.de
+            cache: Optional on-disk page cache. If omitted and the
+                LEGAL_MCP_CACHE env var is set, pages are cached in
+                ``.discovery_cache`` for an hour and revalidated via
+                ETag/Last-Modified afterwards.
+            client: Optional shared ``httpx.Client`` for sync fetches. If
+                omitted, a pooled HTTP/2 keep-alive client is created on first
+                use and closed by :meth:`close`.
+            rate_limiter: Optional token bucket acquired before every network
+                request (cache hits are free); pass the loaders' bucket to
+                pace discovery and loading together.
         """
         self.user_agent = user_agent
         self.base_url = base_url
+        self._client = client
+        self._owns_client = client is None
+        # Guards lazy creation of the owned client; threaded fetches on a
+        # fresh instance would otherwise each build (and leak) their own
+        self._client_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        if cache is None and os.getenv("LEGAL_MCP_CACHE", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        ):
+            cache = DiskHttpCache(DEFAULT_CACHE_DIR)
+        self.cache = cache
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled sync HTTP client, reused across all fetches of this instance."""
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._create_client()
+            return self._client
+
+    @staticmethod
+    def _create_client() -> httpx.Client:
+        """Create the pooled HTTP/2 client owned by this instance."""
+        return httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            # An explicit transport ignores the client's http2/limits
+            # arguments, so they are configured on the transport itself.
+            # HTTP/2 multiplexes all requests to the single host over one
+            # keep-alive TLS connection. Retries cover connection failures
+            # (DNS/connect), not HTTP errors.
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                retries=3,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        with self._client_lock:
+            if self._owns_client and self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> "GermanLawDiscovery":
+        """Use the discovery service as a context manager that closes its client."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the owned HTTP client."""
+        self.close()
 
     def _fetch_html(self, url: str) -> str:
         """Fetch HTML content with proper encoding and headers."""
-        request = Request(url, headers={"User-Agent": self.user_agent})
-        with urlopen(request, timeout=30) as response:
-            # German law pages use ISO-8859-1 encoding
-            return response.read().decode("iso-8859-1")
+        cache = self.cache
+        cached = cache.get(url) if cache is not None else None
+        if cache is not None and cached is not None and cache.is_fresh(cached):
+            return cached.body.decode("iso-8859-1")
+
+        headers = {"User-Agent": self.user_agent}
+        if cached is not None:
+            headers.update(cached.revalidation_headers())
+
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        response = self.client.get(url, headers=headers)
+        if rate_limiter is not None:
+            rate_limiter.record_status(response.status_code)
+        if response.status_code == 304 and cache is not None and cached is not None:
+            body = cache.touch(cached).body
+        else:
+            response.raise_for_status()
+            body = response.content
+            if cache is not None:
+                cache.put(url, body, response.headers)
+
+        # German law pages use ISO-8859-1 encoding
+        return body.decode("iso-8859-1")
+
+    def _fetch_pages(
+        self, urls: Iterable[str], max_workers: int = 1
+    ) -> Iterator[tuple[str, str | Exception]]:
+        """Fetch pages, yielding ``(url, html or error)`` in input order.
+
+        With ``max_workers > 1`` fetches run on a thread pool, so network
+        waits overlap (the shared client is thread-safe); callers still parse
+        each page on their own thread, in order. At most ``2 * max_workers``
+        pages are in flight or waiting to be consumed, so a slow consumer does
+        not pile up every fetched page in memory.
+
+        Args:
+            urls: Page URLs to fetch
+            max_workers: Number of pages fetched concurrently (1 = sequential)
+
+        Yields:
+            Each URL with its decoded HTML, or the exception its fetch raised
+        """
+        if max_workers <= 1:
+            for url in urls:
+                try:
+                    yield url, self._fetch_html(url)
+                except Exception as e:
+                    yield url, e
+            return
+
+        remaining = iter(urls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque[tuple[str, Future[str]]] = deque(
+                (url, executor.submit(self._fetch_html, url))
+                for url in islice(remaining, 2 * max_workers)
+            )
+            while pending:
+                url, future = pending.popleft()
+                # Refill the window before blocking on the oldest fetch
+                for next_url in islice(remaining, 1):
+                    pending.append(
+                        (next_url, executor.submit(self._fetch_html, next_url))
+                    )
+                try:
+                    yield url, future.result()
+                except Exception as e:
+                    yield url, e
+
+    async def _fetch_html_async(self, client: httpx.AsyncClient, url: str) -> str:
+        """Fetch HTML content over a shared async client."""
+        cache = self.cache
+        cached = cache.get(url) if cache is not None else None
+        if cache is not None and cached is not None and cache.is_fresh(cached):
+            return cached.body.decode("iso-8859-1")
+
+        headers = {"User-Agent": self.user_agent}
+        if cached is not None:
+            headers.update(cached.revalidation_headers())
+
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            await asyncio.sleep(rate_limiter.reserve())
+        response = await client.get(url, headers=headers)
+        if rate_limiter is not None:
+            rate_limiter.record_status(response.status_code)
+        if response.status_code == 304 and cache is not None and cached is not None:
+            body = cache.touch(cached).body
+        else:
+            response.raise_for_status()
+            body = response.content
+            if cache is not None:
+                cache.put(url, body, response.headers)
+
+        # German law pages use ISO-8859-1 encoding
+        return body.decode("iso-8859-1")
 
     def _parse_letter_page(self, html_content: str) -> list[LawInfo]:
         """Parse a letter index page to extract law information.
@@ -138,21 +358,16 @@ class GermanLawDiscovery:
         href="./bgb/index.html" text="BGB"
         href="./betrkv/index.html" text="BetrKV"
         """
-        tree = HTMLParser(html_content)
+        tree = LexborHTMLParser(html_content)
         laws: list[LawInfo] = []
 
         # Find all links to law directories
         # Pattern: links that go to ./abbrev/index.html
-        for link in tree.css("a"):
-            href = link.attributes.get("href", "")
+        for link in tree.css(self.LAW_LINK_SELECTOR):
+            href = link.attrs.get("href") or ""
 
-            # Skip non-law links (PDF, external, etc.)
-            if not href or href.startswith("http") or href.endswith(".pdf"):
-                continue
-
-            # Law directory links look like "./bgb/index.html" or "./betrkv/index.html"
             # Pattern: ./abbrev/index.html where abbrev contains lowercase letters, numbers, underscores
-            match = re.match(r"^\./([a-z0-9_]+)/index\.html$", href.lower())
+            match = _LAW_HREF_PATTERN.fullmatch(href.lower())
             if not match:
                 continue
 
@@ -177,7 +392,7 @@ class GermanLawDiscovery:
                 title = ""
 
             # Construct full URL
-            url = urljoin(self.base_url + "/", f"{abbrev_lower}/")
+            url = f"{self.base_url}/{abbrev_lower}/"
 
             laws.append(
                 LawInfo(
@@ -189,10 +404,13 @@ class GermanLawDiscovery:
 
         return laws
 
-    def _parse_law_index_page(
+    def _iter_law_index_page(
         self, html_content: str, law_info: LawInfo
-    ) -> list[NormInfo]:
-        """Parse a law's index page to extract all norm URLs.
+    ) -> Iterator[NormInfo]:
+        """Parse a law's index page, yielding norm URLs as links are visited.
+
+        Norms are streamed to the caller instead of being collected into an
+        intermediate list first.
 
         HTML structure observed:
         - Norms listed as links in a table
@@ -202,23 +420,17 @@ class GermanLawDiscovery:
         Example:
         | § 1 | Betriebskosten |
         """
-        tree = HTMLParser(html_content)
-        norms: list[NormInfo] = []
+        tree = LexborHTMLParser(html_content)
+        is_directory_url = law_info.url.endswith("/")
 
         # Find all links to norm pages
         # Pattern: links ending in .html within the law directory
-        for link in tree.css("a"):
-            href = link.attributes.get("href", "")
-
-            # Skip non-norm links
-            if not href or not href.endswith(".html"):
-                continue
+        for link in tree.css(self.NORM_LINK_SELECTOR):
+            href = link.attrs.get("href") or ""
 
             # Skip navigation and meta links
-            if any(
-                x in href.lower()
-                for x in ["index", "gesamt", "pdf", "xml", "epub", "bjnr"]
-            ):
+            href_lower = href.lower()
+            if any(marker in href_lower for marker in _SKIPPED_HREF_MARKERS):
                 continue
 
             norm_text = link.text(strip=True)
@@ -228,41 +440,42 @@ class GermanLawDiscovery:
                 continue
 
             # Norm identifiers start with § or Art or similar
-            # Also accept numbered entries like "1", "2" for simple laws
-            if not re.match(
-                r"^(§|Art\.?|Artikel|Anlage|\d+)", norm_text, re.IGNORECASE
-            ):
+            if not _NORM_ID_PATTERN.match(norm_text):
                 continue
 
             # Construct full URL
-            url = urljoin(law_info.url, href)
+            if is_directory_url and "/" not in href and ":" not in href:
+                # A bare file name ("__433.html") just extends the directory
+                # URL; skips urljoin's reparse of the base for nearly every link
+                url = law_info.url + href
+            else:
+                url = urljoin(law_info.url, href)
 
-            norms.append(
-                NormInfo(
-                    law_abbreviation=law_info.abbreviation,
-                    norm_id=norm_text,
-                    url=url,
-                )
+            yield NormInfo(
+                law_abbreviation=law_info.abbreviation,
+                norm_id=norm_text,
+                url=url,
             )
 
-        return norms
-
-    def discover_laws(self) -> Iterator[LawInfo]:
+    def discover_laws(self, max_workers: int = 1) -> Iterator[LawInfo]:
         """Discover all laws from the alphabetical index.
 
+        Args:
+            max_workers: Number of letter pages fetched concurrently
+                (1 = sequential). With more workers, pages ahead of the
+                consumer are already requested if iteration stops early.
+
         Yields:
-            LawInfo objects for each discovered law
+            LawInfo objects for each discovered law, once per index URL
         """
-        for page in self.ALPHABET_PAGES:
-            url = urljoin(self.base_url + "/", page)
-            try:
-                html_content = self._fetch_html(url)
-                laws = self._parse_letter_page(html_content)
-                yield from laws
-            except Exception as e:
+        urls = [f"{self.base_url}/{page}" for page in self.ALPHABET_PAGES]
+        seen_urls: set[str] = set()
+        for url, html_content in self._fetch_pages(urls, max_workers):
+            if isinstance(html_content, Exception):
                 # Log error but continue with other pages
-                print(f"Error fetching {url}: {e}")
+                logger.warning("Error fetching %s: %s", url, html_content)
                 continue
+            yield from _unseen_laws(self._parse_letter_page(html_content), seen_urls)
 
     def discover_norms(self, law: LawInfo) -> Iterator[NormInfo]:
         """Discover all norms within a specific law.
@@ -275,43 +488,174 @@ class GermanLawDiscovery:
         """
         try:
             html_content = self._fetch_html(law.url)
-            norms = self._parse_law_index_page(html_content, law)
-            yield from norms
+            yield from self._iter_law_index_page(html_content, law)
         except Exception as e:
-            print(f"Error fetching {law.url}: {e}")
+            logger.warning("Error fetching %s: %s", law.url, e)
+
+    def iter_discovery(
+        self,
+        max_laws: int | None = None,
+        max_workers: int = 1,
+        errors: list[str] | None = None,
+    ) -> Iterator[tuple[LawInfo, NormInfo]]:
+        """Stream ``(law, norm)`` pairs as each law index page is parsed.
+
+        Unlike :meth:`discover_all`, norms are never collected into one list,
+        so callers (e.g. ingestion) can start on the first law's norms while
+        later index pages are still being fetched. Law index pages are
+        requested as soon as their letter page is parsed, not after the whole
+        alphabet.
+
+        Args:
+            max_laws: Optional limit on number of laws to process (for testing)
+            max_workers: Number of pages fetched concurrently (1 = sequential)
+            errors: Optional list that index-page fetch errors are appended to
+
+        Yields:
+            Each discovered norm with its law, in law order
+        """
+        laws = islice(self.discover_laws(max_workers), max_laws or None)
+        yield from self._iter_norms(laws, max_workers, errors)
+
+    def _iter_norms(
+        self,
+        laws: Iterable[LawInfo],
+        max_workers: int,
+        errors: list[str] | None,
+    ) -> Iterator[tuple[LawInfo, NormInfo]]:
+        """Fetch and parse the index pages of ``laws``, in law order.
+
+        ``laws`` is consumed lazily: the fetch window pulls the next law (and
+        with it, the next letter page) while earlier index pages are parsed.
+        """
+        # Laws whose index page was requested but not yet consumed; pages come
+        # back in request order, so the oldest entry belongs to the next page
+        requested: deque[LawInfo] = deque()
+
+        def index_urls() -> Iterator[str]:
+            for law in laws:
+                requested.append(law)
+                yield law.url
+
+        for _, page in self._fetch_pages(index_urls(), max_workers):
+            law = requested.popleft()
+            if isinstance(page, Exception):
+                if errors is not None:
+                    errors.append(
+                        f"Error discovering norms for {law.abbreviation}: {page}"
+                    )
+                continue
+            for norm in self._iter_law_index_page(page, law):
+                yield law, norm
 
-    def discover_all(self, max_laws: int | None = None) -> DiscoveryResult:
+    def discover_all(
+        self, max_laws: int | None = None, max_workers: int = 1
+    ) -> DiscoveryResult:
         """Discover all laws and their norms.
 
+        Letter and law index pages are fetched on up to ``max_workers``
+        threads each, and index pages of early letters are prefetched while
+        later letter pages are still loading. Parsing stays on the calling
+        thread and in law order, so the result does not depend on the worker
+        count.
+
+        Args:
+            max_laws: Optional limit on number of laws to process (for testing)
+            max_workers: Number of pages fetched concurrently (1 = sequential)
+
+        Returns:
+            DiscoveryResult with discovered laws, norms and fetch errors
+        """
+        result = DiscoveryResult()
+
+        # Laws are recorded as their index pages are requested, so letter
+        # and index page fetches overlap instead of running as two phases
+        def record_laws() -> Iterator[LawInfo]:
+            for law in islice(self.discover_laws(max_workers), max_laws or None):
+                result.laws.append(law)
+                yield law
+
+        result.norms = [
+            norm
+            for _, norm in self._iter_norms(record_laws(), max_workers, result.errors)
+        ]
+
+        return result
+
+    async def discover_all_async(
+        self,
+        max_laws: int | None = None,
+        max_concurrent_requests: int = 20,
+        client: httpx.AsyncClient | None = None,
+    ) -> DiscoveryResult:
+        """Discover all laws and their norms with concurrent fetches.
+
+        Same result as :meth:`discover_all`, but letter pages and law index
+        pages are fetched concurrently over one HTTP/2 connection pool, bounded
+        by a semaphore. Discovery is dominated by round-trip latency, so wall
+        time drops roughly with the concurrency level. All letter pages are
+        fetched up front, even when ``max_laws`` is set.
+
         Args:
             max_laws: Optional limit on number of laws to process (for testing)
+            max_concurrent_requests: Maximum number of requests in flight
+            client: Optional shared ``httpx.AsyncClient`` (created if omitted)
 
         Returns:
-            DiscoveryResult with all discovered laws for norms
+            DiscoveryResult with discovered laws, norms and fetch errors
         """
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=max_concurrent_requests,
+                max_keepalive_connections=max_concurrent_requests,
+            )
+            async with httpx.AsyncClient(
+                http2=True, limits=limits, timeout=30.0, follow_redirects=True
+            ) as owned_client:
+                return await self.discover_all_async(
+                    max_laws, max_concurrent_requests, owned_client
+                )
+
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        async def fetch(url: str) -> str:
+            async with semaphore:
+                return await self._fetch_html_async(client, url)
+
         result = DiscoveryResult()
 
-        # First, discover all laws
-        for law_count, law in enumerate(self.discover_laws(), 1):
-            result.laws.append(law)
-            if max_laws and law_count >= max_laws:
-                break
+        # First, discover all laws (letter pages in alphabet order)
+        letter_urls = [f"{self.base_url}/{page}" for page in self.ALPHABET_PAGES]
+        letter_pages = await asyncio.gather(
+            *(fetch(url) for url in letter_urls), return_exceptions=True
+        )
+        seen_urls: set[str] = set()
+        for url, page in zip(letter_urls, letter_pages, strict=True):
+            if isinstance(page, BaseException):
+                result.errors.append(f"Error fetching {url}: {page}")
+                continue
+            result.laws.extend(_unseen_laws(self._parse_letter_page(page), seen_urls))
+        if max_laws:
+            del result.laws[max_laws:]
 
         # Then, discover norms for each law
-        for law in result.laws:
-            try:
-                for norm in self.discover_norms(law):
-                    result.norms.append(norm)
-            except Exception as e:
+        index_pages = await asyncio.gather(
+            *(fetch(law.url) for law in result.laws), return_exceptions=True
+        )
+        for law, page in zip(result.laws, index_pages, strict=True):
+            if isinstance(page, BaseException):
                 result.errors.append(
-                    f"Error discovering norms for {law.abbreviation}: {e}"
+                    f"Error discovering norms for {law.abbreviation}: {page}"
                 )
+                continue
+            result.norms.extend(self._iter_law_index_page(page, law))
 
         return result
 
 
-# NOTE: Async HTTP discovery was removed in favor of using mcp-refcache's
-# job/async_timeout feature. For long-running discovery operations:
+# NOTE: MCP tools do not call the async discovery directly; they rely on
+# mcp-refcache's job/async_timeout feature instead (GermanLawDiscovery.
+# discover_all_async is meant for scripts). For long-running discovery operations:
 #
 # 1. Use @cache.cached(async_timeout=5.0) decorator on the MCP tool
 # 2. The sync discovery runs in background via MemoryTaskBackend
@@ -356,5 +700,7 @@ def discover_laws_sync(max_laws: int | None = None) -> DiscoveryResult:
         ...     result = discover_laws_sync()
         ...     return {"laws": len(result.laws), "norms": len(result.norms)}
     """
-    discovery = GermanLawDiscovery()
-    return discovery.discover_all(max_laws=max_laws)
+    with GermanLawDiscovery() as discovery:
+        return discovery.discover_all(
+            max_laws=max_laws, max_workers=DEFAULT_MAX_WORKERS
+        )
@@ -5,24 +5,48 @@ into LangChain Document objects with rich metadata.
 
 Supports Tor SOCKS proxy for IP rotation to avoid rate limiting.
 Set USE_TOR=true environment variable to enable.
+
+Set LEGAL_MCP_CACHE=true to keep fetched pages in ``.law_html_cache/``; law
+pages are effectively static, so repeat runs skip the network entirely.
 """
 
+import asyncio
+import logging
 import os
 import time
-from collections.abc import Iterator
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, build_opener, urlopen
+from urllib.request import OpenerDirector, Request, build_opener, urlopen
 
+import httpx
 import socks
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from sockshandler import SocksiPyHandler
 
+from legal_mcp.net.http_cache import (
+    ACCEPT_ENCODING,
+    CachedPage,
+    DiskHttpCache,
+    decode_content,
+)
+from legal_mcp.net.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".law_html_cache")
+# Norm pages change only with amendments; a day-old copy is fine for ingestion
+DEFAULT_CACHE_TTL_SECONDS = 86400.0
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GermanLawNorm:
     """Represents a parsed German law norm (§/Art)."""
 
@@ -34,6 +58,67 @@ class GermanLawNorm:
     url: str
 
 
+@dataclass(slots=True)
+class _ParseState:
+    """Fields collected while visiting the matched elements of one page."""
+
+    law_title: str | None = None
+    norm_id: str | None = None
+    norm_title: str | None = None
+    paragraphs: list[str] = field(default_factory=list)
+
+
+def _set_law_title(state: _ParseState, node: LexborNode) -> None:
+    """Keep the first <h1> text as the law title."""
+    if state.law_title is None:
+        state.law_title = node.text(strip=True)
+
+
+def _set_norm_id(state: _ParseState, node: LexborNode) -> None:
+    """Keep the first jnenbez span as the norm identifier."""
+    if state.norm_id is None:
+        state.norm_id = node.text(strip=True)
+
+
+def _set_norm_title(state: _ParseState, node: LexborNode) -> None:
+    """Keep the first jnentitel span as the norm title."""
+    if state.norm_title is None:
+        state.norm_title = node.text(strip=True)
+
+
+def _append_paragraph(state: _ParseState, node: LexborNode) -> None:
+    """Collect each jurAbsatz div as one paragraph (Absatz)."""
+    state.paragraphs.append(node.text(strip=True))
+
+
+# (tag, class attribute) -> field handler for every element _parse_html reads
+# besides the <h1> law title
+_FIELD_HANDLERS: dict[
+    tuple[str, str | None], Callable[[_ParseState, LexborNode], None]
+] = {
+    ("span", "jnenbez"): _set_norm_id,
+    ("span", "jnentitel"): _set_norm_title,
+    ("div", "jurAbsatz"): _append_paragraph,
+}
+# Only these tags can carry a field; all other nodes skip the class lookup
+_FIELD_TAGS = frozenset(tag for tag, _ in _FIELD_HANDLERS)
+
+
+def build_tor_opener(
+    tor_host: str = "127.0.0.1", tor_port: int = 9050
+) -> OpenerDirector:
+    """Build a urllib opener that routes requests through a Tor SOCKS5 proxy.
+
+    Args:
+        tor_host: Tor SOCKS proxy host
+        tor_port: Tor SOCKS proxy port
+
+    Returns:
+        Opener that can be shared by many loaders (and threads)
+    """
+    return build_opener(SocksiPyHandler(socks.SOCKS5, tor_host, tor_port))
+
+
 class GermanLawHTMLLoader(BaseLoader):
     """Load German federal law HTML pages from gesetze-im-internet.de.
 
@@ -54,6 +139,11 @@ class GermanLawHTMLLoader(BaseLoader):
         >>> documents = loader.load()
         >>> len(documents)  # One doc per paragraph + one for full norm
         3
+
+        >>> # Bulk loads: share one pooled HTTP/2 client across loaders
+        >>> with httpx.Client(http2=True) as client:
+        ...     loader = GermanLawHTMLLoader(url, "BGB", client=client)
+        ...     documents = loader.load()
     """
 
     def __init__(
@@ -65,6 +155,11 @@ class GermanLawHTMLLoader(BaseLoader):
         use_tor: bool | None = None,
         tor_host: str = "127.0.0.1",
         tor_port: int = 9050,
+        client: httpx.Client | None = None,
+        cache: DiskHttpCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        opener: OpenerDirector | None = None,
+        min_split_chars: int = 0,
     ) -> None:
         """Initialize the loader.
 
@@ -76,6 +171,24 @@ class GermanLawHTMLLoader(BaseLoader):
             use_tor: Use Tor SOCKS proxy (default: from USE_TOR env var)
             tor_host: Tor SOCKS proxy host
             tor_port: Tor SOCKS proxy port
+            client: Optional shared ``httpx.Client`` (e.g. ``http2=True``) so
+                many loaders reuse pooled/multiplexed connections. Takes
+                precedence over the Tor opener; configure proxies on the
+                client itself if needed.
+            cache: Optional on-disk page cache. If omitted and the
+                LEGAL_MCP_CACHE env var is set, pages are cached in
+                ``.law_html_cache`` for a day.
+            rate_limiter: Optional token bucket acquired before every request
+                attempt. Share one bucket across loaders to pace a crawl; it
+                slows down on 429/503 answers and recovers on success.
+            opener: Optional shared urllib opener (see
+                :func:`build_tor_opener`). If omitted and Tor is enabled, one
+                is built on the first fetch and reused by later fetches.
+            min_split_chars: Norms whose full text is shorter than this are
+                emitted as the norm-level Document only. Short paragraphs add
+                little over their norm but cost one embedding each. The
+                default of 0 keeps a Document per paragraph for every
+                multi-paragraph norm.
         """
         self.url = url
         self.law_abbrev = law_abbrev
@@ -88,11 +201,26 @@ class GermanLawHTMLLoader(BaseLoader):
         )
         self.tor_host = tor_host
         self.tor_port = tor_port
+        self.client = client
+        if cache is None and os.getenv("LEGAL_MCP_CACHE", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        ):
+            cache = DiskHttpCache(
+                DEFAULT_CACHE_DIR, ttl_seconds=DEFAULT_CACHE_TTL_SECONDS
+            )
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.opener = opener
+        self.min_split_chars = min_split_chars
 
     def _fetch_html(self, max_retries: int = 5, base_delay: float = 0.5) -> str:
         """Fetch HTML content with proper encoding, headers, and retries.
 
-        Supports Tor SOCKS proxy for IP rotation when USE_TOR=true.
+        Supports Tor SOCKS proxy for IP rotation when USE_TOR=true. Fresh
+        entries in :attr:`cache` are served without a request; stale ones are
+        revalidated with a conditional GET and reused on ``304 Not Modified``.
 
         Args:
             max_retries: Maximum number of retry attempts
@@ -104,34 +232,97 @@ class GermanLawHTMLLoader(BaseLoader):
         Raises:
             URLError: If all retries fail
         """
-        request = Request(
-            self.url,
-            headers={
-                "User-Agent": self.user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "de,en-US;q=0.7,en;q=0.3",
-                "Accept-Encoding": "identity",
-                "Connection": "keep-alive",
-            },
-        )
-        last_error: Exception | None = None
+        cached = self._cached_page()
+        if (
+            cached is not None
+            and self.cache is not None
+            and self.cache.is_fresh(cached)
+        ):
+            return cached.body.decode("iso-8859-1")
+
+        downloaded = self._download(max_retries, base_delay, cached)
+        return self._store_download(downloaded, cached)
+
+    def _cached_page(self) -> CachedPage | None:
+        """Return the cached entry for :attr:`url` (fresh or stale), if any."""
+        return self.cache.get(self.url) if self.cache is not None else None
+
+    def _store_download(
+        self,
+        downloaded: tuple[bytes, Mapping[str, str]] | None,
+        cached: CachedPage | None,
+    ) -> str:
+        """Cache a download (or refresh ``cached`` on a 304) and decode it."""
+        if downloaded is None:
+            # 304 Not Modified only answers a conditional GET for ``cached``
+            if cached is None or self.cache is None:
+                raise URLError(f"Unexpected 304 Not Modified for {self.url}")
+            return self.cache.touch(cached).body.decode("iso-8859-1")
+
+        body, response_headers = downloaded
+        if self.cache is not None:
+            self.cache.put(self.url, body, response_headers)
+        return body.decode("iso-8859-1")
+
+    def _request_headers(self, cached: CachedPage | None = None) -> dict[str, str]:
+        """Browser-like request headers sent with every page request.
 
-        # Create opener - use SOCKS handler for Tor, default for regular requests
-        if self.use_tor:
-            opener = build_opener(
-                SocksiPyHandler(socks.SOCKS5, self.tor_host, self.tor_port)
+        Args:
+            cached: Stale cache entry whose validators make the request
+                conditional (``If-None-Match``/``If-Modified-Since``)
+        """
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "de,en-US;q=0.7,en;q=0.3",
+            # Law pages compress 4-6x; decode_content undoes it on the urllib
+            # paths and httpx decodes it itself
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        }
+        if cached is not None:
+            headers.update(cached.revalidation_headers())
+        return headers
+
+    def _download(
+        self, max_retries: int, base_delay: float, cached: CachedPage | None = None
+    ) -> tuple[bytes, Mapping[str, str]] | None:
+        """Download the raw page bytes and response headers with retries.
+
+        Returns:
+            Body and response headers, or None if the server answered a
+            conditional request for ``cached`` with ``304 Not Modified``
+
+        Raises:
+            URLError: If all retries fail
+        """
+        headers = self._request_headers(cached)
+        if self.client is not None:
+            return self._fetch_html_with_client(
+                self.client, headers, max_retries, base_delay, cached
             )
-        else:
-            opener = None  # Use default urlopen
 
+        request = Request(self.url, headers=headers)
+        last_error: Exception | None = None
+
+        # SOCKS opener for Tor (built once per loader unless injected),
+        # default urlopen for regular requests
+        if self.opener is None and self.use_tor:
+            self.opener = build_tor_opener(self.tor_host, self.tor_port)
+        open_url = self.opener.open if self.opener is not None else urlopen
+
+        rate_limiter = self.rate_limiter
         for attempt in range(max_retries):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
             try:
-                if opener:
-                    with opener.open(request, timeout=30) as response:
-                        return response.read().decode("iso-8859-1")
-                else:
-                    with urlopen(request, timeout=30) as response:
-                        return response.read().decode("iso-8859-1")
+                with open_url(request, timeout=30) as response:
+                    body = decode_content(
+                        response.read(), response.headers.get("Content-Encoding")
+                    )
+                    if rate_limiter is not None:
+                        rate_limiter.record_success()
+                    return body, response.headers
 
             except (
                 HTTPError,
@@ -140,6 +331,12 @@ class GermanLawHTMLLoader(BaseLoader):
                 TimeoutError,
                 OSError,
             ) as e:
+                if isinstance(e, HTTPError):
+                    if rate_limiter is not None:
+                        rate_limiter.record_status(e.code)
+                    # urllib raises for 304; it answers our conditional GET
+                    if e.code == 304 and cached is not None:
+                        return None
                 last_error = e
                 if attempt < max_retries - 1:
                     delay = base_delay * (2**attempt)
@@ -147,40 +344,140 @@ class GermanLawHTMLLoader(BaseLoader):
 
         raise URLError(f"Failed after {max_retries} attempts: {last_error}")
 
-    def _parse_html(self, html_content: str) -> GermanLawNorm:
-        """Parse German law HTML into structured data.
+    def _fetch_html_with_client(
+        self,
+        client: httpx.Client,
+        headers: dict[str, str],
+        max_retries: int,
+        base_delay: float,
+        cached: CachedPage | None = None,
+    ) -> tuple[bytes, Mapping[str, str]] | None:
+        """Fetch page bytes through a shared ``httpx.Client`` with retries.
+
+        Returns:
+            Body and response headers, or None on ``304 Not Modified`` for
+            ``cached``
+
+        Raises:
+            URLError: If all retries fail (same contract as the urllib path)
+        """
+        # HTTP/2 forbids connection-specific headers; the pool manages reuse.
+        request_headers = {
+            key: value for key, value in headers.items() if key != "Connection"
+        }
+        last_error: Exception | None = None
+
+        rate_limiter = self.rate_limiter
+        for attempt in range(max_retries):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                response = client.get(self.url, headers=request_headers)
+                if rate_limiter is not None:
+                    rate_limiter.record_status(response.status_code)
+                if response.status_code == 304 and cached is not None:
+                    return None
+                response.raise_for_status()
+                return response.content, response.headers
+            except (httpx.HTTPError, OSError) as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    delay = base_delay * (2**attempt)
+                    time.sleep(delay)
+
+        raise URLError(f"Failed after {max_retries} attempts: {last_error}")
+
+    async def _afetch_html(
+        self,
+        client: httpx.AsyncClient,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+    ) -> str:
+        """Async :meth:`_fetch_html` over a shared ``httpx.AsyncClient``.
 
         Args:
-            html_content: Raw HTML content
+            client: Shared async client (e.g. ``http2=True``), so concurrent
+                loads are multiplexed over a few pooled connections
+            max_retries: Maximum number of retry attempts
+            base_delay: Base delay in seconds (doubles with each retry)
 
         Returns:
-            GermanLawNorm with extracted fields
+            HTML content as string
+
+        Raises:
+            URLError: If all retries fail
         """
-        tree = HTMLParser(html_content)
+        cached = self._cached_page()
+        if (
+            cached is not None
+            and self.cache is not None
+            and self.cache.is_fresh(cached)
+        ):
+            return cached.body.decode("iso-8859-1")
+
+        # HTTP/2 forbids connection-specific headers; the pool manages reuse.
+        request_headers = {
+            key: value
+            for key, value in self._request_headers(cached).items()
+            if key != "Connection"
+        }
+        rate_limiter = self.rate_limiter
+        last_error: Exception | None = None
+
+        for attempt in range(max_retries):
+            if rate_limiter is not None:
+                await asyncio.sleep(rate_limiter.reserve())
+            try:
+                response = await client.get(self.url, headers=request_headers)
+                if rate_limiter is not None:
+                    rate_limiter.record_status(response.status_code)
+                if response.status_code == 304 and cached is not None:
+                    return self._store_download(None, cached)
+                response.raise_for_status()
+            except (httpx.HTTPError, OSError) as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(base_delay * (2**attempt))
+                continue
 
-        # Extract law title (h1)
-        h1 = tree.css_first("h1")
-        law_title = h1.text(strip=True) if h1 else ""
+            return self._store_download((response.content, response.headers), cached)
 
-        # Extract norm identifier (§ 433, Art 1, etc.)
-        norm_id_elem = tree.css_first("span.jnenbez")
-        norm_id = norm_id_elem.text(strip=True) if norm_id_elem else ""
+        raise URLError(f"Failed after {max_retries} attempts: {last_error}")
 
-        # Extract norm title (optional)
-        norm_title_elem = tree.css_first("span.jnentitel")
-        norm_title = norm_title_elem.text(strip=True) if norm_title_elem else ""
+    def _parse_html(self, html_content: str) -> GermanLawNorm:
+        """Parse German law HTML into structured data.
 
-        # Extract all paragraphs (Absätze)
-        paragraph_elements = tree.css("div.jurAbsatz")
-        paragraphs = [elem.text(strip=True) for elem in paragraph_elements]
+        Args:
+            html_content: Raw HTML content
 
+        Returns:
+            GermanLawNorm with extracted fields
+        """
+        tree = LexborHTMLParser(html_content)
+
+        # One document-order walk over the body's elements fills all four
+        # fields; it beats a css() selector pass, whose matching walks the
+        # tree too and then materializes a node list. Candidates are
+        # dispatched on (tag, class) with a single dict hit.
+        state = _ParseState()
+        root = tree.body if tree.body is not None else tree.root
+        for node in root.traverse() if root is not None else ():
+            tag = node.tag
+            if tag == "h1":
+                _set_law_title(state, node)
+            elif tag in _FIELD_TAGS:
+                handler = _FIELD_HANDLERS.get((tag, node.attributes.get("class")))
+                if handler is not None:
+                    handler(state, node)
+
+        paragraphs = state.paragraphs
         # Combine all paragraphs into full text
         full_text = "\n\n".join(paragraphs)
 
         return GermanLawNorm(
-            law_title=law_title,
-            norm_id=norm_id,
-            norm_title=norm_title,
+            law_title=state.law_title or "",
+            norm_id=state.norm_id or "",
+            norm_title=state.norm_title or "",
             paragraphs=paragraphs,
             full_text=full_text,
             url=self.url,
@@ -191,7 +488,8 @@ class GermanLawHTMLLoader(BaseLoader):
 
         Creates documents at two levels:
         1. Full norm (all paragraphs combined)
-        2. Individual paragraphs (for large norms)
+        2. Individual paragraphs (for norms with several paragraphs and at
+           least ``min_split_chars`` characters)
 
         Args:
             norm: Parsed German law norm
@@ -201,6 +499,11 @@ class GermanLawHTMLLoader(BaseLoader):
         """
         documents: list[Document] = []
 
+        # Stable id of the norm document, e.g. "bgb_para_433"; computed once and
+        # reused as every paragraph's parent id and id prefix
+        norm_slug = norm.norm_id.replace("§", "para").replace(" ", "_").lower()
+        norm_doc_id = f"{self.law_abbrev.lower()}_{norm_slug}"
+
         # Base metadata shared by all documents
         base_metadata: dict[str, Any] = {
             "jurisdiction": self.jurisdiction,
@@ -218,24 +521,25 @@ class GermanLawHTMLLoader(BaseLoader):
             metadata={
                 **base_metadata,
                 "level": "norm",
-                "doc_id": f"{self.law_abbrev.lower()}_{norm.norm_id.replace('§', 'para').replace(' ', '_').lower()}",
+                "doc_id": norm_doc_id,
                 "paragraph_count": len(norm.paragraphs),
             },
         )
         documents.append(norm_doc)
 
         # Documents 2+: Individual paragraphs (for fine-grained retrieval)
-        # Only create if there are multiple paragraphs
-        if len(norm.paragraphs) > 1:
+        # Only create if there are multiple paragraphs and the norm is long
+        # enough for them to differ meaningfully from the norm document
+        if len(norm.paragraphs) > 1 and len(norm.full_text) >= self.min_split_chars:
             for i, paragraph_text in enumerate(norm.paragraphs, 1):
                 para_doc = Document(
                     page_content=paragraph_text,
                     metadata={
                         **base_metadata,
                         "level": "paragraph",
-                        "doc_id": f"{self.law_abbrev.lower()}_{norm.norm_id.replace('§', 'para').replace(' ', '_').lower()}_abs_{i}",
+                        "doc_id": f"{norm_doc_id}_abs_{i}",
                         "paragraph_index": i,
-                        "parent_norm_id": f"{self.law_abbrev.lower()}_{norm.norm_id.replace('§', 'para').replace(' ', '_').lower()}",
+                        "parent_norm_id": norm_doc_id,
                     },
                 )
                 documents.append(para_doc)
@@ -253,6 +557,20 @@ class GermanLawHTMLLoader(BaseLoader):
             Exception: If parsing fails
         """
         html_content = self._fetch_html()
+        return self.load_from_html(html_content)
+
+    def load_from_html(self, html_content: str) -> list[Document]:
+        """Parse already-fetched HTML for ``self.url`` into LangChain Documents.
+
+        Lets callers that do their own (e.g. async) fetching reuse the
+        parsing and document-building logic without a second request.
+
+        Args:
+            html_content: Decoded HTML of the norm page
+
+        Returns:
+            List of Document objects (1 norm + N paragraphs)
+        """
         norm = self._parse_html(html_content)
         return self._create_documents(norm)
 
@@ -269,15 +587,22 @@ class GermanLawBulkHTMLLoader(BaseLoader):
     """Load multiple German law norms from a list of URLs.
 
     Efficiently loads and parses multiple law pages, yielding Documents
-    as they are parsed (for streaming ingestion).
+    as they are parsed (for streaming ingestion). With ``max_workers > 1``
+    pages are fetched concurrently on a thread pool (the work is dominated by
+    network round trips); documents are still yielded in URL order. Without
+    an injected ``client`` (and with Tor off) one pooled HTTP/2 client is
+    opened per load and shared by every page. Async callers get the same over
+    one ``httpx.AsyncClient`` via :meth:`alazy_load`/``aload``, with up to
+    ``max_workers`` requests multiplexed at once and no threads.
 
     Example:
         >>> urls = [
         ...     ("BGB", "https://www.gesetze-im-internet.de/bgb/__433.html"),
         ...     ("BGB", "https://www.gesetze-im-internet.de/bgb/__434.html"),
         ... ]
-        >>> loader = GermanLawBulkHTMLLoader(urls)
+        >>> loader = GermanLawBulkHTMLLoader(urls, max_workers=8)
         >>> documents = list(loader.lazy_load())
+        >>> documents = await loader.aload()  # Async, one HTTP/2 client
     """
 
     def __init__(
@@ -285,6 +610,11 @@ class GermanLawBulkHTMLLoader(BaseLoader):
         urls: list[tuple[str, str]],
         jurisdiction: str = "de-federal",
         user_agent: str = "LegalMCP/0.0.0 (Research/Education)",
+        max_workers: int = 1,
+        client: httpx.Client | None = None,
+        cache: DiskHttpCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        min_split_chars: int = 0,
     ) -> None:
         """Initialize the bulk loader.
 
@@ -292,30 +622,187 @@ class GermanLawBulkHTMLLoader(BaseLoader):
             urls: List of (law_abbrev, url) tuples
             jurisdiction: Legal jurisdiction (default: "de-federal")
             user_agent: User agent string for HTTP requests
+            max_workers: Number of pages fetched concurrently (1 = sequential)
+            client: Optional shared ``httpx.Client`` passed to every loader.
+                If omitted, each load opens (and closes) its own pooled client
+                unless USE_TOR is set.
+            cache: Optional on-disk page cache passed to every loader
+            rate_limiter: Optional token bucket shared by every loader, so
+                the whole crawl (all workers) stays within one request rate
+            min_split_chars: Passed to every loader; shorter norms get no
+                per-paragraph Documents (0 = always split)
         """
         self.urls = urls
         self.jurisdiction = jurisdiction
         self.user_agent = user_agent
+        self.max_workers = max_workers
+        self.client = client
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.min_split_chars = min_split_chars
+
+    def _make_loader(
+        self,
+        law_abbrev: str,
+        url: str,
+        client: httpx.Client | None = None,
+        opener: OpenerDirector | None = None,
+    ) -> GermanLawHTMLLoader:
+        """Create the single-page loader for one URL with the shared settings."""
+        return GermanLawHTMLLoader(
+            url=url,
+            law_abbrev=law_abbrev,
+            jurisdiction=self.jurisdiction,
+            user_agent=self.user_agent,
+            client=client,
+            cache=self.cache,
+            rate_limiter=self.rate_limiter,
+            opener=opener,
+            min_split_chars=self.min_split_chars,
+        )
+
+    def _load_url(
+        self,
+        law_abbrev: str,
+        url: str,
+        client: httpx.Client | None,
+        opener: OpenerDirector | None = None,
+    ) -> list[Document]:
+        """Load one URL, logging and skipping it on failure."""
+        loader = self._make_loader(law_abbrev, url, client, opener)
+        try:
+            return loader.load()
+        except Exception as e:
+            # Log error but continue processing other URLs
+            logger.warning("Error loading %s: %s", url, e)
+            return []
+
+    async def _aload_url(
+        self, law_abbrev: str, url: str, client: httpx.AsyncClient
+    ) -> list[Document]:
+        """Async :meth:`_load_url` over a shared ``httpx.AsyncClient``."""
+        loader = self._make_loader(law_abbrev, url)
+        try:
+            return loader.load_from_html(await loader._afetch_html(client))
+        except Exception as e:
+            # Log error but continue processing other URLs
+            logger.warning("Error loading %s: %s", url, e)
+            return []
 
     def lazy_load(self) -> Iterator[Document]:
         """Lazily load documents from all URLs.
 
         Yields:
-            Document objects as they are parsed
+            Document objects as they are parsed, in URL order
+        """
+        if self.client is not None:
+            yield from self._load_all(self.client)
+            return
+
+        if os.getenv("USE_TOR", "").lower() in ("true", "1", "yes"):
+            # Tor fetches go through urllib instead; one SOCKS opener serves
+            # every loader of this load
+            yield from self._load_all(None, build_tor_opener())
+            return
+
+        # All pages live on one host: keep-alive connections (multiplexed
+        # over HTTP/2) save a TCP+TLS handshake per page
+        pool_size = max(self.max_workers, 1)
+        with httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+        ) as client:
+            yield from self._load_all(client)
+
+    def _load_all(
+        self, client: httpx.Client | None, opener: OpenerDirector | None = None
+    ) -> Iterator[Document]:
+        """Load every URL through ``client`` (or ``opener``), in URL order.
+
+        At most ``2 * max_workers`` pages are in flight or waiting to be
+        consumed. If the consumer stops early, queued pages are cancelled so
+        leaving the pool only waits for the fetches already running.
         """
-        for law_abbrev, url in self.urls:
-            loader = GermanLawHTMLLoader(
-                url=url,
-                law_abbrev=law_abbrev,
-                jurisdiction=self.jurisdiction,
-                user_agent=self.user_agent,
+        if self.max_workers <= 1:
+            for law_abbrev, url in self.urls:
+                yield from self._load_url(law_abbrev, url, client, opener)
+            return
+
+        remaining = iter(self.urls)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: deque[Future[list[Document]]] = deque(
+                executor.submit(self._load_url, law_abbrev, url, client, opener)
+                for law_abbrev, url in islice(remaining, 2 * self.max_workers)
             )
             try:
-                yield from loader.lazy_load()
-            except Exception as e:
-                # Log error but continue processing other URLs
-                print(f"Error loading {url}: {e}")
-                continue
+                while pending:
+                    future = pending.popleft()
+                    # Refill the window before blocking on the oldest page
+                    for law_abbrev, url in islice(remaining, 1):
+                        pending.append(
+                            executor.submit(
+                                self._load_url, law_abbrev, url, client, opener
+                            )
+                        )
+                    yield from future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Asynchronously load documents from all URLs.
+
+        Pages are fetched concurrently over one HTTP/2 ``httpx.AsyncClient``
+        (up to ``max_workers`` requests multiplexed on a small connection
+        pool). An injected sync ``client`` or USE_TOR falls back to running
+        :meth:`lazy_load` on a worker thread.
+
+        Yields:
+            Document objects as they are parsed, in URL order
+        """
+        if self.client is not None or os.getenv("USE_TOR", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        ):
+            async for document in super().alazy_load():
+                yield document
+            return
+
+        pool_size = max(self.max_workers, 1)
+        async with httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+        ) as client:
+            remaining = iter(self.urls)
+            # Keep max_workers pages in flight; results are consumed in URL order
+            pending: deque[asyncio.Task[list[Document]]] = deque(
+                asyncio.ensure_future(self._aload_url(*entry, client))
+                for entry in islice(remaining, pool_size)
+            )
+            try:
+                while pending:
+                    documents = await pending.popleft()
+                    # Start the next page only now, so at most max_workers
+                    # requests are ever in flight
+                    for entry in islice(remaining, 1):
+                        pending.append(
+                            asyncio.ensure_future(self._aload_url(*entry, client))
+                        )
+                    for document in documents:
+                        yield document
+            finally:
+                # The consumer may stop early; do not leave fetches running
+                for task in pending:
+                    task.cancel()
 
     def load(self) -> list[Document]:
         """Load all documents from all URLs.
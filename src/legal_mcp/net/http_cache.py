@@ -0,0 +1,304 @@
+"""Small on-disk HTTP page cache with TTL and ETag/Last-Modified revalidation.
+
+Discovery and test scripts refetch the same index pages on every run. This
+cache stores response bodies on disk keyed by URL so repeat runs are served
+locally while fresh, and stale entries are revalidated with a conditional
+request (``If-None-Match`` / ``If-Modified-Since``) instead of a full download.
+
+It is deliberately dependency-free (no requests-cache/hishel) and transport
+agnostic: callers do the HTTP request themselves and use :meth:`DiskHttpCache.get`,
+:meth:`DiskHttpCache.put` and :meth:`DiskHttpCache.touch` around it.
+:func:`fetch_cached` wraps that dance around a plain GET for scripts, over
+``urllib`` or a shared keep-alive ``httpx.Client``; :func:`fetch_cached_async`
+does the same over an ``httpx.AsyncClient`` for concurrent fetches.
+
+Example:
+    >>> from pathlib import Path
+    >>> from legal_mcp.net.http_cache import DiskHttpCache
+    >>>
+    >>> cache = DiskHttpCache(Path(".discovery_cache"), ttl_seconds=3600)
+    >>> page = cache.get("https://www.gesetze-im-internet.de/Teilliste_B.html")
+    >>> if page is not None and cache.is_fresh(page):
+    ...     html_content = page.body.decode("iso-8859-1")
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    import httpx
+
+# Compression urllib callers can undo with the stdlib (see decode_content).
+# httpx negotiates and decodes compression itself.
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """A cached response body plus the validators needed to revalidate it.
+
+    Attributes:
+        url: Requested URL (cache key).
+        body: Raw response bytes.
+        etag: ``ETag`` response header, if any.
+        last_modified: ``Last-Modified`` response header, if any.
+        stored_at: Unix time the entry was stored or last revalidated.
+    """
+
+    url: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def revalidation_headers(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskHttpCache:
+    """URL-keyed page cache stored as ``<sha256>.body`` / ``<sha256>.json`` files.
+
+    Writes are atomic (temp file + rename), so concurrent workers never read a
+    partially written entry.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl_seconds: float = 3600.0,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding cache entries (created on demand).
+            ttl_seconds: Age after which entries must be revalidated.
+            clock: Wall clock (injectable for tests).
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached page for ``url`` (fresh or stale), if any."""
+        body_path, meta_path = self._paths(url)
+        try:
+            metadata = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if metadata.get("url") != url:
+            return None
+        return CachedPage(
+            url=url,
+            body=body,
+            etag=metadata.get("etag"),
+            last_modified=metadata.get("last_modified"),
+            stored_at=float(metadata.get("stored_at", 0.0)),
+        )
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """Whether ``page`` may be served without contacting the server."""
+        return self._clock() - page.stored_at < self.ttl_seconds
+
+    def put(self, url: str, body: bytes, headers: Mapping[str, str]) -> CachedPage:
+        """Store a successful response.
+
+        Args:
+            url: Requested URL.
+            body: Raw response bytes.
+            headers: Response headers (``ETag``/``Last-Modified`` are kept,
+                matched case-insensitively as a plain ``dict`` copy of
+                ``httpx`` headers has lower-case keys).
+
+        Returns:
+            The stored entry.
+        """
+        lowered = {key.lower(): value for key, value in headers.items()}
+        page = CachedPage(
+            url=url,
+            body=body,
+            etag=lowered.get("etag"),
+            last_modified=lowered.get("last-modified"),
+            stored_at=self._clock(),
+        )
+        body_path, _ = self._paths(url)
+        self._write_atomic(body_path, body)
+        self._write_metadata(page)
+        return page
+
+    def touch(self, page: CachedPage) -> CachedPage:
+        """Mark ``page`` as revalidated (after a ``304 Not Modified``)."""
+        refreshed = CachedPage(
+            url=page.url,
+            body=page.body,
+            etag=page.etag,
+            last_modified=page.last_modified,
+            stored_at=self._clock(),
+        )
+        self._write_metadata(refreshed)
+        return refreshed
+
+    def _write_metadata(self, page: CachedPage) -> None:
+        _, meta_path = self._paths(page.url)
+        metadata = {
+            "url": page.url,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "stored_at": page.stored_at,
+        }
+        self._write_atomic(meta_path, json.dumps(metadata).encode("utf-8"))
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_name = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+def decode_content(body: bytes, content_encoding: str | None) -> bytes:
+    """Undo ``gzip``/``deflate`` content encoding on a ``urllib`` response body.
+
+    Args:
+        body: Raw response bytes as read from the socket.
+        content_encoding: The response's ``Content-Encoding`` header, if any.
+
+    Returns:
+        The decompressed body (unchanged for ``identity`` or unknown codings).
+    """
+    coding = (content_encoding or "").strip().lower()
+    if coding == "gzip":
+        return gzip.decompress(body)
+    if coding == "deflate":
+        # Servers send either zlib-wrapped or raw deflate streams
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def fetch_cached(
+    url: str,
+    cache: DiskHttpCache,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 30.0,
+    client: httpx.Client | None = None,
+) -> bytes:
+    """GET ``url``, serving and storing the body via ``cache``.
+
+    Fresh entries are returned without a request; stale ones are revalidated
+    with a conditional request and reused on ``304 Not Modified``.
+
+    Args:
+        url: Page URL.
+        cache: Cache to read from and write to.
+        headers: Extra request headers (e.g. ``User-Agent``).
+        timeout: Socket timeout in seconds.
+        client: Optional shared ``httpx.Client``; cache misses then reuse its
+            pooled keep-alive connections instead of a fresh ``urlopen``
+            connection (TCP + TLS handshake) per call.
+
+    Returns:
+        Raw response bytes (callers decode, e.g. ``iso-8859-1``).
+
+    Raises:
+        HTTPError: For error statuses other than a ``304`` on a cached page
+            (``urllib`` path).
+        httpx.HTTPStatusError: Same, when ``client`` is given.
+    """
+    cached = cache.get(url)
+    if cached is not None and cache.is_fresh(cached):
+        return cached.body
+
+    request_headers = {"Accept-Encoding": ACCEPT_ENCODING, **(headers or {})}
+    if cached is not None:
+        request_headers.update(cached.revalidation_headers())
+
+    if client is not None:
+        response = client.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and cached is not None:
+            return cache.touch(cached).body
+        response.raise_for_status()
+        return cache.put(url, response.content, response.headers).body
+
+    try:
+        with urlopen(
+            Request(url, headers=request_headers), timeout=timeout
+        ) as response:
+            body = decode_content(
+                response.read(), response.headers.get("Content-Encoding")
+            )
+            return cache.put(url, body, response.headers).body
+    except HTTPError as error:
+        if error.code == 304 and cached is not None:
+            return cache.touch(cached).body
+        raise
+
+
+async def fetch_cached_async(
+    url: str,
+    cache: DiskHttpCache,
+    client: httpx.AsyncClient,
+    headers: Mapping[str, str] | None = None,
+) -> bytes:
+    """Async :func:`fetch_cached` over a shared ``httpx.AsyncClient``.
+
+    Run many of these with ``asyncio.gather`` so page round trips overlap.
+
+    Args:
+        url: Page URL.
+        cache: Cache to read from and write to.
+        client: Shared async client (connection pool and timeouts).
+        headers: Extra request headers (e.g. ``User-Agent``).
+
+    Returns:
+        Raw (decompressed) response bytes.
+
+    Raises:
+        httpx.HTTPStatusError: For error statuses other than a ``304`` on a
+            cached page.
+    """
+    cached = cache.get(url)
+    if cached is not None and cache.is_fresh(cached):
+        return cached.body
+
+    request_headers = dict(headers or {})
+    if cached is not None:
+        request_headers.update(cached.revalidation_headers())
+
+    response = await client.get(url, headers=request_headers)
+    if response.status_code == 304 and cached is not None:
+        return cache.touch(cached).body
+    response.raise_for_status()
+    return cache.put(url, response.content, response.headers).body
@@ -0,0 +1,209 @@
+"""Thread-safe token-bucket rate limiting for polite crawling.
+
+A single global lock that sleeps while held serializes every worker behind the
+slowest one. The token bucket here only holds its lock long enough to *reserve*
+a slot (refill + decrement), then sleeps outside the lock. Concurrent workers
+therefore wait in parallel, each for its own staggered slot, and the effective
+request rate is bounded by ``rate_per_second`` rather than by lock contention.
+
+Buckets also adapt to the server (AIMD): every 429/503 answer halves the rate,
+and each run of ``recovery_successes`` successful requests doubles it again,
+up to the configured rate. Crawls thus back off as a whole instead of every
+worker hammering the server with its own retry schedule.
+
+Example:
+    >>> from legal_mcp.net.rate_limit import HostRateLimiter
+    >>>
+    >>> limiter = HostRateLimiter(rate_per_second=5.0)
+    >>> limiter.acquire("https://www.gesetze-im-internet.de/bgb/__433.html")
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# HTTP status codes that mean "slow down" (Too Many Requests, Service Unavailable)
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Token bucket that hands out time slots at a fixed average rate.
+
+    Tokens refill continuously at ``rate_per_second`` up to ``capacity``.
+    Each :meth:`acquire` consumes one token; when the bucket is empty the
+    token is borrowed against the future and the caller sleeps until it
+    would have been refilled.
+
+    Attributes:
+        rate_per_second: Current number of acquisitions allowed per second
+            (lowered by :meth:`record_throttled`).
+        max_rate_per_second: Configured rate that recovery climbs back to.
+        min_rate_per_second: Floor for throttling.
+        capacity: Maximum burst size (tokens available after idling).
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float = 1.0,
+        *,
+        min_rate_per_second: float | None = None,
+        recovery_successes: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate_per_second: Refill rate in tokens per second. Must be > 0.
+            capacity: Maximum number of stored tokens. Must be >= 1.
+            min_rate_per_second: Lowest rate throttling may reach
+                (default: 1/16 of ``rate_per_second``).
+            recovery_successes: Consecutive successes needed to double a
+                throttled rate. Must be >= 1.
+            clock: Monotonic clock (injectable for tests).
+            sleep: Sleep function (injectable for tests).
+
+        Raises:
+            ValueError: If rate_per_second <= 0, capacity < 1 or
+                recovery_successes < 1.
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be > 0")
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if recovery_successes < 1:
+            raise ValueError("recovery_successes must be >= 1")
+
+        self.rate_per_second = rate_per_second
+        self.max_rate_per_second = rate_per_second
+        self.min_rate_per_second = min(
+            min_rate_per_second or rate_per_second / 16, rate_per_second
+        )
+        self.capacity = capacity
+        self._recovery_successes = recovery_successes
+        self._successes = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill (caller holds the lock)."""
+        now = self._clock()
+        elapsed_seconds = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed_seconds * self.rate_per_second
+        )
+
+    def reserve(self) -> float:
+        """Reserve one token without sleeping.
+
+        Returns:
+            Seconds the caller must wait before using the reserved slot.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def acquire(self) -> None:
+        """Block until one token is available (sleeping outside the lock)."""
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            self._sleep(wait_seconds)
+
+    def record_throttled(self) -> None:
+        """Halve the rate after the server asked us to slow down."""
+        with self._lock:
+            # Tokens earned so far were earned at the old rate
+            self._refill()
+            self.rate_per_second = max(
+                self.min_rate_per_second, self.rate_per_second / 2
+            )
+            self._successes = 0
+
+    def record_success(self) -> None:
+        """Count a successful request; double a throttled rate after a run."""
+        with self._lock:
+            if self.rate_per_second >= self.max_rate_per_second:
+                return
+            self._successes += 1
+            if self._successes < self._recovery_successes:
+                return
+            self._refill()
+            self.rate_per_second = min(
+                self.max_rate_per_second, self.rate_per_second * 2
+            )
+            self._successes = 0
+
+    def record_status(self, status_code: int) -> None:
+        """Feed an HTTP status code back into the rate (see AIMD above).
+
+        Args:
+            status_code: Status of the response to the acquired request.
+        """
+        if status_code in THROTTLE_STATUS_CODES:
+            self.record_throttled()
+        elif status_code < 400:
+            self.record_success()
+
+
+class HostRateLimiter:
+    """Lazily creates one :class:`TokenBucket` per URL host.
+
+    Requests to different hosts never throttle each other, while all workers
+    hitting the same host share that host's budget.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate_per_second: Per-host refill rate in tokens per second.
+            capacity: Per-host burst size.
+            clock: Monotonic clock (injectable for tests).
+            sleep: Sleep function (injectable for tests).
+        """
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """Return the bucket for the host of ``url``, creating it on first use."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self.rate_per_second,
+                    self.capacity,
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to the host of ``url`` is allowed."""
+        self.bucket_for(url).acquire()
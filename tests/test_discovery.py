@@ -0,0 +1,313 @@
+"""Unit tests for the HTML discovery pipeline.
+
+These tests validate:
+- Concurrent discovery returns laws in alphabet order and norms per law
+- Fetch failures are collected as errors instead of aborting discovery
+- `max_laws` limits the number of law index pages fetched
+- The optional on-disk page cache short-circuits and revalidates fetches
+- The sync path reuses a single injected `httpx.Client`
+- Threaded fetches on a fresh instance build only one owned client
+- Threaded sync discovery matches the async result and keeps law order
+- `iter_discovery` streams norms before later index pages are fetched
+- A law listed on several letter pages is discovered and fetched once
+- Law index pages are fetched before later letter pages, not after all of them
+- Letter/index page parsing keeps only law and norm links
+
+Design notes:
+- Uses `httpx.MockTransport` with an `AsyncClient`/`Client` injected into
+  `GermanLawDiscovery`.
+- Does not require real network access.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from legal_mcp.loaders.discovery import GermanLawDiscovery
+from legal_mcp.net.http_cache import DiskHttpCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_BASE_URL = "https://laws.example.invalid"
+
+_LETTER_PAGES = {
+    "/Teilliste_A.html": (
+        '<p><a href="./aeg/index.html">AEG</a> Allgemeines Eisenbahngesetz</p>'
+        '<p><a href="./ao/index.html">AO</a> Abgabenordnung</p>'
+    ),
+    "/Teilliste_B.html": (
+        '<p><a href="./bgb/index.html">BGB</a> Bürgerliches Gesetzbuch</p>'
+    ),
+}
+
+_INDEX_PAGES = {
+    "/aeg/": '<a href="__1.html">§ 1</a><a href="__2.html">§ 2</a>',
+    "/bgb/": '<a href="__433.html">§ 433</a><a href="index.html">Index</a>',
+}
+
+
+def _handler(requested_paths: list[str]) -> httpx.MockTransport:
+    def handle(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requested_paths.append(path)
+        if path in _INDEX_PAGES:
+            body = _INDEX_PAGES[path]
+        elif path.startswith("/Teilliste_"):
+            body = _LETTER_PAGES.get(path, "<p></p>")
+        else:
+            return httpx.Response(500, content=b"boom")
+        return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+    return httpx.MockTransport(handle)
+
+
+@pytest.mark.asyncio
+async def test_discover_all_async_collects_laws_norms_and_errors() -> None:
+    """It should return laws in order, norms per law, and record failures."""
+    requested_paths: list[str] = []
+    discovery = GermanLawDiscovery(base_url=_BASE_URL)
+
+    async with httpx.AsyncClient(transport=_handler(requested_paths)) as client:
+        result = await discovery.discover_all_async(
+            max_concurrent_requests=4, client=client
+        )
+
+    assert [law.abbreviation for law in result.laws] == ["AEG", "AO", "BGB"]
+    assert result.laws[2].title == "Bürgerliches Gesetzbuch"
+    assert [(norm.law_abbreviation, norm.norm_id) for norm in result.norms] == [
+        ("AEG", "§ 1"),
+        ("AEG", "§ 2"),
+        ("BGB", "§ 433"),
+    ]
+    assert result.norms[2].url == f"{_BASE_URL}/bgb/__433.html"
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("Error discovering norms for AO")
+    assert len(requested_paths) == len(GermanLawDiscovery.ALPHABET_PAGES) + 3
+
+
+@pytest.mark.asyncio
+async def test_discover_all_async_respects_max_laws() -> None:
+    """It should only fetch index pages for the first `max_laws` laws."""
+    requested_paths: list[str] = []
+    discovery = GermanLawDiscovery(base_url=_BASE_URL)
+
+    async with httpx.AsyncClient(transport=_handler(requested_paths)) as client:
+        result = await discovery.discover_all_async(max_laws=1, client=client)
+
+    assert [law.abbreviation for law in result.laws] == ["AEG"]
+    assert [norm.norm_id for norm in result.norms] == ["§ 1", "§ 2"]
+    assert "/ao/" not in requested_paths
+    assert result.errors == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_async_serves_fresh_cache_and_revalidates_stale(
+    tmp_path: Path,
+) -> None:
+    """It should skip the network while fresh and reuse the body on a 304."""
+    seen_headers: list[httpx.Headers] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<p>page</p>", headers={"ETag": '"v1"'})
+
+    now = [0.0]
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60.0, clock=lambda: now[0])
+    discovery = GermanLawDiscovery(base_url=_BASE_URL, cache=cache)
+    url = f"{_BASE_URL}/Teilliste_A.html"
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+        first = await discovery._fetch_html_async(client, url)
+        second = await discovery._fetch_html_async(client, url)
+        now[0] = 120.0
+        third = await discovery._fetch_html_async(client, url)
+
+    assert first == second == third == "<p>page</p>"
+    assert len(seen_headers) == 2
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+
+
+def test_discover_all_reuses_injected_sync_client() -> None:
+    """The sync path should route every fetch through the one shared client."""
+    requested_paths: list[str] = []
+    client = httpx.Client(transport=_handler(requested_paths))
+
+    with GermanLawDiscovery(base_url=_BASE_URL, client=client) as discovery:
+        result = discovery.discover_all(max_laws=2)
+        assert discovery.client is client
+
+    assert [law.abbreviation for law in result.laws] == ["AEG", "AO"]
+    assert [norm.norm_id for norm in result.norms] == ["§ 1", "§ 2"]
+    assert requested_paths[0] == "/Teilliste_A.html"
+    # Injected clients belong to the caller and stay open
+    assert not client.is_closed
+    client.close()
+
+
+def test_threaded_discovery_builds_one_owned_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent first fetches must share one lazily created client."""
+    requested_paths: list[str] = []
+    created_clients: list[httpx.Client] = []
+
+    def create_client() -> httpx.Client:
+        # Widen the race window between the None check and the assignment
+        time.sleep(0.01)
+        client = httpx.Client(transport=_handler(requested_paths))
+        created_clients.append(client)
+        return client
+
+    monkeypatch.setattr(
+        GermanLawDiscovery, "_create_client", staticmethod(create_client)
+    )
+
+    with GermanLawDiscovery(base_url=_BASE_URL) as discovery:
+        result = discovery.discover_all(max_workers=8)
+
+    assert [law.abbreviation for law in result.laws] == ["AEG", "AO", "BGB"]
+    assert len(created_clients) == 1
+    assert created_clients[0].is_closed
+
+
+def test_discover_all_threaded_matches_async_result() -> None:
+    """Pooled sync fetches should keep law order and record failures."""
+    requested_paths: list[str] = []
+    client = httpx.Client(transport=_handler(requested_paths))
+
+    with GermanLawDiscovery(base_url=_BASE_URL, client=client) as discovery:
+        result = discovery.discover_all(max_workers=4)
+
+    assert [law.abbreviation for law in result.laws] == ["AEG", "AO", "BGB"]
+    assert [(norm.law_abbreviation, norm.norm_id) for norm in result.norms] == [
+        ("AEG", "§ 1"),
+        ("AEG", "§ 2"),
+        ("BGB", "§ 433"),
+    ]
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("Error discovering norms for AO")
+    assert len(requested_paths) == len(GermanLawDiscovery.ALPHABET_PAGES) + 3
+    client.close()
+
+
+def test_discover_all_fetches_index_pages_between_letter_pages() -> None:
+    """Index pages of a letter should not wait for the rest of the alphabet."""
+    requested_paths: list[str] = []
+    client = httpx.Client(transport=_handler(requested_paths))
+
+    with GermanLawDiscovery(base_url=_BASE_URL, client=client) as discovery:
+        result = discovery.discover_all()
+
+    assert [law.abbreviation for law in result.laws] == ["AEG", "AO", "BGB"]
+    assert requested_paths[:4] == [
+        "/Teilliste_A.html",
+        "/aeg/",
+        "/ao/",
+        "/Teilliste_B.html",
+    ]
+    assert requested_paths.index("/bgb/") < requested_paths.index("/Teilliste_C.html")
+    client.close()
+
+
+def test_iter_discovery_streams_norms_and_collects_errors() -> None:
+    """Norms of the first law should arrive before later laws are fetched."""
+    requested_paths: list[str] = []
+    client = httpx.Client(transport=_handler(requested_paths))
+    errors: list[str] = []
+
+    with GermanLawDiscovery(base_url=_BASE_URL, client=client) as discovery:
+        pairs = discovery.iter_discovery(errors=errors)
+        first_law, first_norm = next(pairs)
+        assert "/bgb/" not in requested_paths
+        rest = list(pairs)
+
+    assert (first_law.abbreviation, first_norm.norm_id) == ("AEG", "§ 1")
+    assert [(law.abbreviation, norm.norm_id) for law, norm in rest] == [
+        ("AEG", "§ 2"),
+        ("BGB", "§ 433"),
+    ]
+    assert len(errors) == 1
+    assert errors[0].startswith("Error discovering norms for AO")
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_law_listed_twice_is_fetched_once() -> None:
+    """Duplicate letter-page listings should not refetch the law index."""
+
+    def handle_duplicates(requested_paths: list[str]) -> httpx.MockTransport:
+        def handle(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            requested_paths.append(path)
+            if path == "/Teilliste_B.html":
+                body = (
+                    '<p><a href="./bgb/index.html">BGB</a> Bürgerliches Gesetzbuch</p>'
+                    '<p><a href="./BGB/index.html">BGB</a> Bürgerliches Gesetzbuch</p>'
+                )
+            elif path == "/Teilliste_G.html":
+                body = '<p><a href="./bgb/index.html">BGB</a> Gesetzbuch</p>'
+            elif path in _INDEX_PAGES:
+                body = _INDEX_PAGES[path]
+            else:
+                body = "<p></p>"
+            return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+        return httpx.MockTransport(handle)
+
+    sync_paths: list[str] = []
+    client = httpx.Client(transport=handle_duplicates(sync_paths))
+    with GermanLawDiscovery(base_url=_BASE_URL, client=client) as discovery:
+        result = discovery.discover_all(max_workers=4)
+    client.close()
+
+    async_paths: list[str] = []
+    async with httpx.AsyncClient(transport=handle_duplicates(async_paths)) as aclient:
+        async_result = await GermanLawDiscovery(base_url=_BASE_URL).discover_all_async(
+            client=aclient
+        )
+
+    for discovered, requested_paths in (
+        (result, sync_paths),
+        (async_result, async_paths),
+    ):
+        assert [law.abbreviation for law in discovered.laws] == ["BGB"]
+        assert [norm.norm_id for norm in discovered.norms] == ["§ 433"]
+        assert requested_paths.count("/bgb/") == 1
+
+
+def test_parsers_keep_only_law_and_norm_links() -> None:
+    """Parsing should keep law directories and §/Art/Anlage/numbered norms."""
+    discovery = GermanLawDiscovery(base_url=_BASE_URL)
+    letter_page = (
+        '<p><a href="./GG/index.html">GG</a> Grundgesetz'
+        ' <a href="./gg/gg.pdf">PDF</a></p>'
+        '<p><a href="https://example.invalid/x/index.html">X</a></p>'
+        '<p><a href="./a/b/index.html">AB</a></p>'
+    )
+    laws = discovery._parse_letter_page(letter_page)
+    index_page = (
+        '<a href="art_1.html">Art 1</a>'
+        '<a href="anlage.html">anlage 2</a>'
+        '<a href="__12.html">12</a>'
+        '<a href="BJNR000010949.html">§ 1</a>'
+        '<a href="gesamt.html">Gesamt</a>'
+        '<a href="eingang.html">Eingangsformel</a>'
+        '<a href="anlage_3.pdf">Anlage 3</a>'
+        "<a>§ 99</a>"
+    )
+
+    assert [law.abbreviation for law in laws] == ["GG"]
+    law = laws[0]
+    norms = list(discovery._iter_law_index_page(index_page, law))
+
+    assert law.url == f"{_BASE_URL}/gg/"
+    assert law.title == "Grundgesetz"
+    assert [norm.norm_id for norm in norms] == ["Art 1", "anlage 2", "12"]
+    assert norms[0].url == f"{_BASE_URL}/gg/art_1.html"
@@ -0,0 +1,62 @@
+"""Unit tests for `app.ingestion.embedding_cache.EmbeddingCache`.
+
+These tests validate:
+- Vectors round-trip as float32 across cache instances (persistence)
+- Keys are scoped by model name
+- Lookups larger than SQLite's parameter limit are chunked
+
+Design notes:
+- Uses `tmp_path` for the SQLite file; no model is loaded.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from app.ingestion.embedding_cache import EmbeddingCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_MODEL = "jinaai/jina-embeddings-v2-base-de"
+
+
+def test_put_many_round_trips_vectors_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "embeddings.db"
+    key = EmbeddingCache.key(_MODEL, "Die Würde des Menschen ist unantastbar.")
+    vector = np.array([0.5, -1.25, 3.0], dtype=np.float64)
+
+    cache = EmbeddingCache(path)
+    cache.put_many({key: vector})
+    cache.close()
+
+    reopened = EmbeddingCache(path)
+    found = reopened.get_many([key, EmbeddingCache.key(_MODEL, "unknown")])
+
+    assert list(found) == [key]
+    assert found[key].dtype == np.float32
+    np.testing.assert_array_equal(found[key], vector.astype(np.float32))
+    assert len(reopened) == 1
+
+
+def test_keys_are_scoped_by_model_name() -> None:
+    text = "Durch den Kaufvertrag wird der Verkäufer einer Sache verpflichtet."
+
+    assert EmbeddingCache.key(_MODEL, text) == EmbeddingCache.key(_MODEL, text)
+    assert EmbeddingCache.key(_MODEL, text) != EmbeddingCache.key("other", text)
+
+
+def test_get_many_handles_more_keys_than_one_statement(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    vectors = {
+        EmbeddingCache.key(_MODEL, f"text {index}"): np.full(2, index, np.float32)
+        for index in range(1200)
+    }
+    cache.put_many(vectors)
+
+    found = cache.get_many(list(vectors))
+
+    assert len(found) == 1200
+    assert all(np.array_equal(found[key], vector) for key, vector in vectors.items())
@@ -0,0 +1,88 @@
+"""Unit tests for `app.ingestion.embedding_matrix.EmbeddingMatrix`.
+
+These tests validate:
+- Snapshots are stored normalized as float16 and loaded memory-mapped
+- Quantized snapshots store int8 rows plus per-row scales and rank the same
+- Exact search returns ids best-first per query
+- Mismatched ids/rows are rejected
+
+Design notes:
+- Uses `tmp_path` and tiny hand-built vectors; no model is loaded.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from app.ingestion.embedding_matrix import EmbeddingMatrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_save_normalizes_to_float16_memmap(tmp_path: Path) -> None:
+    matrix = EmbeddingMatrix.save(
+        tmp_path / "snapshot",
+        ["a", "b"],
+        np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32),
+    )
+
+    assert isinstance(matrix.embeddings, np.memmap)
+    assert matrix.embeddings.dtype == np.float16
+    np.testing.assert_allclose(matrix.embeddings[0], [0.6, 0.8], atol=1e-3)
+    np.testing.assert_array_equal(matrix.embeddings[1], [0.0, 0.0])
+    assert EmbeddingMatrix.load(tmp_path / "snapshot").ids == ["a", "b"]
+
+
+def test_search_returns_top_ids_per_query(tmp_path: Path) -> None:
+    matrix = EmbeddingMatrix.save(
+        tmp_path,
+        ["x", "y", "xy"],
+        np.array([[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]]),
+    )
+
+    results = matrix.search(np.array([[5.0, 0.0], [0.0, 1.0]]), n_results=2)
+
+    assert [ids for ids, _ in results] == [["x", "xy"], ["y", "xy"]]
+    np.testing.assert_allclose(results[0][1], [1.0, 0.7071], atol=1e-3)
+    assert matrix.search(np.array([1.0, 0.0]), n_results=10)[0][0] == [
+        "x",
+        "xy",
+        "y",
+    ]
+
+
+def test_quantized_save_stores_int8_rows_and_scales(tmp_path: Path) -> None:
+    embeddings = np.array([[1.0, 0.0], [0.0, 2.0], [1.0, 1.0], [0.0, 0.0]])
+    matrix = EmbeddingMatrix.save(
+        tmp_path, ["x", "y", "xy", "zero"], embeddings, quantize=True
+    )
+
+    assert matrix.embeddings.dtype == np.int8
+    assert matrix.scales is not None
+    np.testing.assert_array_equal(matrix.embeddings[2], [127, 127])
+    np.testing.assert_allclose(
+        matrix.scales, [1 / 127, 1 / 127, 0.7071 / 127, 0.0], rtol=1e-4
+    )
+
+    results = matrix.search(np.array([[5.0, 0.0], [1.0, 1.0]]), n_results=3)
+    assert [ids for ids, _ in results] == [["x", "xy", "y"], ["xy", "x", "y"]]
+    np.testing.assert_allclose(results[0][1], [1.0, 0.7071, 0.0], atol=1e-3)
+
+
+def test_float16_save_replaces_quantized_snapshot(tmp_path: Path) -> None:
+    embeddings = np.array([[3.0, 4.0]])
+    EmbeddingMatrix.save(tmp_path, ["a"], embeddings, quantize=True)
+
+    matrix = EmbeddingMatrix.save(tmp_path, ["a"], embeddings)
+
+    assert matrix.scales is None
+    assert EmbeddingMatrix.load(tmp_path).embeddings.dtype == np.float16
+
+
+def test_save_rejects_misaligned_ids(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="2 ids for 1 embedding rows"):
+        EmbeddingMatrix.save(tmp_path, ["a", "b"], np.ones((1, 2)))
@@ -0,0 +1,278 @@
+"""Unit tests for `app.ingestion.embeddings.GermanLawEmbeddingStore`.
+
+These tests validate:
+- Embedding batches and ChromaDB upsert batches are sized independently
+- By default all documents are embedded in a single `encode` call
+- With an explicit batch size, upserts default to one call per embedding batch
+- Duplicate doc_ids are dropped within a pending upsert
+- `search_many` embeds all queries at once and issues a single ChromaDB query
+- `search_embeddings` queries with precomputed rows and never calls the model
+- With an embedding cache, repeated texts are not sent to the model again
+- `min_similarity` drops low-similarity rows before results are built
+- Documents without a doc_id get a content-derived, process-stable id
+- `export_embedding_matrix` pages through the collection into one snapshot
+
+Design notes:
+- No real model or ChromaDB is used; the `model` property is patched and a fake
+  collection is injected via `_collection`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from langchain_core.documents import Document
+
+from app.ingestion import embeddings as embeddings_module
+from app.ingestion.embedding_cache import EmbeddingCache
+from app.ingestion.embeddings import GermanLawEmbeddingStore, content_doc_id
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.encode_calls: list[list[str]] = []
+
+    def encode(self, texts: list[str], **kwargs: Any) -> np.ndarray:
+        self.encode_calls.append(list(texts))
+        return np.array([[len(text), 0.0, 1.0] for text in texts], dtype=np.float32)
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.upsert_calls: list[dict[str, Any]] = []
+        self.query_calls: list[dict[str, Any]] = []
+
+    def upsert(self, **kwargs: Any) -> None:
+        self.upsert_calls.append({key: list(value) for key, value in kwargs.items()})
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:
+        self.query_calls.append(kwargs)
+        query_count = len(kwargs["query_embeddings"])
+        return {
+            "ids": [[f"hit_{index}"] for index in range(query_count)],
+            "documents": [[f"content {index}"] for index in range(query_count)],
+            "metadatas": [[{"law_abbrev": "BGB"}] for _ in range(query_count)],
+            "distances": [[0.25 * index] for index in range(query_count)],
+        }
+
+
+def _make_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> tuple[GermanLawEmbeddingStore, _FakeModel, _FakeCollection]:
+    fake_model = _FakeModel()
+    fake_collection = _FakeCollection()
+    monkeypatch.setattr(
+        embeddings_module.GermanLawEmbeddingStore,
+        "model",
+        property(lambda self: fake_model),
+    )
+    store = GermanLawEmbeddingStore(persist_path=tmp_path)
+    store._collection = fake_collection  # type: ignore[assignment]
+    return store, fake_model, fake_collection
+
+
+def _documents(count: int) -> list[Document]:
+    return [
+        Document(page_content=f"text {index}", metadata={"doc_id": f"doc_{index}"})
+        for index in range(count)
+    ]
+
+
+def test_add_documents_decouples_embed_and_upsert_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+
+    added = store.add_documents(
+        _documents(10), batch_size=2, show_progress=False, upsert_batch_size=4
+    )
+
+    assert added == 10
+    assert [len(call) for call in fake_model.encode_calls] == [2, 2, 2, 2, 2]
+    assert [len(call["ids"]) for call in fake_collection.upsert_calls] == [4, 4, 2]
+    upserted_ids = [
+        doc_id for call in fake_collection.upsert_calls for doc_id in call["ids"]
+    ]
+    assert upserted_ids == [f"doc_{index}" for index in range(10)]
+    assert all(
+        len(call["embeddings"]) == len(call["documents"]) == len(call["ids"])
+        for call in fake_collection.upsert_calls
+    )
+
+
+def test_add_documents_encodes_everything_in_one_call_by_default(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+
+    added = store.add_documents(_documents(7), show_progress=False)
+
+    assert added == 7
+    assert [len(call) for call in fake_model.encode_calls] == [7]
+    assert [len(call["ids"]) for call in fake_collection.upsert_calls] == [7]
+
+
+def test_add_documents_upserts_per_embed_batch_by_default(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, _fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+
+    store.add_documents(_documents(5), batch_size=2, show_progress=False)
+
+    assert [len(call["ids"]) for call in fake_collection.upsert_calls] == [2, 2, 1]
+
+
+def test_add_documents_skips_duplicate_ids_within_pending_upsert(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, _fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+    documents = [
+        *_documents(3),
+        Document(page_content="again", metadata={"doc_id": "doc_1"}),
+    ]
+
+    added = store.add_documents(
+        documents, batch_size=2, show_progress=False, upsert_batch_size=10
+    )
+
+    assert added == 3
+    assert fake_collection.upsert_calls[0]["ids"] == ["doc_0", "doc_1", "doc_2"]
+
+
+def test_search_many_uses_one_encode_and_one_query(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+
+    results = store.search_many(["Kaufvertrag", "Menschenwürde"], n_results=1)
+
+    assert fake_model.encode_calls == [["Kaufvertrag", "Menschenwürde"]]
+    assert len(fake_collection.query_calls) == 1
+    query_embeddings = fake_collection.query_calls[0]["query_embeddings"]
+    assert query_embeddings.dtype == np.float32
+    assert query_embeddings.shape == (2, 3)
+    assert [[result.doc_id for result in hits] for hits in results] == [
+        ["hit_0"],
+        ["hit_1"],
+    ]
+    assert results[1][0].similarity == 0.75
+    assert store.search("Kaufvertrag", n_results=1)[0].doc_id == "hit_0"
+
+
+def test_search_embeddings_reuses_precomputed_query_rows(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+    query_embeddings = store.embed_queries(["Kauf", "Miete", "Grundrechte"])
+
+    results = store.search_embeddings(
+        query_embeddings[[0, 2]], n_results=1, where={"level": {"$eq": "norm"}}
+    )
+
+    assert fake_model.encode_calls == [["Kauf", "Miete", "Grundrechte"]]
+    assert len(fake_collection.query_calls) == 1
+    assert fake_collection.query_calls[0]["where"] == {"level": {"$eq": "norm"}}
+    assert fake_collection.query_calls[0]["query_embeddings"].tolist() == [
+        [4.0, 0.0, 1.0],
+        [11.0, 0.0, 1.0],
+    ]
+    assert [[result.doc_id for result in hits] for hits in results] == [
+        ["hit_0"],
+        ["hit_1"],
+    ]
+
+
+def test_add_documents_serves_repeated_texts_from_embedding_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+    store.embedding_cache = EmbeddingCache(tmp_path / "embeddings.db")
+    first = [
+        Document(page_content="kurz", metadata={"doc_id": "a"}),
+        Document(page_content="etwas länger", metadata={"doc_id": "b"}),
+    ]
+    second = [
+        Document(page_content="etwas länger", metadata={"doc_id": "b"}),
+        Document(page_content="neu", metadata={"doc_id": "c"}),
+        Document(page_content="kurz", metadata={"doc_id": "d"}),
+    ]
+
+    store.add_documents(first, show_progress=False)
+    store.add_documents(second, show_progress=False)
+
+    assert fake_model.encode_calls == [["kurz", "etwas länger"], ["neu"]]
+    second_upsert = fake_collection.upsert_calls[1]
+    assert second_upsert["ids"] == ["b", "c", "d"]
+    assert [row[0] for row in second_upsert["embeddings"]] == [12.0, 3.0, 4.0]
+
+
+def test_search_min_similarity_filters_rows(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, _fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+    monkeypatch.setattr(
+        fake_collection,
+        "query",
+        lambda **kwargs: {
+            "ids": [["near", "mid", "far"]],
+            "documents": [["a", "b", "c"]],
+            "metadatas": [[{"law_abbrev": "GG"}, {}, {}]],
+            "distances": [[0.1, 0.5, 1.2]],
+        },
+    )
+
+    unfiltered = store.search("Würde", n_results=3)
+    filtered = store.search("Würde", n_results=3, min_similarity=0.5)
+
+    assert [result.doc_id for result in unfiltered] == ["near", "mid", "far"]
+    assert unfiltered[2].similarity == 0.0
+    assert [result.doc_id for result in filtered] == ["near", "mid"]
+    assert filtered[0].metadata == {"law_abbrev": "GG"}
+    assert isinstance(filtered[0].distance, float)
+
+
+def test_export_embedding_matrix_pages_through_collection(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, _fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+    stored_ids = ["a", "b", "c"]
+    stored_embeddings = [[1.0, 0.0], [0.0, 1.0], [1.0, -1.0]]
+    get_calls: list[dict[str, Any]] = []
+
+    def fake_get(**kwargs: Any) -> dict[str, Any]:
+        get_calls.append(kwargs)
+        window = slice(kwargs["offset"], kwargs["offset"] + kwargs["limit"])
+        return {"ids": stored_ids[window], "embeddings": stored_embeddings[window]}
+
+    monkeypatch.setattr(fake_collection, "get", fake_get, raising=False)
+
+    matrix = store.export_embedding_matrix(tmp_path / "snapshot", page_size=2)
+
+    assert [call["offset"] for call in get_calls] == [0, 2, 3]
+    assert matrix.ids == stored_ids
+    assert matrix.embeddings.shape == (3, 2)
+    assert matrix.search(np.array([1.0, 0.1]), n_results=1)[0][0] == ["a"]
+
+
+def test_add_documents_derives_stable_ids_from_content(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store, _fake_model, fake_collection = _make_store(monkeypatch, tmp_path)
+    documents = [
+        Document(page_content="Art 1 GG"),
+        Document(page_content="Art 1 GG"),
+        Document(page_content="Art 2 GG"),
+    ]
+
+    store.add_documents(documents, show_progress=False)
+
+    ids = fake_collection.upsert_calls[0]["ids"]
+    assert ids == [content_doc_id("Art 1 GG"), content_doc_id("Art 2 GG")]
+    # blake2b digest, independent of PYTHONHASHSEED
+    assert content_doc_id("Art 1 GG") == "doc_d4f492138755f4d807daecde7f2bb5f0"
@@ -0,0 +1,382 @@
+"""Unit tests for `legal_mcp.loaders.german_law_html`.
+
+These tests validate:
+- The bulk loader fetches concurrently but yields documents in URL order
+- Failing URLs are skipped without aborting the bulk load
+- A slow bulk `lazy_load` consumer bounds the pages fetched ahead of it
+- Without an injected client, one pooled client serves the whole bulk load
+- A page cache serves repeat loads without another request
+- Stale cached pages are revalidated with conditional GETs and reused on 304
+- `aload` multiplexes pages over one owned HTTP/2 `httpx.AsyncClient`
+- `min_split_chars` drops per-paragraph Documents for short norms
+
+Design notes:
+- Uses `httpx.MockTransport` with a shared `httpx.Client`; no network access.
+- The first request per URL blocks until all URLs are in flight, which only
+  succeeds if fetches overlap.
+- Retry backoff (`time.sleep`) is patched out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from legal_mcp.loaders import german_law_html
+from legal_mcp.loaders.german_law_html import (
+    GermanLawBulkHTMLLoader,
+    GermanLawHTMLLoader,
+)
+from legal_mcp.net.http_cache import DiskHttpCache
+from legal_mcp.net.rate_limit import TokenBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from urllib.request import Request
+
+_real_sleep = asyncio.sleep
+
+
+async def _no_sleep(seconds: float) -> None:
+    """Skip retry backoff but still yield to the event loop."""
+    await _real_sleep(0)
+
+
+_PAGE = (
+    "<h1>Grundgesetz</h1><span class='jnenbez'>{norm}</span>"
+    "<div class='jurAbsatz'>(1) Erster Absatz.</div>"
+    "<div class='jurAbsatz'>(2) Zweiter Absatz.</div>"
+)
+
+
+def test_bulk_loader_fetches_concurrently_and_keeps_url_order(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(german_law_html.time, "sleep", lambda seconds: None)
+    urls = [
+        ("GG", f"https://laws.example.invalid/gg/art_{index}.html")
+        for index in range(1, 5)
+    ]
+    all_in_flight = threading.Barrier(len(urls), timeout=5)
+    seen_paths: set[str] = set()
+    seen_lock = threading.Lock()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        with seen_lock:
+            first_request = request.url.path not in seen_paths
+            seen_paths.add(request.url.path)
+        if first_request:
+            all_in_flight.wait()
+        number = request.url.path.rsplit("_", 1)[1].removesuffix(".html")
+        if number == "3":
+            return httpx.Response(404)
+        body = _PAGE.format(norm=f"Art {number}")
+        return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+    with httpx.Client(transport=httpx.MockTransport(handle)) as client:
+        loader = GermanLawBulkHTMLLoader(urls, max_workers=len(urls), client=client)
+        documents = loader.load()
+
+    norm_documents = [doc for doc in documents if doc.metadata["level"] == "norm"]
+    assert [doc.metadata["norm_id"] for doc in norm_documents] == [
+        "Art 1",
+        "Art 2",
+        "Art 4",
+    ]
+    assert len(documents) == 9
+    # The failed page is logged and skipped
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    assert "Error loading https://laws.example.invalid/gg/art_3.html" in caplog.text
+
+
+def test_bulk_loader_bounds_pages_fetched_ahead_of_the_consumer() -> None:
+    urls = [
+        ("GG", f"https://laws.example.invalid/gg/art_{index}.html")
+        for index in range(1, 41)
+    ]
+    requested_paths: list[str] = []
+    requested_lock = threading.Lock()
+    last_page_requested = threading.Event()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        with requested_lock:
+            requested_paths.append(request.url.path)
+        number = request.url.path.rsplit("_", 1)[1].removesuffix(".html")
+        if number == "40":
+            last_page_requested.set()
+        body = _PAGE.format(norm=f"Art {number}")
+        return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+    with httpx.Client(transport=httpx.MockTransport(handle)) as client:
+        loader = GermanLawBulkHTMLLoader(urls, max_workers=2, client=client)
+        documents = loader.lazy_load()
+        first = next(documents)
+        # A paused consumer must not let the pool run through the whole crawl
+        assert not last_page_requested.wait(timeout=0.2)
+        documents.close()
+
+    assert first.metadata["norm_id"] == "Art 1"
+    # Only the in-flight window (2 * max_workers, refilled once) was submitted
+    assert len(requested_paths) <= 5
+
+
+def test_bulk_loader_shares_one_owned_client_per_load(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("USE_TOR", raising=False)
+    urls = [
+        ("GG", f"https://laws.example.invalid/gg/art_{index}.html")
+        for index in range(1, 4)
+    ]
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        number = request.url.path.rsplit("_", 1)[1].removesuffix(".html")
+        body = _PAGE.format(norm=f"Art {number}")
+        return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+    real_client = httpx.Client
+    created_clients: list[httpx.Client] = []
+
+    def make_client(**kwargs: object) -> httpx.Client:
+        client = real_client(transport=httpx.MockTransport(handle))
+        created_clients.append(client)
+        return client
+
+    monkeypatch.setattr(german_law_html.httpx, "Client", make_client)
+
+    documents = GermanLawBulkHTMLLoader(urls, max_workers=2).load()
+
+    assert len(created_clients) == 1
+    assert created_clients[0].is_closed
+    assert [
+        doc.metadata["norm_id"] for doc in documents if doc.metadata["level"] == "norm"
+    ] == ["Art 1", "Art 2", "Art 3"]
+
+
+def test_loader_serves_repeat_loads_from_page_cache(tmp_path: Path) -> None:
+    url = "https://laws.example.invalid/gg/art_1.html"
+    requested_urls: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        body = _PAGE.format(norm="Art 1")
+        return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+    cache = DiskHttpCache(tmp_path)
+    with httpx.Client(transport=httpx.MockTransport(handle)) as client:
+        first = GermanLawHTMLLoader(url, "GG", client=client, cache=cache).load()
+        second = GermanLawHTMLLoader(url, "GG", client=client, cache=cache).load()
+
+    assert requested_urls == [url]
+    assert [doc.page_content for doc in second] == [doc.page_content for doc in first]
+
+
+def _revalidating_handler(
+    seen_headers: list[httpx.Headers],
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve the page with an ETag, answering ``If-None-Match`` with 304."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        body = _PAGE.format(norm="Art 1")
+        return httpx.Response(
+            200, content=body.encode("iso-8859-1"), headers={"ETag": '"v1"'}
+        )
+
+    return handle
+
+
+def test_loader_revalidates_stale_cached_page_with_etag(tmp_path: Path) -> None:
+    url = "https://laws.example.invalid/gg/art_1.html"
+    now = [1000.0]
+    seen_headers: list[httpx.Headers] = []
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60, clock=lambda: now[0])
+    handle = _revalidating_handler(seen_headers)
+
+    with httpx.Client(transport=httpx.MockTransport(handle)) as client:
+        first = GermanLawHTMLLoader(url, "GG", client=client, cache=cache).load()
+        now[0] += 120
+        second = GermanLawHTMLLoader(url, "GG", client=client, cache=cache).load()
+
+    assert [headers.get("If-None-Match") for headers in seen_headers] == [
+        None,
+        '"v1"',
+    ]
+    assert [doc.page_content for doc in second] == [doc.page_content for doc in first]
+    page = cache.get(url)
+    assert page is not None
+    assert page.etag == '"v1"'
+    assert cache.is_fresh(page)
+
+
+@pytest.mark.asyncio
+async def test_async_loader_revalidates_stale_cached_page_with_etag(
+    tmp_path: Path,
+) -> None:
+    url = "https://laws.example.invalid/gg/art_1.html"
+    now = [1000.0]
+    seen_headers: list[httpx.Headers] = []
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60, clock=lambda: now[0])
+    handle = _revalidating_handler(seen_headers)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+        first = await GermanLawHTMLLoader(url, "GG", cache=cache)._afetch_html(client)
+        now[0] += 120
+        second = await GermanLawHTMLLoader(url, "GG", cache=cache)._afetch_html(client)
+
+    assert [headers.get("If-None-Match") for headers in seen_headers] == [
+        None,
+        '"v1"',
+    ]
+    assert second == first
+    page = cache.get(url)
+    assert page is not None
+    assert cache.is_fresh(page)
+
+
+def test_loader_paces_attempts_and_slows_down_on_429(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(german_law_html.time, "sleep", lambda seconds: None)
+    url = "https://laws.example.invalid/gg/art_1.html"
+    statuses = [429, 200]
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        body = _PAGE.format(norm="Art 1")
+        return httpx.Response(statuses.pop(0), content=body.encode("iso-8859-1"))
+
+    bucket_sleeps: list[float] = []
+    bucket = TokenBucket(
+        rate_per_second=10.0, clock=lambda: 0.0, sleep=bucket_sleeps.append
+    )
+    with httpx.Client(transport=httpx.MockTransport(handle)) as client:
+        documents = GermanLawHTMLLoader(
+            url, "GG", client=client, rate_limiter=bucket
+        ).load()
+
+    assert documents[0].metadata["norm_id"] == "Art 1"
+    assert statuses == []
+    # One token per attempt: the retry had to wait for a refill
+    assert len(bucket_sleeps) == 1
+    assert bucket.rate_per_second == 5.0
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.headers: dict[str, str] = {}
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def read(self) -> bytes:
+        return self.body
+
+
+class _FakeOpener:
+    def __init__(self) -> None:
+        self.opened_urls: list[str] = []
+
+    def open(self, request: Request, timeout: float) -> _FakeResponse:
+        self.opened_urls.append(request.full_url)
+        norm = request.full_url.rsplit("_", 1)[1].removesuffix(".html")
+        return _FakeResponse(_PAGE.format(norm=f"Art {norm}").encode("iso-8859-1"))
+
+
+def test_bulk_loader_shares_one_tor_opener_per_load(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("USE_TOR", "true")
+    urls = [
+        ("GG", f"https://laws.example.invalid/gg/art_{index}.html")
+        for index in range(1, 4)
+    ]
+    created_openers: list[_FakeOpener] = []
+
+    def make_opener() -> _FakeOpener:
+        opener = _FakeOpener()
+        created_openers.append(opener)
+        return opener
+
+    monkeypatch.setattr(german_law_html, "build_tor_opener", make_opener)
+
+    documents = GermanLawBulkHTMLLoader(urls, max_workers=2).load()
+
+    assert len(created_openers) == 1
+    assert created_openers[0].opened_urls == [url for _, url in urls]
+    assert len(documents) == 9
+
+
+@pytest.mark.asyncio
+async def test_bulk_loader_aload_uses_one_async_client_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.delenv("USE_TOR", raising=False)
+    monkeypatch.setattr(german_law_html.asyncio, "sleep", _no_sleep)
+    urls = [
+        ("GG", f"https://laws.example.invalid/gg/art_{index}.html")
+        for index in range(1, 6)
+    ]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        number = request.url.path.rsplit("_", 1)[1].removesuffix(".html")
+        if number == "2":
+            return httpx.Response(404)
+        body = _PAGE.format(norm=f"Art {number}")
+        return httpx.Response(200, content=body.encode("iso-8859-1"))
+
+    real_client = httpx.AsyncClient
+    created_clients: list[httpx.AsyncClient] = []
+
+    def make_client(**kwargs: object) -> httpx.AsyncClient:
+        assert kwargs["http2"] is True
+        client = real_client(transport=httpx.MockTransport(handle))
+        created_clients.append(client)
+        return client
+
+    monkeypatch.setattr(german_law_html.httpx, "AsyncClient", make_client)
+
+    documents = await GermanLawBulkHTMLLoader(urls, max_workers=3).aload()
+
+    assert len(created_clients) == 1
+    assert created_clients[0].is_closed
+    assert [
+        doc.metadata["norm_id"] for doc in documents if doc.metadata["level"] == "norm"
+    ] == ["Art 1", "Art 3", "Art 4", "Art 5"]
+    assert 1 < max_in_flight <= 3
+    assert "Error loading https://laws.example.invalid/gg/art_2.html" in caplog.text
+
+
+def test_loader_skips_paragraph_documents_for_short_norms() -> None:
+    url = "https://laws.example.invalid/gg/art_1.html"
+    html_content = _PAGE.format(norm="Art 1")
+    full_text_length = len("(1) Erster Absatz.\n\n(2) Zweiter Absatz.")
+
+    default_documents = GermanLawHTMLLoader(url, "GG").load_from_html(html_content)
+    short_documents = GermanLawHTMLLoader(
+        url, "GG", min_split_chars=full_text_length + 1
+    ).load_from_html(html_content)
+    split_documents = GermanLawHTMLLoader(
+        url, "GG", min_split_chars=full_text_length
+    ).load_from_html(html_content)
+
+    assert len(default_documents) == 3
+    assert [doc.metadata["level"] for doc in short_documents] == ["norm"]
+    assert short_documents[0].metadata["paragraph_count"] == 2
+    assert len(split_documents) == 3
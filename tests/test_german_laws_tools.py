@@ -3,6 +3,7 @@
 These tests focus on tool behavior (input validation, error handling, and
 return shape) while mocking heavy/external dependencies:
 - Ingestion pipeline functions (`app.ingestion.pipeline.search_laws`,
+  `app.ingestion.pipeline.search_laws_batch`,
   `app.ingestion.pipeline.ingest_german_laws`)
 - Embedding store (`app.ingestion.embeddings.GermanLawEmbeddingStore`)
 - Settings (`app.config.get_settings`)
@@ -33,6 +34,7 @@ from app.tools.german_laws import (
     create_get_law_stats,
     create_ingest_german_laws,
     create_search_laws,
+    create_search_laws_batch,
 )
 
 if TYPE_CHECKING:
@@ -280,6 +282,81 @@ async def test_create_search_laws_handles_pipeline_exception(
     assert "boom" in inner_value["message"]
 
 
+@pytest.mark.asyncio
+async def test_create_search_laws_batch_returns_one_entry_per_search(
+    monkeypatch: pytest.MonkeyPatch, cache: RefCache
+) -> None:
+    """search_laws_batch forwards validated searches and keeps input order."""
+    captured: list[list[dict[str, Any]]] = []
+
+    def fake_search_laws_batch_impl(
+        searches: list[dict[str, Any]],
+    ) -> list[list[dict[str, Any]]]:
+        captured.append(searches)
+        return [
+            [{"doc_id": f"doc_{index}", "content": search["query"]}]
+            for index, search in enumerate(searches)
+        ]
+
+    monkeypatch.setattr(
+        "app.ingestion.pipeline.search_laws_batch",
+        fake_search_laws_batch_impl,
+        raising=True,
+    )
+
+    tool_function = create_search_laws_batch(cache)
+    tool_callable = _unwrap_tool_function(tool_function)
+    result = await tool_callable(
+        searches=[
+            {"query": "Kaufvertrag Pflichten", "n_results": 5},
+            {"query": "Kündigung Mietvertrag", "law_abbrev": "BGB", "level": "norm"},
+        ]
+    )
+
+    inner_value = _extract_cached_value(result)
+    assert inner_value is not None
+    assert inner_value["count"] == 2
+    assert [entry["query"] for entry in inner_value["searches"]] == [
+        "Kaufvertrag Pflichten",
+        "Kündigung Mietvertrag",
+    ]
+    assert inner_value["searches"][1]["filters"] == {
+        "law_abbrev": "BGB",
+        "level": "norm",
+    }
+    assert inner_value["searches"][1]["results"][0]["doc_id"] == "doc_1"
+    assert captured == [
+        [
+            {
+                "query": "Kaufvertrag Pflichten",
+                "n_results": 5,
+                "law_abbrev": None,
+                "level": None,
+            },
+            {
+                "query": "Kündigung Mietvertrag",
+                "n_results": 10,
+                "law_abbrev": "BGB",
+                "level": "norm",
+            },
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_search_laws_batch_validation_error(
+    cache: RefCache,
+) -> None:
+    """search_laws_batch rejects invalid entries with ValidationError."""
+    tool_function = create_search_laws_batch(cache)
+    tool_callable = _unwrap_tool_function(tool_function)
+
+    with pytest.raises(ValidationError) as exc_info:
+        await tool_callable(searches=[{"query": "a"}])  # too short (min_length=2)
+
+    assert "query" in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_create_ingest_german_laws_success(
     monkeypatch: pytest.MonkeyPatch, cache: RefCache
@@ -0,0 +1,242 @@
+"""Unit tests for the on-disk HTTP page cache.
+
+These tests validate:
+- Stored pages round-trip with their ETag/Last-Modified validators
+- Validators are read from response headers case-insensitively
+- Freshness follows the TTL and `touch` refreshes it
+- Missing or foreign entries are treated as cache misses
+- `fetch_cached` serves fresh pages from disk and reuses stale ones on 304
+- `decode_content` undoes gzip/deflate content encoding for urllib responses
+- `fetch_cached_async` shares the cache semantics over an `httpx.AsyncClient`
+
+Design notes:
+- Uses `tmp_path` and an injected fake clock so no real time passes.
+- `urlopen` is monkeypatched (or an `httpx.MockTransport` client is passed) for
+  `fetch_cached`; no network access.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import zlib
+from email.message import Message
+from typing import TYPE_CHECKING, Any
+from urllib.error import HTTPError
+
+import httpx
+from legal_mcp.net import http_cache
+from legal_mcp.net.http_cache import (
+    DiskHttpCache,
+    decode_content,
+    fetch_cached,
+    fetch_cached_async,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from urllib.request import Request
+
+    import pytest
+
+_URL = "https://www.gesetze-im-internet.de/Teilliste_B.html"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_put_then_get_round_trips_body_and_validators(tmp_path: Path) -> None:
+    cache = DiskHttpCache(tmp_path / "cache", clock=_FakeClock())
+
+    cache.put(
+        _URL,
+        b"<html>B</html>",
+        {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    page = cache.get(_URL)
+
+    assert page is not None
+    assert page.body == b"<html>B</html>"
+    assert page.revalidation_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def test_put_reads_validators_case_insensitively(tmp_path: Path) -> None:
+    cache = DiskHttpCache(tmp_path, clock=_FakeClock())
+    httpx_headers = httpx.Headers(
+        {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    )
+    urllib_headers = Message()
+    urllib_headers["Etag"] = '"def"'
+    urllib_headers["last-modified"] = "Thu, 02 Jan 2025 00:00:00 GMT"
+
+    lowered = cache.put(_URL, b"a", dict(httpx_headers))
+    mixed = cache.put(_URL + "?v=2", b"b", urllib_headers)
+
+    assert (lowered.etag, lowered.last_modified) == (
+        '"abc"',
+        "Wed, 01 Jan 2025 00:00:00 GMT",
+    )
+    assert (mixed.etag, mixed.last_modified) == (
+        '"def"',
+        "Thu, 02 Jan 2025 00:00:00 GMT",
+    )
+
+
+def test_entries_go_stale_after_ttl_and_touch_refreshes(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60.0, clock=clock)
+    page = cache.put(_URL, b"body", {})
+
+    assert cache.is_fresh(page)
+    clock.now += 61.0
+    assert not cache.is_fresh(page)
+
+    refreshed = cache.touch(page)
+    assert cache.is_fresh(refreshed)
+    stored = cache.get(_URL)
+    assert stored is not None
+    assert cache.is_fresh(stored)
+    assert stored.revalidation_headers() == {}
+
+
+def test_get_returns_none_for_missing_entries(tmp_path: Path) -> None:
+    cache = DiskHttpCache(tmp_path / "does-not-exist")
+
+    assert cache.get(_URL) is None
+
+
+class _FakeResponse(io.BytesIO):
+    def __init__(self, body: bytes, headers: dict[str, str]) -> None:
+        super().__init__(body)
+        self.headers = headers
+
+
+class _FakeUrlopen:
+    def __init__(self, *, not_modified: bool = False, gzipped: bool = False) -> None:
+        self.not_modified = not_modified
+        self.gzipped = gzipped
+        self.requests: list[Request] = []
+
+    def __call__(self, request: Request, timeout: float) -> Any:
+        self.requests.append(request)
+        if self.not_modified:
+            raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+        if self.gzipped:
+            return _FakeResponse(
+                gzip.compress(b"<html>B</html>"), {"Content-Encoding": "gzip"}
+            )
+        return _FakeResponse(b"<html>B</html>", {"ETag": '"abc"'})
+
+
+def test_fetch_cached_downloads_once_while_fresh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_urlopen = _FakeUrlopen()
+    monkeypatch.setattr(http_cache, "urlopen", fake_urlopen)
+    cache = DiskHttpCache(tmp_path, clock=_FakeClock())
+
+    first = fetch_cached(_URL, cache, headers={"User-Agent": "test"})
+    second = fetch_cached(_URL, cache)
+
+    assert first == second == b"<html>B</html>"
+    assert len(fake_urlopen.requests) == 1
+    assert fake_urlopen.requests[0].get_header("User-agent") == "test"
+
+
+def test_fetch_cached_revalidates_stale_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = _FakeClock()
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60.0, clock=clock)
+    cache.put(_URL, b"cached body", {"ETag": '"abc"'})
+    clock.now += 61.0
+    fake_urlopen = _FakeUrlopen(not_modified=True)
+    monkeypatch.setattr(http_cache, "urlopen", fake_urlopen)
+
+    body = fetch_cached(_URL, cache)
+
+    assert body == b"cached body"
+    assert fake_urlopen.requests[0].get_header("If-none-match") == '"abc"'
+    stored = cache.get(_URL)
+    assert stored is not None
+    assert cache.is_fresh(stored)
+
+
+def test_fetch_cached_uses_shared_client_and_revalidates(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60.0, clock=clock)
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"abc"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<html>B</html>", headers={"ETag": '"abc"'})
+
+    with httpx.Client(transport=httpx.MockTransport(handle)) as client:
+        first = fetch_cached(_URL, cache, client=client)
+        fetch_cached(_URL, cache, client=client)
+        clock.now += 61.0
+        revalidated = fetch_cached(_URL, cache, client=client)
+
+    assert first == revalidated == b"<html>B</html>"
+    assert len(requests) == 2
+
+
+def test_decode_content_handles_gzip_deflate_and_identity() -> None:
+    body = "<h1>Gesetz über</h1>".encode("iso-8859-1")
+    raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+    assert decode_content(gzip.compress(body), "gzip") == body
+    assert decode_content(zlib.compress(body), "deflate") == body
+    assert (
+        decode_content(raw_deflate.compress(body) + raw_deflate.flush(), "deflate")
+        == body
+    )
+    assert decode_content(body, None) == body
+    assert decode_content(body, "identity") == body
+
+
+def test_fetch_cached_requests_and_decodes_gzip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_urlopen = _FakeUrlopen(gzipped=True)
+    monkeypatch.setattr(http_cache, "urlopen", fake_urlopen)
+    cache = DiskHttpCache(tmp_path, clock=_FakeClock())
+
+    body = fetch_cached(_URL, cache)
+
+    assert body == b"<html>B</html>"
+    assert "gzip" in fake_urlopen.requests[0].get_header("Accept-encoding")
+    stored = cache.get(_URL)
+    assert stored is not None
+    assert stored.body == b"<html>B</html>"
+
+
+async def test_fetch_cached_async_serves_fresh_and_revalidates(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    cache = DiskHttpCache(tmp_path, ttl_seconds=60.0, clock=clock)
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"abc"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<html>B</html>", headers={"ETag": '"abc"'})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+        first = await fetch_cached_async(_URL, cache, client)
+        await fetch_cached_async(_URL, cache, client)
+        clock.now += 61.0
+        revalidated = await fetch_cached_async(_URL, cache, client)
+
+    assert first == revalidated == b"<html>B</html>"
+    assert len(requests) == 2
@@ -23,6 +23,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
+
 from app.ingestion import pipeline as pipeline_module
 
 if TYPE_CHECKING:
@@ -89,14 +91,26 @@ class _FakeDiscovery:
         return list(self._norms_by_law_abbrev.get(law.abbreviation, []))
 
 
+@dataclass(frozen=True)
+class _FakeHit:
+    """Shaped like the `SearchResult` objects `pipeline.search_laws` expects."""
+
+    doc_id: str
+    content: str
+    similarity: float
+    metadata: dict[str, Any]
+
+
 class _FakeEmbeddingStore:
     """Deterministic fake for `GermanLawEmbeddingStore`."""
 
     init_calls: ClassVar[list[dict[str, Any]]] = []
     add_documents_calls: ClassVar[list[list[Any]]] = []
-    search_calls: ClassVar[list[dict[str, Any]]] = []
+    embed_calls: ClassVar[list[list[str]]] = []
+    search_embeddings_calls: ClassVar[list[dict[str, Any]]] = []
 
     def __init__(self, model_name: str, persist_path: Path) -> None:
+        self.model_name = model_name
         type(self).init_calls.append(
             {"model_name": model_name, "persist_path": persist_path}
         )
@@ -106,28 +120,21 @@ class _FakeEmbeddingStore:
         type(self).add_documents_calls.append(list(documents))
         return len(documents)
 
-    def search(
-        self, query: str, n_results: int, where: dict[str, Any] | None
-    ) -> list[Any]:
-        type(self).search_calls.append(
-            {"query": query, "n_results": n_results, "where": where}
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        type(self).embed_calls.append(list(queries))
+        # Query texts stand in for embedding rows (same fancy indexing).
+        return np.array(queries)
+
+    def search_embeddings(
+        self, query_embeddings: np.ndarray, n_results: int, where: dict[str, Any] | None
+    ) -> list[list[Any]]:
+        queries = query_embeddings.tolist()
+        type(self).search_embeddings_calls.append(
+            {"queries": queries, "n_results": n_results, "where": where}
         )
-
-        # Return objects shaped like what `pipeline.search_laws` expects.
-        @dataclass(frozen=True)
-        class _Hit:
-            doc_id: str
-            content: str
-            similarity: float
-            metadata: dict[str, Any]
-
         return [
-            _Hit(
-                doc_id="doc_1",
-                content="Lorem ipsum dolor sit amet",
-                similarity=0.12345,
-                metadata={"law_abbrev": "BGB", "norm_id": "§ 433", "level": "norm"},
-            )
+            [_FakeHit(doc_id=query, content=query, similarity=0.5, metadata={})]
+            for query in queries
         ]
 
 
@@ -159,7 +166,9 @@ def _patch_settings(monkeypatch: pytest.MonkeyPatch) -> None:
 def _patch_embedding_store(monkeypatch: pytest.MonkeyPatch) -> None:
     _FakeEmbeddingStore.init_calls = []
     _FakeEmbeddingStore.add_documents_calls = []
-    _FakeEmbeddingStore.search_calls = []
+    _FakeEmbeddingStore.embed_calls = []
+    _FakeEmbeddingStore.search_embeddings_calls = []
+    monkeypatch.setattr(pipeline_module, "_query_embeddings", {}, raising=True)
 
     monkeypatch.setattr(
         pipeline_module,
@@ -183,7 +192,7 @@ def test_search_laws_builds_where_filter_for_abbrev_only(
         persist_path="/tmp/ignored",
     )
 
-    assert _FakeEmbeddingStore.search_calls[-1]["where"] == {
+    assert _FakeEmbeddingStore.search_embeddings_calls[-1]["where"] == {
         "law_abbrev": {"$eq": "BGB"}
     }
 
@@ -202,7 +211,9 @@ def test_search_laws_builds_where_filter_for_level_only(
         persist_path="/tmp/ignored",
     )
 
-    assert _FakeEmbeddingStore.search_calls[-1]["where"] == {"level": {"$eq": "norm"}}
+    assert _FakeEmbeddingStore.search_embeddings_calls[-1]["where"] == {
+        "level": {"$eq": "norm"}
+    }
 
 
 def test_search_laws_builds_where_filter_for_abbrev_and_level(
@@ -219,7 +230,7 @@ def test_search_laws_builds_where_filter_for_abbrev_and_level(
         persist_path="/tmp/ignored",
     )
 
-    assert _FakeEmbeddingStore.search_calls[-1]["where"] == {
+    assert _FakeEmbeddingStore.search_embeddings_calls[-1]["where"] == {
         "$and": [
             {"law_abbrev": {"$eq": "bgb"}},
             {"level": {"$eq": "paragraph"}},
@@ -241,7 +252,77 @@ def test_search_laws_builds_where_filter_none_when_no_filters(
         persist_path="/tmp/ignored",
     )
 
-    assert _FakeEmbeddingStore.search_calls[-1]["where"] is None
+    assert _FakeEmbeddingStore.search_embeddings_calls[-1]["where"] is None
+
+
+def test_search_laws_reuses_query_embedding_across_filters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_settings(monkeypatch)
+    _patch_embedding_store(monkeypatch)
+
+    for law_abbrev, level in [(None, None), ("BGB", None), ("BGB", "norm")]:
+        _ = pipeline_module.search_laws(
+            query="kaufvertrag",
+            law_abbrev=law_abbrev,
+            level=level,
+            persist_path="/tmp/ignored",
+        )
+    _ = pipeline_module.search_laws(query="miete", persist_path="/tmp/ignored")
+
+    assert _FakeEmbeddingStore.embed_calls == [["kaufvertrag"], ["miete"]]
+    assert len(_FakeEmbeddingStore.search_embeddings_calls) == 4
+
+
+def test_search_laws_evicts_least_recently_used_query_embedding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_settings(monkeypatch)
+    _patch_embedding_store(monkeypatch)
+    monkeypatch.setattr(pipeline_module, "QUERY_EMBEDDING_CACHE_SIZE", 2)
+
+    for query in ["kauf", "miete", "kauf", "pacht", "kauf", "miete"]:
+        _ = pipeline_module.search_laws(query=query, persist_path="/tmp/ignored")
+
+    assert _FakeEmbeddingStore.embed_calls == [
+        ["kauf"],
+        ["miete"],
+        ["pacht"],
+        ["miete"],
+    ]
+
+
+def test_search_laws_batch_embeds_once_and_queries_per_filter_group(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_settings(monkeypatch)
+    _patch_embedding_store(monkeypatch)
+
+    batches = pipeline_module.search_laws_batch(
+        [
+            {"query": "kaufvertrag", "n_results": 5},
+            {"query": "kündigung", "n_results": 5, "law_abbrev": "BGB"},
+            {"query": "grundrechte", "n_results": 5},
+        ],
+        persist_path="/tmp/ignored",
+    )
+
+    assert _FakeEmbeddingStore.embed_calls == [
+        ["kaufvertrag", "kündigung", "grundrechte"]
+    ]
+    assert _FakeEmbeddingStore.search_embeddings_calls == [
+        {"queries": ["kaufvertrag", "grundrechte"], "n_results": 5, "where": None},
+        {
+            "queries": ["kündigung"],
+            "n_results": 5,
+            "where": {"law_abbrev": {"$eq": "BGB"}},
+        },
+    ]
+    assert [[hit["doc_id"] for hit in hits] for hits in batches] == [
+        ["kaufvertrag"],
+        ["kündigung"],
+        ["grundrechte"],
+    ]
 
 
 def test_load_norm_documents_sleeps_when_delay_positive_and_uses_loader(
@@ -256,7 +337,7 @@ def test_load_norm_documents_sleeps_when_delay_positive_and_uses_loader(
 
     # Patch GermanLawHTMLLoader lazy import target.
     class _FakeLoader:
-        def __init__(self, url: str, law_abbrev: str) -> None:
+        def __init__(self, url: str, law_abbrev: str, client: Any = None) -> None:
             self.url = url
             self.law_abbrev = law_abbrev
 
@@ -305,7 +386,7 @@ def test_ingest_german_laws_happy_path_batches_and_counts(
 
     # Patch norm loader to return one fake document per norm.
     def fake_load_norm_documents(
-        law_abbrev: str, norm_url: str, delay: float = 0.0
+        law_abbrev: str, norm_url: str, delay: float = 0.0, client: Any = None
     ) -> list[_FakeDocument]:
         return [
             _FakeDocument(
@@ -350,6 +431,66 @@ def test_ingest_german_laws_happy_path_batches_and_counts(
     assert progress_updates[-1]["total_laws"] == 1
 
 
+def _collect_norm_fetch_clients(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    """Run a two-norm ingestion and return the client passed to each load."""
+    _patch_settings(monkeypatch)
+    _patch_embedding_store(monkeypatch)
+
+    laws = [
+        _FakeLawInfo(abbreviation="BGB", title="BGB", url="https://example.invalid/bgb")
+    ]
+    norms_by_law = {
+        "BGB": [
+            _FakeNormInfo(url="https://example.invalid/bgb/1"),
+            _FakeNormInfo(url="https://example.invalid/bgb/2"),
+        ]
+    }
+    _patch_discovery_class(
+        monkeypatch, _FakeDiscovery(laws=laws, norms_by_law_abbrev=norms_by_law)
+    )
+
+    clients: list[Any] = []
+
+    def fake_load_norm_documents(
+        law_abbrev: str, norm_url: str, delay: float = 0.0, client: Any = None
+    ) -> list[_FakeDocument]:
+        clients.append(client)
+        return [_FakeDocument(page_content=norm_url, metadata={})]
+
+    monkeypatch.setattr(
+        pipeline_module,
+        "_load_norm_documents",
+        fake_load_norm_documents,
+        raising=True,
+    )
+
+    pipeline_module.ingest_german_laws(
+        max_laws=1, persist_path="/tmp/ignored", max_workers=2
+    )
+    return clients
+
+
+def test_ingest_german_laws_shares_one_fetch_client_across_norms(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("USE_TOR", raising=False)
+
+    clients = _collect_norm_fetch_clients(monkeypatch)
+
+    assert len(clients) == 2
+    assert clients[0] is not None
+    assert clients[0] is clients[1]
+
+
+def test_ingest_german_laws_leaves_fetching_to_loaders_under_tor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("USE_TOR", "true")
+
+    # Loaders keep routing through their own Tor opener
+    assert _collect_norm_fetch_clients(monkeypatch) == [None, None]
+
+
 def test_ingest_german_laws_records_discovery_errors_and_continues(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -373,7 +514,7 @@ def test_ingest_german_laws_records_discovery_errors_and_continues(
     monkeypatch.setattr(
         pipeline_module,
         "_load_norm_documents",
-        lambda law_abbrev, norm_url, delay=0.0: [
+        lambda law_abbrev, norm_url, delay=0.0, client=None: [
             _FakeDocument(page_content="x", metadata={"law_abbrev": law_abbrev})
         ],
         raising=True,
@@ -440,7 +581,7 @@ def test_ingest_single_law_happy_path_batches_and_counts(
 
     # Patch norm loader to return one fake document per norm.
     def fake_load_norm_documents(
-        law_abbrev: str, norm_url: str, delay: float = 0.0
+        law_abbrev: str, norm_url: str, delay: float = 0.0, client: Any = None
     ) -> list[_FakeDocument]:
         return [
             _FakeDocument(
@@ -511,7 +652,7 @@ def test_ingest_single_law_records_loader_errors_and_continues(
     )
 
     def fake_load_norm_documents(
-        law_abbrev: str, norm_url: str, delay: float = 0.0
+        law_abbrev: str, norm_url: str, delay: float = 0.0, client: Any = None
     ) -> list[_FakeDocument]:
         if norm_url.endswith("/bad"):
             raise RuntimeError("load failed")
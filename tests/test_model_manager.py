@@ -13,6 +13,7 @@ inside `app.ingestion.model_manager` to keep tests deterministic and fast.
 
 from __future__ import annotations
 
+import contextlib
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -25,7 +26,8 @@ if TYPE_CHECKING:
 @dataclass(frozen=True)
 class _FakeSettings:
     embedding_model: str = "fake-model"
-    # model_manager only uses embedding_model today (but keep room for extension)
+    embedding_int8_cpu: bool = False
+    embedding_compile: bool = False
 
 
 class _FakeCudaProperties:
@@ -35,9 +37,15 @@ class _FakeCudaProperties:
 
 class _FakeCuda:
     def __init__(
-        self, *, available: bool, total_memory_gb: float, allocated_bytes: int
+        self,
+        *,
+        available: bool,
+        total_memory_gb: float,
+        allocated_bytes: int,
+        bf16_supported: bool = True,
     ):
         self._available = available
+        self._bf16_supported = bf16_supported
         self._allocated_bytes = allocated_bytes
         self._total_memory_bytes = int(total_memory_gb * (1024**3))
         self.empty_cache_calls: int = 0
@@ -46,6 +54,9 @@ class _FakeCuda:
     def is_available(self) -> bool:
         return self._available
 
+    def is_bf16_supported(self) -> bool:
+        return self._bf16_supported
+
     def get_device_properties(self, index: int) -> _FakeCudaProperties:
         assert index == 0
         return _FakeCudaProperties(total_memory_bytes=self._total_memory_bytes)
@@ -80,8 +91,9 @@ class _FakeTorchBackends:
 
 
 class _FakeParameter:
-    def __init__(self, device: str) -> None:
+    def __init__(self, device: str, dtype: str) -> None:
         self.device = device
+        self.dtype = dtype
 
 
 class _FakeSentenceTransformerModel:
@@ -92,20 +104,25 @@ class _FakeSentenceTransformerModel:
         self.init_kwargs = init_kwargs or {}
         self.max_seq_length: int = 0
         self._device: str = "cpu"
+        self._dtype: str = "float32"
         self._eval_calls: int = 0
         self.encode_calls: list[dict[str, Any]] = []
 
-    def to(self, device: str) -> _FakeSentenceTransformerModel:
+    def to(
+        self, device: str, dtype: str | None = None
+    ) -> _FakeSentenceTransformerModel:
         self._device = device
+        if dtype is not None:
+            self._dtype = dtype
         return self
 
     def eval(self) -> None:
         self._eval_calls += 1
 
     def parameters(self) -> Any:
-        # The production code calls `next(model.parameters()).device`, so this must
+        # The production code calls `next(model.parameters())`, so this must
         # return an iterator, not a list.
-        yield _FakeParameter(device=self._device)
+        yield _FakeParameter(device=self._device, dtype=self._dtype)
 
     def get_sentence_embedding_dimension(self) -> int:
         return 3
@@ -162,6 +179,7 @@ def _patch_model_manager_dependencies(
     cuda_available: bool,
     total_gpu_memory_gb: float = 12.0,
     allocated_gpu_bytes: int = 0,
+    bf16_supported: bool = True,
     sentence_transformer_factory: _FakeSentenceTransformerFactory | None = None,
     settings: _FakeSettings | None = None,
 ) -> dict[str, Any]:
@@ -181,6 +199,7 @@ def _patch_model_manager_dependencies(
         available=cuda_available,
         total_memory_gb=total_gpu_memory_gb,
         allocated_bytes=allocated_gpu_bytes,
+        bf16_supported=bf16_supported,
     )
 
     # Patch torch module used by model_manager.
@@ -190,6 +209,10 @@ def _patch_model_manager_dependencies(
         {
             "cuda": fake_cuda,
             "backends": _FakeTorchBackends(),
+            "float32": "float32",
+            "float16": "float16",
+            "bfloat16": "bfloat16",
+            "inference_mode": staticmethod(contextlib.nullcontext),
         },
     )()
     monkeypatch.setattr(model_manager_module, "torch", fake_torch, raising=True)
@@ -281,6 +304,42 @@ def test_select_device_falls_back_to_cpu_when_memory_insufficient(
     assert manager.device == "cpu"
 
 
+def test_select_dtype_uses_float32_on_cpu(monkeypatch: pytest.MonkeyPatch) -> None:
+    patched = _patch_model_manager_dependencies(monkeypatch, cuda_available=False)
+    model_manager_module = patched["module"]
+
+    manager = model_manager_module.get_embedding_model()
+    model = manager.get_model()
+
+    assert manager.dtype == "float32"
+    assert next(model.parameters()).dtype == "float32"
+
+
+def test_select_dtype_prefers_bfloat16_on_cuda(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    patched = _patch_model_manager_dependencies(monkeypatch, cuda_available=True)
+    model_manager_module = patched["module"]
+
+    manager = model_manager_module.get_embedding_model()
+    model = manager.get_model()
+
+    assert manager.dtype == "bfloat16"
+    assert next(model.parameters()).dtype == "bfloat16"
+
+
+def test_select_dtype_uses_float16_on_cuda_without_bf16(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    patched = _patch_model_manager_dependencies(
+        monkeypatch, cuda_available=True, bf16_supported=False
+    )
+    model_manager_module = patched["module"]
+
+    manager = model_manager_module.get_embedding_model()
+    assert manager.dtype == "float16"
+
+
 def test_load_model_passes_trust_remote_code_for_jina_models(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -426,3 +485,4 @@ def test_load_model_cpu_fallback_when_cuda_load_fails(
     model = manager.get_model()
     assert model is not None
     assert manager.device == "cpu"
+    assert manager.dtype == "float32"
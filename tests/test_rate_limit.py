@@ -0,0 +1,119 @@
+"""Unit tests for the token-bucket rate limiter.
+
+These tests validate:
+- Burst capacity is served without waiting
+- Exhausted buckets hand out staggered waits instead of serializing callers
+- Refill over time restores tokens (capped at capacity)
+- Per-host isolation in `HostRateLimiter`
+- AIMD: throttling halves the rate, runs of successes double it back
+
+Design notes:
+- Uses an injected fake clock and sleep so no real time passes.
+"""
+
+from __future__ import annotations
+
+import pytest
+from legal_mcp.net.rate_limit import HostRateLimiter, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+
+def test_token_bucket_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError, match="rate_per_second"):
+        TokenBucket(rate_per_second=0)
+    with pytest.raises(ValueError, match="capacity"):
+        TokenBucket(rate_per_second=1.0, capacity=0.5)
+    with pytest.raises(ValueError, match="recovery_successes"):
+        TokenBucket(rate_per_second=1.0, recovery_successes=0)
+
+
+def test_token_bucket_serves_burst_then_staggers_reservations() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate_per_second=10.0, capacity=2, clock=clock)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    # Two burst tokens, then each further caller waits one more interval.
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1)
+    assert waits[3] == pytest.approx(0.2)
+
+
+def test_token_bucket_refills_over_time_up_to_capacity() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate_per_second=2.0, capacity=1, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    clock.now += 10.0  # Far more than needed to refill; capped at capacity.
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_acquire_sleeps_only_when_needed() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(
+        rate_per_second=4.0, capacity=1, clock=clock, sleep=clock.sleep
+    )
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_host_rate_limiter_isolates_hosts() -> None:
+    clock = _FakeClock()
+    limiter = HostRateLimiter(rate_per_second=1.0, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire("https://www.gesetze-im-internet.de/bgb/__1.html")
+    limiter.acquire("https://gesetze.berlin.de/bsbe/document/1")
+    assert clock.sleeps == []
+
+    limiter.acquire("https://WWW.gesetze-im-internet.de/bgb/__2.html")
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert limiter.bucket_for("https://www.gesetze-im-internet.de/") is (
+        limiter.bucket_for("https://www.gesetze-im-internet.de/gg/")
+    )
+
+
+def test_token_bucket_halves_rate_on_throttle_down_to_floor() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate_per_second=8.0, min_rate_per_second=3.0, clock=clock)
+
+    bucket.record_status(429)
+    assert bucket.rate_per_second == 4.0
+    bucket.record_status(503)
+    assert bucket.rate_per_second == 3.0
+
+    # Reservations are paced at the lowered rate.
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1 / 3.0)
+
+
+def test_token_bucket_recovers_rate_after_successes() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate_per_second=8.0, recovery_successes=2, clock=clock)
+    bucket.record_throttled()
+    bucket.record_throttled()
+    assert bucket.rate_per_second == 2.0
+
+    bucket.record_status(200)
+    bucket.record_status(404)  # Neither success nor throttling.
+    assert bucket.rate_per_second == 2.0
+    bucket.record_status(304)
+    assert bucket.rate_per_second == 4.0
+
+    for _ in range(6):
+        bucket.record_success()
+    assert bucket.rate_per_second == 8.0  # Capped at the configured rate.
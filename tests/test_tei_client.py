@@ -14,6 +14,7 @@ Focus areas:
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -258,6 +259,26 @@ def test_encode_normalizes_string_and_returns_numpy(
     assert np.allclose(result[0], np.array([1.0, 2.0, 3.0], dtype=np.float32))
 
 
+def test_encode_preserves_input_order_across_concurrent_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    routes_by_base_url: dict[str, dict[str, Any]] = {"http://tei-1": {}}
+    _install_fake_httpx_clients(monkeypatch, routes_by_base_url=routes_by_base_url)
+    client = tei_client_module.TEIEmbeddingClient(base_urls=["http://tei-1"])
+
+    def fake_embed_batch(texts: list[str]) -> list[list[float]]:
+        # Earlier batches finish last, so completion order != submission order.
+        first_index = int(texts[0])
+        time.sleep(0.01 * (10 - first_index))
+        return [[float(text)] for text in texts]
+
+    monkeypatch.setattr(client, "_embed_batch", fake_embed_batch)
+
+    result = client.encode([str(index) for index in range(8)], batch_size=2)
+
+    assert result[:, 0].tolist() == [float(index) for index in range(8)]
+
+
 def test_encode_empty_list_returns_empty_array(monkeypatch: pytest.MonkeyPatch) -> None:
     routes_by_base_url: dict[str, dict[str, Any]] = {"http://tei-1": {}}
     _install_fake_httpx_clients(monkeypatch, routes_by_base_url=routes_by_base_url)